@@ -2,8 +2,10 @@
 from .plans import router as plans_router
 from .get_plans import router as get_plans_router
 from .get_communities import router as get_communities_router
+from .stats import router as stats_router
 __all__ = [
     "plans_router",
     "get_plans_router",
     "get_communities_router",
+    "stats_router",
 ]
\ No newline at end of file
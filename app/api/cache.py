@@ -0,0 +1,141 @@
+"""
+Response cache for read endpoints.
+Plan data only changes when an ingest bumps the data generation, so a read
+endpoint's serialized body is cached under (path, query, generation) in a
+size-bounded LRU. gzip/brotli variants are compressed on first request and
+stored in the same entry. The ETag is derived from the key and the encoding, so
+a client revalidating with If-None-Match gets a 304 without the endpoint
+touching its tables.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from fastapi import Request, Response
+from fastapi.concurrency import run_in_threadpool
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core import config
+from app.core.compression import MIN_COMPRESS_SIZE, accepted_encodings, compress
+from app.services.generation import current_generation_async
+
+# Response headers worth keeping with a cached body (pagination metadata)
+_KEPT_HEADERS = ("x-next-cursor", "x-total-count")
+
+IDENTITY = "identity"
+
+
+class Entry:
+    """One cached response: its body per content encoding plus the kept headers."""
+
+    __slots__ = ("bodies", "headers")
+
+    def __init__(self, body: bytes, headers: Dict[str, str]):
+        self.bodies = {IDENTITY: body}
+        self.headers = headers
+
+    @property
+    def size(self) -> int:
+        return sum(len(body) for body in self.bodies.values())
+
+
+class ResponseCache:
+    """LRU of serialized bodies bounded by their total size in bytes."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries: "OrderedDict[tuple, Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: tuple, entry: Entry) -> None:
+        if entry.size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= old.size
+            self._entries[key] = entry
+            self.size += entry.size
+            self._evict()
+
+    def add_variant(self, key: tuple, entry: Entry, encoding: str, body: bytes) -> None:
+        """Store a compressed body with entry, if entry is still the one cached under key."""
+        with self._lock:
+            if self._entries.get(key) is not entry or encoding in entry.bodies:
+                return
+            entry.bodies[encoding] = body
+            self.size += len(body)
+            self._evict()
+
+    def _evict(self) -> None:
+        while self.size > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+
+response_cache = ResponseCache(config.RESPONSE_CACHE_MAX_BYTES)
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in [tag.strip() for tag in header.split(",")]
+
+
+async def cached_json(request: Request, db: AsyncSession, build: Callable[[Response], Awaitable[Any]],
+                      adapter: Optional[TypeAdapter] = None, ttl: Optional[int] = None) -> Response:
+    """
+    Serve the result of await build(response), serialized with adapter, through the
+    cache; without an adapter build returns the JSON bytes itself. build may
+    set pagination headers on the response it gets. ttl
+    (seconds) additionally expires entries whose content depends on the clock
+    (e.g. "changed in the last 24h" flags). The body is sent gzip or brotli
+    compressed when the client accepts it.
+    """
+    generation = await current_generation_async(db)
+    query = "&".join(sorted(request.url.query.split("&"))) if request.url.query else ""
+    key = (request.url.path, query, generation, int(time.time() // ttl) if ttl else 0)
+    encodings = accepted_encodings(request.headers.get("accept-encoding"))
+    encoding = encodings[0] if encodings else IDENTITY
+    # Each encoding is its own representation, so it gets its own ETag
+    digest = hashlib.blake2b(repr(key).encode(), digest_size=12).hexdigest()
+    etag = f'"{digest}"' if encoding == IDENTITY else f'"{digest}-{encoding}"'
+    headers = {"ETag": etag, "Cache-Control": "no-cache", "Vary": "Accept-Encoding"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    entry = response_cache.get(key)
+    if entry is None:
+        scratch = Response()
+        body = await build(scratch)
+        if adapter is not None:
+            body = adapter.dump_json(body)
+        entry = Entry(body, {name: scratch.headers[name] for name in _KEPT_HEADERS if name in scratch.headers})
+        response_cache.put(key, entry)
+    body = entry.bodies[IDENTITY]
+    if encoding != IDENTITY and len(body) >= MIN_COMPRESS_SIZE:
+        compressed = entry.bodies.get(encoding)
+        if compressed is None:
+            compressed = await run_in_threadpool(compress, body, encoding)
+            response_cache.add_variant(key, entry, encoding, compressed)
+        body = compressed
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers={**entry.headers, **headers})
@@ -1,20 +1,14 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from app.db.session import SessionLocal
+from fastapi import APIRouter, Depends, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.cache import cached_json
+from app.db.session import get_async_db
 from app.db.models import CommunityName
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 router = APIRouter()
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
 class CommunityNameOut(BaseModel):
     id: int
     name: str
@@ -22,11 +16,15 @@ class CommunityNameOut(BaseModel):
     now: int
 
 
+COMMUNITY_LIST = TypeAdapter(list[CommunityNameOut])
+
 @router.get("/get_communities", response_model=list[CommunityNameOut])
-def get_communities(db: Session = Depends(get_db)):
+async def get_communities(request: Request, db: AsyncSession = Depends(get_async_db)):
     """Return all rows from the community_names table."""
-    rows = db.query(CommunityName).order_by(CommunityName.name).all()
-    return [
-        CommunityNameOut(id=row.id, name=row.name, plan=row.plan, now=row.now)
-        for row in rows
-    ]
+    async def build(response: Response):
+        rows = (await db.scalars(select(CommunityName).order_by(CommunityName.name))).all()
+        return [
+            CommunityNameOut(id=row.id, name=row.name, plan=row.plan, now=row.now)
+            for row in rows
+        ]
+    return await cached_json(request, db, build, COMMUNITY_LIST)
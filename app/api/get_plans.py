@@ -1,55 +1,83 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from app.db.session import SessionLocal
-from app.db.models import Plan, PriceHistory
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.cache import cached_json
+from app.api.pagination import MAX_PAGE_SIZE, paginate
+from app.api.plans import MAX_RECENT_HOURS, PLAN_CACHE_TTL, PLAN_ORDER, RECENT_HOURS, listed_plans, plans_json
+from app.db.session import get_async_db
+from app.db.models import Plan
 from app.models.plan import PlanWithChangeFlag
-from datetime import datetime, timedelta
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# sort=<name> ascending, sort=-<name> descending
+SORT_COLUMNS = {
+    "price": Plan.price,
+    "sqft": Plan.sqft,
+    "price_per_sqft": Plan.price_per_sqft,
+    "beds": Plan.beds,
+    "baths": Plan.baths,
+}
 
 @router.get("/get_plans", response_model=list[PlanWithChangeFlag])
-def get_plans(
-    community: str | None = None,
-    company: str | None = None,
+async def get_plans(
+    request: Request,
+    community: list[str] | None = Query(None),
+    company: list[str] | None = Query(None),
     type: str | None = None,
-    db: Session = Depends(get_db),
+    min_price: float | None = None,
+    max_price: float | None = None,
+    min_sqft: int | None = None,
+    max_sqft: int | None = None,
+    min_ppsf: float | None = None,
+    max_ppsf: float | None = None,
+    min_beds: float | None = None,
+    min_baths: float | None = None,
+    sort: str | None = None,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    count: bool = False,
+    recent_hours: float = Query(RECENT_HOURS, gt=0, le=MAX_RECENT_HOURS),
+    db: AsyncSession = Depends(get_async_db),
 ):
-    query = db.query(Plan)
+    """
+    Current plans filtered in SQL. community/company may be repeated to match
+    any of several values; ranges are inclusive. Sorting by a column leaves out
+    plans without a value for it. Pages with limit/cursor (see app.api.pagination).
+    price_changed_recently covers the last recent_hours.
+    """
+    query = listed_plans(recent_hours)
 
-    if community is not None:
-        query = query.filter(Plan.community == community)
-    if company is not None:
-        query = query.filter(Plan.company == company)
+    if community:
+        query = query.where(Plan.community.in_(community) if len(community) > 1 else Plan.community == community[0])
+    if company:
+        query = query.where(Plan.company.in_(company) if len(company) > 1 else Plan.company == company[0])
     if type is not None:
-        query = query.filter(Plan.type == type)
+        query = query.where(Plan.type == type)
+    for column, low, high in (
+        (Plan.price, min_price, max_price),
+        (Plan.sqft, min_sqft, max_sqft),
+        (Plan.price_per_sqft, min_ppsf, max_ppsf),
+        (Plan.beds, min_beds, None),
+        (Plan.baths, min_baths, None),
+    ):
+        if low is not None:
+            query = query.where(column >= low)
+        if high is not None:
+            query = query.where(column <= high)
 
-    plans = query.all()
-    since = datetime.utcnow() - timedelta(hours=24)
-    recent_changes = db.query(PriceHistory).filter(PriceHistory.changed_at >= since).all()
-    changed_plan_ids = {ph.plan_id for ph in recent_changes}
-    result = []
-    for plan in plans:
-        # Only include plans with all required fields present (sqft and stories can be None for some scrapers)
-        if not (plan.plan_name is not None and plan.price is not None and plan.company and plan.community):
-            continue
-        result.append(PlanWithChangeFlag(
-            plan_name=plan.plan_name,
-            price=plan.price,
-            sqft=plan.sqft,
-            stories=plan.stories,
-            price_per_sqft=plan.price_per_sqft,
-            last_updated=plan.last_updated,
-            company=plan.company,
-            community=plan.community,
-            type=plan.type,
-            address=plan.address,
-            price_changed_recently=plan.id in changed_plan_ids
-        ))
-    return result 
\ No newline at end of file
+    order = PLAN_ORDER
+    key = lambda plan: (plan.id,)
+    if sort:
+        name = sort.lstrip("-")
+        if name not in SORT_COLUMNS:
+            raise HTTPException(status_code=400, detail=f"sort must be one of: {', '.join(SORT_COLUMNS)} (prefix - for descending)")
+        column = SORT_COLUMNS[name]
+        descending = sort.startswith("-")
+        query = query.where(column.is_not(None))
+        order = [(column, descending), (Plan.id, descending)]
+        key = lambda plan: (getattr(plan, name), plan.id)
+
+    async def build(response: Response):
+        plans = await paginate(db, query, response, order, limit, cursor, count, key=key)
+        return plans_json(plans)
+    return await cached_json(request, db, build, ttl=PLAN_CACHE_TTL)
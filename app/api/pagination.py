@@ -0,0 +1,77 @@
+"""
+Keyset (cursor) pagination for the plan list endpoints.
+Without limit/cursor an endpoint returns every matching row as before. With
+them the body is still a JSON list; the cursor for the next page is sent in the
+X-Next-Cursor header (absent on the last page) and the total number of matching
+rows in X-Total-Count when count=true.
+"""
+
+import base64
+from typing import List, Optional, Sequence, Tuple
+
+import orjson
+from fastapi import HTTPException, Response
+from sqlalchemy import Select, and_, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+MAX_PAGE_SIZE = 1000
+
+# (column expression, descending); the last column must be unique (e.g. Plan.id)
+Order = Sequence[Tuple[object, bool]]
+
+
+def encode_cursor(values: list) -> str:
+    return base64.urlsafe_b64encode(orjson.dumps(values)).decode("ascii").rstrip("=")
+
+
+def _value_types(column) -> Tuple[type, ...]:
+    """JSON value types a cursor may carry for column (floats may arrive as ints)."""
+    python_type = column.type.python_type
+    if python_type is float:
+        return (int, float)
+    return (python_type,)
+
+
+def decode_cursor(cursor: str, order: Order) -> list:
+    """Cursor values for order; anything but one value of each column's type is a 400."""
+    try:
+        values = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != len(order):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    for value, (column, _) in zip(values, order):
+        if isinstance(value, bool) or not isinstance(value, _value_types(column)):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+
+def _after(order: Order, values: list):
+    """Rows strictly after values in the given order: (a, b) > (x, y) spelled out for SQL."""
+    clauses = []
+    for i, (column, descending) in enumerate(order):
+        step = column < values[i] if descending else column > values[i]
+        clauses.append(and_(*[order[j][0] == values[j] for j in range(i)], step))
+    return or_(*clauses)
+
+
+async def paginate(db: AsyncSession, query: Select, response: Response, order: Order, limit: Optional[int],
+                   cursor: Optional[str], count: bool = False, key=None) -> List:
+    """
+    Apply the stable order and, when limit or cursor is given, one keyset page to
+    the select and run it. key(row) returns the row's values for the order columns.
+    """
+    if count:
+        total = await db.scalar(select(func.count()).select_from(query.order_by(None).subquery()))
+        response.headers["X-Total-Count"] = str(total)
+    query = query.order_by(*[column.desc() if descending else column for column, descending in order])
+    if limit is None and cursor is None:
+        return (await db.execute(query)).all()
+    limit = min(limit or MAX_PAGE_SIZE, MAX_PAGE_SIZE)
+    if cursor:
+        query = query.where(_after(order, decode_cursor(cursor, order)))
+    rows = (await db.execute(query.limit(limit + 1))).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers["X-Next-Cursor"] = encode_cursor(list(key(rows[-1])))
+    return rows
@@ -1,41 +1,71 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from app.db.session import SessionLocal
+import orjson
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy import Select, exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.cache import cached_json
+from app.api.pagination import MAX_PAGE_SIZE, paginate
+from app.db.session import get_async_db
 from app.db.models import Plan, PriceHistory
 from app.models.plan import PlanWithChangeFlag
 from datetime import datetime, timedelta
 
 router = APIRouter()
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+# Stable page order, served by the primary key
+PLAN_ORDER = [(Plan.id, False)]
+
+# Columns of PlanWithChangeFlag in schema order (price_changed_recently is added per row)
+PLAN_FIELDS = [name for name in PlanWithChangeFlag.model_fields if name != "price_changed_recently"]
+
+# Default and largest "recent" window for price_changed_recently, in hours
+RECENT_HOURS = 24
+MAX_RECENT_HOURS = 24 * 365
+
+# price_changed_recently depends on the clock, so cached plan lists also expire after this long
+PLAN_CACHE_TTL = 300
+
+def listed_plans(recent_hours: float = RECENT_HOURS) -> Select:
+    """
+    Current plans with all required fields present (sqft and stories can be None
+    for some scrapers), as rows of Plan.id, the PLAN_FIELDS columns and whether
+    the price changed in the last recent_hours (an indexed EXISTS per plan).
+    """
+    since = datetime.utcnow() - timedelta(hours=recent_hours)
+    changed = exists().where(PriceHistory.plan_id == Plan.id, PriceHistory.changed_at >= since).label("price_changed_recently")
+    return select(Plan.id, *[getattr(Plan, name) for name in PLAN_FIELDS], changed).where(
+        Plan.removed_at.is_(None),
+        Plan.plan_name.is_not(None),
+        Plan.price.is_not(None),
+        Plan.company != "",
+        Plan.community != "",
+    )
+
+def plans_json(rows) -> bytes:
+    """
+    Serialize listed_plans rows straight to the PlanWithChangeFlag list JSON,
+    without ORM objects or per-row models.
+    """
+    out = []
+    for row in rows:
+        item = dict(zip(PLAN_FIELDS, row[1:-1]))
+        item["price_changed_recently"] = bool(row[-1])
+        out.append(item)
+    return orjson.dumps(out)
 
 @router.get("/plans", response_model=list[PlanWithChangeFlag])
-def get_plans(db: Session = Depends(get_db)):
-    plans = db.query(Plan).all()
-    since = datetime.utcnow() - timedelta(hours=24)
-    recent_changes = db.query(PriceHistory).filter(PriceHistory.changed_at >= since).all()
-    changed_plan_ids = {ph.plan_id for ph in recent_changes}
-    result = []
-    for plan in plans:
-        # Only include plans with all required fields present (sqft and stories can be None for some scrapers)
-        if not (plan.plan_name is not None and plan.price is not None and plan.company and plan.community):
-            continue
-        result.append(PlanWithChangeFlag(
-            plan_name=plan.plan_name,
-            price=plan.price,
-            sqft=plan.sqft,
-            stories=plan.stories,
-            price_per_sqft=plan.price_per_sqft,
-            last_updated=plan.last_updated,
-            company=plan.company,
-            community=plan.community,
-            type=plan.type,
-            address=plan.address,
-            price_changed_recently=plan.id in changed_plan_ids
-        ))
-    return result 
\ No newline at end of file
+async def get_plans(
+    request: Request,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
+    count: bool = False,
+    recent_hours: float = Query(RECENT_HOURS, gt=0, le=MAX_RECENT_HOURS),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """
+    All current plans, or one keyset page of them with limit/cursor (see
+    app.api.pagination). price_changed_recently covers the last recent_hours.
+    """
+    async def build(response: Response):
+        plans = await paginate(db, listed_plans(recent_hours), response, PLAN_ORDER, limit, cursor, count, key=lambda plan: (plan.id,))
+        return plans_json(plans)
+    return await cached_json(request, db, build, ttl=PLAN_CACHE_TTL)
@@ -0,0 +1,60 @@
+from datetime import datetime
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.api.cache import cached_json
+from app.db.session import get_async_db
+from app.db.models import PlanStats
+from app.services.stats import SCOPES
+from pydantic import BaseModel, TypeAdapter
+
+router = APIRouter()
+
+
+class PlanStatsOut(BaseModel):
+    scope: str
+    community: str
+    company: str
+    type: str
+    count: int
+    min_price: Optional[float] = None
+    max_price: Optional[float] = None
+    mean_price: Optional[float] = None
+    median_price: Optional[float] = None
+    ppsf_p25: Optional[float] = None
+    ppsf_median: Optional[float] = None
+    ppsf_p75: Optional[float] = None
+    min_sqft: Optional[int] = None
+    max_sqft: Optional[int] = None
+    updated_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+
+STATS_LIST = TypeAdapter(list[PlanStatsOut])
+
+@router.get("/stats", response_model=list[PlanStatsOut])
+async def get_stats(
+    request: Request,
+    scope: str = "community",
+    community: str | None = None,
+    company: str | None = None,
+    type: str | None = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Price and size summaries per community, company or community+company (see plan_stats)."""
+    if scope not in SCOPES:
+        raise HTTPException(status_code=400, detail=f"scope must be one of: {', '.join(SCOPES)}")
+    query = select(PlanStats).where(PlanStats.scope == scope)
+    if community is not None:
+        query = query.where(PlanStats.community == community)
+    if company is not None:
+        query = query.where(PlanStats.company == company)
+    if type is not None:
+        query = query.where(PlanStats.type == type)
+    async def build(response: Response):
+        rows = (await db.scalars(query.order_by(PlanStats.community, PlanStats.company, PlanStats.type))).all()
+        return [PlanStatsOut.model_validate(row) for row in rows]
+    return await cached_json(request, db, build, STATS_LIST)
@@ -0,0 +1,123 @@
+"""
+gzip/brotli content negotiation for API responses and the static frontend.
+brotli is optional: without the package only gzip is offered.
+"""
+
+import gzip
+import mimetypes
+import os
+from typing import Dict, Iterable, List, Optional
+
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+# Content-Encoding -> file suffix of a precompressed static variant, in server preference order
+FILE_SUFFIXES: Dict[str, str] = {"br": ".br", "gzip": ".gz"}
+
+# Encodings this process can compress responses with
+ENCODINGS: List[str] = ["br", "gzip"] if brotli else ["gzip"]
+
+# Bodies smaller than this are sent as-is (headers would eat the saving)
+MIN_COMPRESS_SIZE = 1024
+
+# Static files worth precompressing (images are already compressed)
+COMPRESSIBLE_SUFFIXES = (".js", ".css", ".html", ".svg", ".json", ".txt", ".map")
+
+
+def accepted_encodings(accept_encoding: Optional[str], offered: Iterable[str] = ENCODINGS) -> List[str]:
+    """Offered encodings the client accepts (q > 0), best first by q-value and then offer order."""
+    if not accept_encoding:
+        return []
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        weights[name.strip().lower()] = q
+    accepted = []
+    for encoding in offered:
+        q = weights.get(encoding, weights.get("*", 0.0))
+        if q > 0:
+            accepted.append((q, encoding))
+    return [encoding for q, encoding in sorted(accepted, key=lambda item: -item[0])]
+
+
+def compress(body: bytes, encoding: str, best: bool = False) -> bytes:
+    """best: maximum ratio for build-time compression; otherwise levels cheap enough per response."""
+    if encoding == "br":
+        return brotli.compress(body, quality=11 if best else 5)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=9 if best else 6, mtime=0)
+    raise ValueError(f"Unsupported encoding {encoding!r}")
+
+
+def precompress_directory(directory: str) -> int:
+    """
+    Write .br (when brotli is installed) and .gz next to every compressible file
+    under directory, skipping small files and variants that are already up to
+    date. Returns the number of files written.
+    """
+    written = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if not name.endswith(COMPRESSIBLE_SUFFIXES):
+                continue
+            path = os.path.join(root, name)
+            stat = os.stat(path)
+            if stat.st_size < MIN_COMPRESS_SIZE:
+                continue
+            with open(path, "rb") as f:
+                body = None
+                for encoding in ENCODINGS:
+                    target = path + FILE_SUFFIXES[encoding]
+                    if os.path.exists(target) and os.stat(target).st_mtime >= stat.st_mtime:
+                        continue
+                    body = body if body is not None else f.read()
+                    with open(target, "wb") as out:
+                        out.write(compress(body, encoding, best=True))
+                    written += 1
+    return written
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves a file's .br/.gz sibling when the client accepts that encoding."""
+
+    def file_response(self, full_path, stat_result, scope: Scope, status_code: int = 200) -> Response:
+        request_headers = Headers(scope=scope)
+        variants = [
+            (encoding, full_path + FILE_SUFFIXES[encoding])
+            for encoding in accepted_encodings(request_headers.get("accept-encoding"), FILE_SUFFIXES)
+        ]
+        for encoding, variant in variants:
+            try:
+                variant_stat = os.stat(variant)
+            except OSError:
+                continue
+            response = FileResponse(
+                variant,
+                status_code=status_code,
+                stat_result=variant_stat,
+                method=scope["method"],
+                media_type=mimetypes.guess_type(full_path)[0] or "text/plain",
+                headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+            )
+            if self.is_not_modified(response.headers, request_headers):
+                return NotModifiedResponse(response.headers)
+            return response
+        response = super().file_response(full_path, stat_result, scope, status_code)
+        if any(os.path.exists(full_path + suffix) for suffix in FILE_SUFFIXES.values()):
+            response.headers["Vary"] = "Accept-Encoding"
+        return response
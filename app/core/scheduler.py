@@ -1,19 +1,12 @@
 import threading
 import time
-from app.scrapers.now.elevon.drhorton import DRHortonElevonNowScraper
 from app.scrapers.now.elevon.unionmain import UnionMainElevonNowScraper
 from app.scrapers.now.elevon.historymaker import HistoryMakerElevonNowScraper
 from app.scrapers.now.elevon.mihomes import MIHomesElevonNowScraper
 from app.scrapers.now.elevon.trophysignature import TrophySignatureElevonNowScraper
 from app.scrapers.now.elevon.pacesetter import PacesetterElevonNowScraper
 from app.scrapers.now.elevon.khovnanian import KHovnanianElevonNowScraper
-from app.scrapers.plans.elevon.drhorton import DRHortonElevonPlanScraper
 from app.scrapers.plans.elevon.unionmain import UnionMainElevonPlanScraper
-from app.scrapers.plans.elevon.historymaker import HistoryMakerElevonPlanScraper
-from app.scrapers.plans.elevon.khovnanian import KHovnanianElevonPlanScraper
-from app.scrapers.plans.elevon.mihomes import MIHomesElevonPlanScraper
-from app.scrapers.plans.elevon.pacesetter import PacesetterElevonPlanScraper
-from app.scrapers.plans.elevon.trophysignature import TrophySignatureElevonPlanScraper
 from app.scrapers.now.cambridge.unionmain import UnionMainCambridgeNowScraper
 from app.scrapers.now.cambridge.coventry import CoventryCambridgeNowScraper
 from app.scrapers.now.cambridge.highlandhomes import HighlandHomesCambridgeNowScraper
@@ -159,8 +152,13 @@ from app.scrapers.now.waldenpondwest.unionmain import UnionMainWaldenPondWestNow
 from app.scrapers.now.waldenpondwest.pacesetter import PacesetterWaldenPondWestNowScraper
 from app.scrapers.now.waldenpondwest.centex import CentexWaldenPondWestNowScraper
 from app.scrapers.now.waldenpondwest.historymaker import HistoryMakerWaldenPondWestNowScraper
+from app.scrapers.pipeline import run_scrapers
+from app.scrapers.platforms.spec import load_spec_scrapers
 from app.db.session import SessionLocal
 from app.services.change_detection import detect_and_update_changes, sync_community_names_from_plans
+from app.services.generation import bump_generation
+from app.services.snapshots import finish_run, start_run
+from app.services.stats import refresh_stats
 
 SCRAPE_INTERVAL_SECONDS = 3600*48  # 1 hour
 
@@ -168,20 +166,14 @@ class ScraperScheduler:
     def __init__(self):
         # Add all scraper instances here as you implement more
         self.scrapers = [
-            DRHortonElevonNowScraper(),
+            *load_spec_scrapers(),
             UnionMainElevonNowScraper(),
             HistoryMakerElevonNowScraper(),
             MIHomesElevonNowScraper(),
             TrophySignatureElevonNowScraper(),
             PacesetterElevonNowScraper(),
             KHovnanianElevonNowScraper(),
-            DRHortonElevonPlanScraper(),
             UnionMainElevonPlanScraper(),
-            HistoryMakerElevonPlanScraper(),
-            KHovnanianElevonPlanScraper(),
-            MIHomesElevonPlanScraper(),
-            PacesetterElevonPlanScraper(),
-            TrophySignatureElevonPlanScraper(),
             UnionMainCambridgeNowScraper(),
             CoventryCambridgeNowScraper(),
             HighlandHomesCambridgeNowScraper(),
@@ -352,33 +344,27 @@ class ScraperScheduler:
         print("[Scheduler] Running all scrapers...")
         db = SessionLocal()
         try:
-            # Collect all plans from all scrapers (one failing scraper must not abort the run)
+            run_id = start_run(db)
+            # Collect all plans from all scrapers; pages are parsed in worker processes
+            # while later scrapers download (one failing scraper must not abort the run)
             all_plans = []
-            for scraper in self.scrapers:
-                print(f"[Scheduler] Running scraper: {scraper.__class__.__name__}")
-                try:
-                    plans = scraper.fetch_plans()
-                except Exception as e:
-                    print(f"[Scheduler] {scraper.__class__.__name__} failed: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    continue
+            for scraper, plans in run_scrapers(self.scrapers):
                 if plans:
-                    for p in plans:
-                        # Normalize key: some scrapers may use "Community" or "community"
-                        if "community" not in p and "Community" in p:
-                            p["community"] = p["Community"]
                     all_plans.extend(plans)
                     print(f"[Scheduler] {scraper.__class__.__name__}: {len(plans)} plans.")
                 else:
                     print(f"[Scheduler] {scraper.__class__.__name__}: No plans found or scraping failed.")
-            # Store all scraped plans (delete by community + insert); runs whenever we have any data
+            # Store all scraped plans (upsert by listing + price snapshots); runs whenever we have any data
             if all_plans:
                 print(f"[Scheduler] Storing {len(all_plans)} plans in database...")
-                detect_and_update_changes(db, all_plans)
+                detect_and_update_changes(db, all_plans, run_id=run_id)
                 # Ensure community_names table has all communities that exist in plans
                 sync_community_names_from_plans(db)
+                refresh_stats(db, {p.community for p in all_plans}, {p.company for p in all_plans})
+                # One bump after every write has committed: cached API responses are rebuilt from the new data
+                bump_generation(db)
                 print("[Scheduler] Done.")
+            finish_run(db, run_id, len(all_plans))
         except Exception as e:
             print(f"[Scheduler] Error: {e}")
             import traceback
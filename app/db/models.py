@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Index
 from sqlalchemy.orm import declarative_base, relationship
 from datetime import datetime
 
@@ -17,6 +17,21 @@ class CommunityName(Base):
 
 class Plan(Base):
     __tablename__ = "plans"
+    # /api/get_plans filters by community, company and type; ingest reads by community
+    __table_args__ = (
+        Index("ix_plans_community_type_company", "community", "type", "company"),
+        Index("ix_plans_company_type", "company", "type"),
+        # Days on market / sold velocity: listings of a type by removal state and age
+        Index("ix_plans_type_removed_at_first_seen_at", "type", "removed_at", "first_seen_at"),
+        # Keyset pages (ORDER BY id) filtered by community or company, without a sort step
+        Index("ix_plans_community_id", "community", "id"),
+        Index("ix_plans_company_id", "company", "id"),
+        # Range filters / sorts of /api/get_plans
+        Index("ix_plans_price", "price"),
+        Index("ix_plans_sqft", "sqft"),
+        Index("ix_plans_price_per_sqft", "price_per_sqft"),
+        Index("ix_plans_beds_baths", "beds", "baths"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     plan_name = Column(String, index=True)
     price = Column(Float)
@@ -27,17 +42,95 @@ class Plan(Base):
     company = Column(String, nullable=False)
     community = Column(String, nullable=False)
     type = Column(String, nullable=False, default="plan")  # "plan" or "now"
-    beds = Column(String)  # Number of bedrooms
-    baths = Column(String)  # Number of bathrooms
+    beds = Column(Float)  # Number of bedrooms
+    baths = Column(Float)  # Number of bathrooms (2.5 = two full, one half)
     address = Column(String)  # Full address for "now" items
     design_number = Column(String)  # Design number/model
+    listing_key = Column(String, index=True)  # stable identity across runs, see app.models.record.listing_key
+    removed_at = Column(DateTime)  # set when the listing no longer appears on its builder's page
+    # Lifecycle, maintained by ingest: days on market = (removed_at or now) - first_seen_at
+    first_seen_at = Column(DateTime)
+    last_seen_at = Column(DateTime)
+    first_price = Column(Float)  # price when first seen
+    removed_run_id = Column(Integer, ForeignKey("scrape_runs.id"))  # run that found it gone
     price_histories = relationship("PriceHistory", back_populates="plan")
 
 class PriceHistory(Base):
     __tablename__ = "price_history"
+    # (plan_id, changed_at): the plan endpoints' "changed since" EXISTS probe per plan;
+    # (changed_at, plan_id): recent changes across all plans
+    __table_args__ = (
+        Index("ix_price_history_plan_id_changed_at", "plan_id", "changed_at"),
+        Index("ix_price_history_changed_at_plan_id", "changed_at", "plan_id"),
+    )
     id = Column(Integer, primary_key=True, index=True)
     plan_id = Column(Integer, ForeignKey("plans.id"))
     old_price = Column(Float)
     new_price = Column(Float)
     changed_at = Column(DateTime, default=datetime.utcnow)
-    plan = relationship("Plan", back_populates="price_histories") 
\ No newline at end of file
+    plan = relationship("Plan", back_populates="price_histories") 
+
+class ScrapeRun(Base):
+    """One scheduler run; snapshots point at the run that captured them."""
+    __tablename__ = "scrape_runs"
+    id = Column(Integer, primary_key=True, index=True)
+    started_at = Column(DateTime, default=datetime.utcnow, index=True)
+    finished_at = Column(DateTime)
+    plan_count = Column(Integer, default=0)  # records ingested by the run
+
+
+class PriceSnapshot(Base):
+    """
+    Append-only price/sqft/status time series per listing. A row is written only
+    when a listing's values differ from its previous snapshot (or it is removed),
+    so unchanged listings cost nothing per run.
+    """
+    __tablename__ = "price_snapshots"
+    __table_args__ = (
+        # One listing's history; the rowid tail also gives its latest snapshot
+        Index("ix_price_snapshots_listing_key_captured_at", "listing_key", "captured_at"),
+        # Everything captured in a time range
+        Index("ix_price_snapshots_captured_at", "captured_at"),
+    )
+    id = Column(Integer, primary_key=True)
+    run_id = Column(Integer, ForeignKey("scrape_runs.id"), nullable=False)
+    listing_key = Column(String, nullable=False)
+    price = Column(Integer)
+    sqft = Column(Integer)
+    status = Column(String)  # listing status; "removed" when it left the builder's page
+    captured_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+
+class PlanStats(Base):
+    """
+    Price/size summary of current listings per group, refreshed by ingest.
+    scope says which of community/company is set ("" for the other):
+    "community", "company" or "community_company".
+    """
+    __tablename__ = "plan_stats"
+    __table_args__ = (
+        Index("ix_plan_stats_group", "scope", "community", "company", "type", unique=True),
+    )
+    id = Column(Integer, primary_key=True)
+    scope = Column(String, nullable=False)
+    community = Column(String, nullable=False, default="")
+    company = Column(String, nullable=False, default="")
+    type = Column(String, nullable=False)
+    count = Column(Integer, nullable=False, default=0)
+    min_price = Column(Float)
+    max_price = Column(Float)
+    mean_price = Column(Float)
+    median_price = Column(Float)
+    ppsf_p25 = Column(Float)  # price per sqft quartiles
+    ppsf_median = Column(Float)
+    ppsf_p75 = Column(Float)
+    min_sqft = Column(Integer)
+    max_sqft = Column(Integer)
+    updated_at = Column(DateTime, default=datetime.utcnow)
+
+
+class DataGeneration(Base):
+    """Single-row counter bumped after every ingest; read endpoints key their cache on it."""
+    __tablename__ = "data_generation"
+    id = Column(Integer, primary_key=True)
+    value = Column(Integer, nullable=False, default=0)
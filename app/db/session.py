@@ -1,14 +1,84 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import String, create_engine, event, inspect, make_url, text
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from .models import Base, CommunityName, Plan, PriceHistory  # import all models so create_all creates every table
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from app.core import config
+from app.models.record import listing_key
+from .models import Base, CommunityName, DataGeneration, Plan, PlanStats, PriceHistory, PriceSnapshot, ScrapeRun  # import all models so create_all creates every table
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./homes.db"
+SQLALCHEMY_DATABASE_URL = config.DATABASE_URL
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+# Pragmas run on every new SQLite connection. "performance": WAL so API reads
+# are not blocked while the scheduler's ingest transaction commits, plus a busy
+# timeout instead of immediate "database is locked" errors. "default" leaves
+# SQLite's own settings (rollback journal, synchronous=FULL).
+SQLITE_PROFILES = {
+    "default": {},
+    "performance": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "busy_timeout": 5000,  # ms
+        "cache_size": -64000,  # KiB, i.e. 64 MB
+        "mmap_size": 256 * 1024 * 1024,
+        "temp_store": "MEMORY",
+    },
+}
+
+def engine_options(url: str, asyncio: bool = False) -> dict:
+    """create_engine() keyword arguments for url: pool settings from config, SQLite thread sharing."""
+    parsed = make_url(url)
+    options = {}
+    if parsed.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+        if parsed.database in (None, "", ":memory:"):
+            return options  # in-memory SQLite uses a single-connection pool
+    options.update(
+        pool_size=config.DB_POOL_SIZE,
+        max_overflow=config.DB_MAX_OVERFLOW,
+        pool_recycle=config.DB_POOL_RECYCLE,
+        pool_pre_ping=config.DB_POOL_PRE_PING,
+    )
+    if asyncio and parsed.get_backend_name() == "sqlite":
+        options["poolclass"] = AsyncAdaptedQueuePool  # aiosqlite would otherwise reconnect per checkout
+    return options
+
+engine = create_engine(SQLALCHEMY_DATABASE_URL, **engine_options(SQLALCHEMY_DATABASE_URL))
+
+def apply_sqlite_profile(engine, profile: str = config.SQLITE_PROFILE):
+    """Run the profile's pragmas on every connection the engine opens."""
+    if engine.dialect.name != "sqlite":
+        return
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(f"Unknown SQLITE_PROFILE {profile!r} (expected one of {', '.join(SQLITE_PROFILES)})")
+    pragmas = SQLITE_PROFILES[profile]
+
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+apply_sqlite_profile(engine)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async drivers for the read-only API endpoints; the scheduler keeps the sync engine
+ASYNC_DRIVERS = {"sqlite": "aiosqlite", "postgresql": "asyncpg"}
+
+def async_url(url: str) -> str:
+    """url with its driver swapped for the backend's asyncio driver."""
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for {backend!r} (DATABASE_URL)")
+    return parsed.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+ASYNC_DATABASE_URL = async_url(SQLALCHEMY_DATABASE_URL)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **engine_options(SQLALCHEMY_DATABASE_URL, asyncio=True))
+apply_sqlite_profile(async_engine.sync_engine)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+
 def init_db():
     Base.metadata.create_all(bind=engine)
     # Add plan/now columns to community_names if they don't exist (e.g. existing DB)
@@ -19,4 +89,94 @@ def init_db():
                 conn.commit()
             except Exception:
                 conn.rollback()
-                pass  # column likely already exists 
\ No newline at end of file
+                pass  # column likely already exists
+        # Listing identity / removal marker on plans (e.g. existing DB)
+        for ddl in (
+            "ALTER TABLE plans ADD COLUMN listing_key VARCHAR",
+            "ALTER TABLE plans ADD COLUMN removed_at TIMESTAMP",
+            "ALTER TABLE plans ADD COLUMN first_seen_at TIMESTAMP",
+            "ALTER TABLE plans ADD COLUMN last_seen_at TIMESTAMP",
+            "ALTER TABLE plans ADD COLUMN first_price FLOAT",
+            "ALTER TABLE plans ADD COLUMN removed_run_id INTEGER REFERENCES scrape_runs(id)",
+        ):
+            try:
+                conn.execute(text(ddl))
+                conn.commit()
+            except Exception:
+                conn.rollback()
+        # Rows from before lifecycle tracking: best known first sighting is their last update
+        conn.execute(text(
+            "UPDATE plans SET first_seen_at = last_updated, last_seen_at = COALESCE(last_seen_at, last_updated), "
+            "first_price = COALESCE(first_price, price) WHERE first_seen_at IS NULL"
+        ))
+        conn.commit()
+        _migrate_numeric_beds_baths(conn)
+        _rekey_design_numbers(conn)
+    create_missing_indexes()
+
+def _rekey_design_numbers(conn):
+    """
+    Listing keys of plans now include the design number; move stored keys (and
+    their snapshots) from the old plan-name-only form so those listings keep their history.
+    """
+    rows = conn.execute(text(
+        "SELECT id, company, community, type, plan_name, design_number, listing_key FROM plans "
+        "WHERE type = 'plan' AND design_number IS NOT NULL AND design_number != '' AND listing_key IS NOT NULL"
+    )).all()
+    moves = []
+    for row in rows:
+        old = listing_key(row.company, row.community, row.type, row.plan_name)
+        new = listing_key(row.company, row.community, row.type, row.plan_name, design_number=row.design_number)
+        if row.listing_key == old != new:
+            moves.append({"id": row.id, "old": old, "new": new})
+    if not moves:
+        return
+    print(f"[db] Adding design numbers to {len(moves)} listing keys...")
+    conn.execute(text("UPDATE plans SET listing_key = :new WHERE id = :id"), moves)
+    conn.execute(text("UPDATE price_snapshots SET listing_key = :new WHERE listing_key = :old"), moves)
+    conn.commit()
+
+def _migrate_numeric_beds_baths(conn):
+    """beds/baths used to be text columns; convert them to numbers ("" -> NULL) in an existing DB."""
+    columns = {c["name"]: c["type"] for c in inspect(conn).get_columns("plans")}
+    if not isinstance(columns.get("beds"), String):
+        return
+    print("[db] Converting plans.beds/baths to numeric columns...")
+    if conn.dialect.name != "sqlite":
+        for col in ("beds", "baths"):
+            conn.execute(text(
+                f"ALTER TABLE plans ALTER COLUMN {col} TYPE DOUBLE PRECISION USING CAST(NULLIF({col}, '') AS DOUBLE PRECISION)"
+            ))
+        conn.commit()
+        return
+    # SQLite cannot change a column's type: copy into a new table and swap it in.
+    # Indexes are dropped with the old table and recreated by create_missing_indexes().
+    names = [c for c in Plan.__table__.c.keys() if c in columns]
+    select_list = ", ".join(
+        f"CAST(NULLIF(TRIM({c}), '') AS REAL)" if c in ("beds", "baths") else c for c in names
+    )
+    ddl = str(CreateTable(Plan.__table__).compile(conn)).replace("CREATE TABLE plans", "CREATE TABLE plans_new", 1)
+    conn.execute(text(ddl))
+    conn.execute(text(f"INSERT INTO plans_new ({', '.join(names)}) SELECT {select_list} FROM plans"))
+    conn.execute(text("DROP TABLE plans"))
+    conn.execute(text("ALTER TABLE plans_new RENAME TO plans"))
+    conn.commit()
+
+def get_db():
+    """FastAPI dependency: one session per request, closed afterwards."""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db():
+    """FastAPI dependency for async endpoints: one AsyncSession per request."""
+    async with AsyncSessionLocal() as db:
+        yield db
+
+def create_missing_indexes():
+    """create_all skips indexes of tables that already exist; add any index the models declare but the DB lacks."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
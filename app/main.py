@@ -1,9 +1,11 @@
 from fastapi import FastAPI, Request
 from fastapi.responses import FileResponse
-from fastapi.staticfiles import StaticFiles
 from fastapi.middleware.cors import CORSMiddleware
-from app.api import plans_router, get_plans_router, get_communities_router
-from app.db.session import init_db
+from app.api import plans_router, get_plans_router, get_communities_router, stats_router
+from app.core import config
+from app.core.compression import PrecompressedStaticFiles
+from app.db.session import SessionLocal, async_engine, init_db
+from app.services.stats import fill_empty_stats
 from app.core.scheduler import scheduler
 import os
 
@@ -16,21 +18,30 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count", "ETag"],
 )
 
 app.include_router(plans_router, prefix="/api")
 app.include_router(get_plans_router, prefix="/api")
 app.include_router(get_communities_router, prefix="/api")
+app.include_router(stats_router, prefix="/api")
 
 @app.on_event("startup")
 def on_startup():
     init_db()
-    scheduler.start()
+    with SessionLocal() as db:
+        fill_empty_stats(db)
+    if config.SCHEDULER_ENABLED:
+        scheduler.start()
 
-# Serve static frontend (Vite build)
+@app.on_event("shutdown")
+async def on_shutdown():
+    await async_engine.dispose()
+
+# Serve static frontend (Vite build); .br/.gz siblings from precompress_frontend.py are sent when accepted
 frontend_dist = os.path.join(os.path.dirname(__file__), "frontend_dist")
 if os.path.isdir(frontend_dist):
-    app.mount("/", StaticFiles(directory=frontend_dist, html=True), name="frontend")
+    app.mount("/", PrecompressedStaticFiles(directory=frontend_dist, html=True), name="frontend")
 
     # SPA fallback: serve index.html for any non-API, non-static route
     @app.middleware("http")
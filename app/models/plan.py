@@ -13,6 +13,8 @@ class PlanBase(BaseModel):
     community: str
     type: str
     address: Optional[str] = None
+    beds: Optional[float] = None
+    baths: Optional[float] = None
 
 class PlanWithChangeFlag(PlanBase):
     price_changed_recently: bool
@@ -0,0 +1,172 @@
+"""
+PlanRecord: the normalized listing every scraper run produces.
+Scrapers still build plan dicts; PlanRecord.from_dict() checks and types them
+once (in the parse worker for staged scrapers), and ingest only sees records.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Union
+
+from app.scrapers import parse_utils
+
+PLAN_TYPES = ("plan", "now")
+
+
+class RecordError(ValueError):
+    """Raised when a scraped row cannot become a PlanRecord."""
+
+
+def _text(value) -> str:
+    if value is None:
+        return ""
+    return str(value).strip()
+
+
+def _count(value) -> Optional[float]:
+    """Beds, baths: 3, "3", "3-4 Beds" -> 3.0; "" -> None."""
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    text = parse_utils.parse_beds(value)
+    return float(text) if text else None
+
+
+def _count_text(value: Optional[float]) -> str:
+    """3.0 -> "3", 2.5 -> "2.5", None -> "" (the stories column holds text)."""
+    if value is None:
+        return ""
+    return str(int(value)) if value == int(value) else str(value)
+
+
+def listing_key(company: str, community: str, plan_type: str, plan_name: str, address: str = "",
+                design_number: str = "", url: str = "") -> str:
+    """
+    Identity of a listing across runs: company|community|type plus, for move-in
+    homes, the address (or the detail url when no address was scraped), else the
+    plan name and design number. Case and spacing are ignored.
+    """
+    if plan_type == "now" and (address or url):
+        names = (address or url,)
+    else:
+        names = (plan_name, design_number) if design_number else (plan_name,)
+    return "|".join(" ".join(str(part or "").split()).casefold() for part in (company, community, plan_type, *names))
+
+
+def _price(text: str) -> Optional[int]:
+    # Scrapers hand over either "$..." text or an already clean number string
+    return parse_utils.parse_price(text, bare=True)
+
+
+def _int(value, parser) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, (int, float)):
+        return int(round(value))
+    return parser(value)
+
+
+@dataclass(slots=True)
+class PlanRecord:
+    company: str
+    community: str
+    type: str
+    plan_name: str
+    price: Optional[int] = None
+    sqft: Optional[int] = None
+    price_per_sqft: Optional[float] = None
+    stories: Optional[float] = None
+    beds: Optional[float] = None
+    baths: Optional[float] = None
+    address: str = ""
+    design_number: str = ""
+    original_price: Optional[int] = None
+    status: str = ""
+    url: str = ""
+
+    @classmethod
+    def from_dict(cls, row: Dict) -> "PlanRecord":
+        """Normalize a scraper's plan dict; raises RecordError if it cannot be stored."""
+        company = _text(row.get("company"))
+        community = _text(row.get("community") or row.get("Community"))
+        if not company or not community:
+            raise RecordError("missing company or community")
+        plan_type = _text(row.get("type") or "plan").lower()
+        if plan_type not in PLAN_TYPES:
+            raise RecordError(f"unknown type {plan_type!r}")
+        address = _text(row.get("address"))
+        plan_name = _text(row.get("plan_name")) or address
+        if not plan_name:
+            raise RecordError("missing plan_name")
+
+        price = _int(row.get("price"), _price)
+        sqft = _int(row.get("sqft"), parse_utils.parse_sqft)
+        price_per_sqft = row.get("price_per_sqft")
+        if isinstance(price_per_sqft, (int, float)):
+            price_per_sqft = float(price_per_sqft)
+        else:
+            price_per_sqft = round(price / sqft, 2) if price and sqft else None
+        stories = row.get("stories")
+        if not isinstance(stories, (int, float)):
+            stories = parse_utils.parse_stories(stories)
+        return cls(
+            company=company,
+            community=community,
+            type=plan_type,
+            plan_name=plan_name,
+            price=price,
+            sqft=sqft,
+            price_per_sqft=price_per_sqft,
+            stories=float(stories) if stories not in (None, "") else None,
+            beds=_count(row.get("beds")),
+            baths=_count(row.get("baths")),
+            address=address,
+            design_number=_text(row.get("design_number")),
+            original_price=_int(row.get("original_price"), _price),
+            status=_text(row.get("status")),
+            url=_text(row.get("url") or row.get("detail_link")),
+        )
+
+    @property
+    def listing_key(self) -> str:
+        return listing_key(self.company, self.community, self.type, self.plan_name, self.address,
+                           self.design_number, self.url)
+
+    def column_values(self) -> Dict:
+        """Values for the plans table columns."""
+        return {
+            "plan_name": self.plan_name,
+            "price": self.price,
+            "sqft": self.sqft,
+            "stories": _count_text(self.stories) or None,
+            "price_per_sqft": self.price_per_sqft,
+            "company": self.company,
+            "community": self.community,
+            "type": self.type,
+            "beds": self.beds,
+            "baths": self.baths,
+            "address": self.address,
+            "design_number": self.design_number,
+            "listing_key": self.listing_key,
+        }
+
+
+def to_records(rows: Optional[Iterable[Union[Dict, PlanRecord]]], source: str = "") -> List[PlanRecord]:
+    """
+    Turn a scraper's rows into PlanRecords (records pass through). Rows that
+    cannot be stored are dropped with a log line saying why.
+    """
+    records = []
+    rejected = 0
+    for row in rows or []:
+        if isinstance(row, PlanRecord):
+            records.append(row)
+            continue
+        try:
+            records.append(PlanRecord.from_dict(row))
+        except RecordError as e:
+            rejected += 1
+            print(f"[{source or 'PlanRecord'}] Dropping row {row.get('plan_name') or row.get('address')!r}: {e}")
+    if rejected:
+        print(f"[{source or 'PlanRecord'}] Dropped {rejected} of {rejected + len(records)} rows")
+    return records
@@ -1,8 +1,59 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Tuple, Union
+from app.models.record import PlanRecord, to_records
+from . import parse_utils
+
+# (url, raw body) as downloaded by a staged scraper
+Page = Tuple[str, Union[str, bytes]]
 
 class BaseScraper(ABC):
     @abstractmethod
     def fetch_plans(self) -> List[Dict]:
         """Scrape and return a list of plan dicts."""
-        pass 
\ No newline at end of file
+        pass
+
+    def fetch_records(self) -> List[PlanRecord]:
+        """fetch_plans() normalized into PlanRecords."""
+        return to_records(self.fetch_plans(), type(self).__name__)
+
+    # Default field parsers (see parse_utils); override only for site-specific formats
+    def parse_price(self, text):
+        """Extract price from text."""
+        return parse_utils.parse_price(text)
+
+    def parse_sqft(self, text):
+        """Extract square footage from text."""
+        return parse_utils.parse_sqft(text)
+
+    def parse_beds(self, text):
+        """Extract number of bedrooms from text."""
+        return parse_utils.parse_beds(text)
+
+    def parse_baths(self, text):
+        """Extract number of bathrooms from text."""
+        return parse_utils.parse_baths(text)
+
+
+class StagedScraper(BaseScraper):
+    """
+    Scraper split into a network stage and a parse stage. The scheduler runs
+    fetch_pages() itself and hands the raw pages to parse_pages() in a worker
+    process, so parse_pages() must only use the pages and picklable state.
+    """
+
+    @abstractmethod
+    def fetch_pages(self) -> List[Page]:
+        """Download the raw pages this scraper needs."""
+        pass
+
+    @abstractmethod
+    def parse_pages(self, pages: List[Page]) -> List[Dict]:
+        """Turn raw pages into plan dicts."""
+        pass
+
+    def parse_records(self, pages: List[Page]) -> List[PlanRecord]:
+        """parse_pages() normalized into PlanRecords."""
+        return to_records(self.parse_pages(pages), type(self).__name__)
+
+    def fetch_plans(self) -> List[Dict]:
+        return self.parse_pages(self.fetch_pages())
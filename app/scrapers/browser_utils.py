@@ -0,0 +1,235 @@
+"""
+Shared browser helpers for Selenium-based scrapers.
+Keeps a persistent Chrome profile and cookie jar per domain so Cloudflare
+clearance cookies survive across scrapers and runs.
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+
+# Cloudflare binds clearance cookies to the user agent, so the browser and any
+# HTTP session reusing its cookies must send the same one.
+USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+    "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+
+PROFILE_ROOT = os.environ.get("SCRAPER_PROFILE_DIR", os.path.join(".", "browser_profiles"))
+
+# Upper bound on how long a stored clearance is trusted, even if the cookie says otherwise
+CLEARANCE_TTL_SECONDS = 30 * 60
+
+_lock = threading.Lock()
+
+# Pages of one builder that are loaded together in tabs of a single browser.
+# A page is ready once every selector in ready_selectors matches. Where the
+# "now" and "plans" scrapers read the same page, both of their contents are
+# required, so neither snapshots the page before its own cards render.
+TAB_GROUPS = {
+    # URLs come from the community table in platforms/highlandhomes.py
+    "highlandhomes": {
+        "ready_selectors": ["#moveInReadyContainer", "#planCards"],
+        "settle_seconds": 5,
+    },
+    "fischerhomes": {
+        "urls": [
+            "https://www.fischerhomes.com/find-new-homes/hiram/ga/communities/927/pickens-bluff#/residences-homes",
+            "https://www.fischerhomes.com/find-new-homes/dallas/ga/communities/885/laurel-farms#/residences-homes",
+            "https://www.fischerhomes.com/find-new-homes/dallas/ga/communities/887/sage-woods#/residences-homes",
+        ],
+        "ready_selectors": [".card_mov-in-ready", ".floorplan-card"],
+        "settle_seconds": 5,
+    },
+    "drbhomes": {
+        "urls": [
+            "https://www.drbhomes.com/drbhomes/find-your-home/communities/texas/dallasfort-worth/green-meadows/quick-move-in-homes",
+            "https://www.drbhomes.com/drbhomes/find-your-home/communities/texas/dallasfort-worth/green-meadows/home-plans",
+            "https://www.drbhomes.com/drbhomes/find-your-home/communities/texas/dallasfort-worth/walden-pond/quick-move-in-homes",
+            "https://www.drbhomes.com/drbhomes/find-your-home/communities/texas/dallasfort-worth/walden-pond/home-plans",
+        ],
+        # Move-in and plan cards are on separate pages, so either one means ready
+        "ready_selectors": ["drb-qmi-home-card, drb-home-plan-card"],
+        "settle_seconds": 5,
+    },
+}
+
+# How long a page loaded for a group stays usable by the other scrapers of that builder
+PAGE_CACHE_TTL_SECONDS = 15 * 60
+
+TAB_LOAD_TIMEOUT_SECONDS = 90
+
+# Scrolls a loaded page to trigger lazy content, then reports whether all selectors match
+_READY_JS = (
+    "if (document.readyState !== 'complete') return false;"
+    "window.scrollTo(0, document.body.scrollHeight);"
+    "return (arguments[0] || []).every(s => document.querySelector(s) !== null);"
+)
+
+_page_cache: Dict[str, Tuple[float, str]] = {}
+_group_lock = threading.Lock()
+
+
+def domain_of(url: str) -> str:
+    """Return the host of a URL without a leading 'www.'."""
+    host = urlparse(url).hostname or url
+    return host[4:] if host.startswith("www.") else host
+
+
+def _domain_dir(domain: str) -> str:
+    path = os.path.join(PROFILE_ROOT, domain)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _cookie_file(domain: str) -> str:
+    return os.path.join(_domain_dir(domain), "cookies.json")
+
+
+def load_cookies(domain: str) -> List[Dict]:
+    """Return the stored cookies for a domain, dropping any that have expired."""
+    path = _cookie_file(domain)
+    with _lock:
+        if not os.path.exists(path):
+            return []
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return []
+    now = time.time()
+    if now - data.get("saved_at", 0) > CLEARANCE_TTL_SECONDS:
+        return []
+    return [c for c in data.get("cookies", []) if not c.get("expiry") or c["expiry"] > now]
+
+
+def save_cookies(domain: str, cookies: List[Dict]) -> None:
+    """Persist cookies (as returned by driver.get_cookies()) for a domain."""
+    path = _cookie_file(domain)
+    tmp_path = path + ".tmp"
+    with _lock:
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"saved_at": time.time(), "cookies": cookies}, f)
+        os.replace(tmp_path, path)
+
+
+def create_chrome_driver(domain: str, headless: bool = True) -> webdriver.Chrome:
+    """Create a Chrome driver using the persistent profile for the given domain."""
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument(f'--user-agent={USER_AGENT}')
+    chrome_options.add_argument(f'--user-data-dir={os.path.abspath(os.path.join(_domain_dir(domain), "chrome"))}')
+    return webdriver.Chrome(options=chrome_options)
+
+
+def cookie_session(url: str, headers: Optional[Dict] = None) -> requests.Session:
+    """
+    Return a requests.Session preloaded with the stored cookies for the URL's domain
+    and the browser's user agent, so HTTP-only scrapers can skip the challenge too.
+    A User-Agent in headers is overridden, since the cookies are only valid with USER_AGENT.
+    """
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    session.headers["User-Agent"] = USER_AGENT
+    for c in load_cookies(domain_of(url)):
+        session.cookies.set(c["name"], c["value"], domain=c.get("domain", ""), path=c.get("path", "/"))
+    return session
+
+
+def load_in_tabs(
+    driver: webdriver.Chrome,
+    urls: List[str],
+    ready_selectors: Optional[List[str]] = None,
+    timeout: int = TAB_LOAD_TIMEOUT_SECONDS,
+    settle_seconds: int = 5,
+) -> Iterator[Tuple[str, str]]:
+    """
+    Open every URL in its own tab of one browser and yield (url, page_source)
+    as each tab becomes ready, so the network waits of all pages overlap.
+
+    Loaded tabs are scrolled to trigger lazy content until every selector in
+    ready_selectors matches, then captured settle_seconds later.
+    Tabs still not ready at the timeout are captured as they are.
+    """
+    original = driver.current_window_handle
+    pending = {}
+    for url in urls:
+        driver.switch_to.new_window('tab')
+        # Assigning location does not block like driver.get(), so all tabs load at once
+        driver.execute_script("window.location.href = arguments[0];", url)
+        pending[driver.current_window_handle] = url
+
+    deadline = time.time() + timeout
+    ready_at = {}
+    while pending:
+        for handle, url in list(pending.items()):
+            driver.switch_to.window(handle)
+            now = time.time()
+            if handle not in ready_at:
+                if not driver.execute_script(_READY_JS, ready_selectors) and now < deadline:
+                    continue
+                ready_at[handle] = now
+                continue
+            if now - ready_at[handle] < settle_seconds:
+                continue
+            driver.execute_script("window.scrollTo(0, 0);")
+            source = driver.page_source
+            driver.close()
+            del pending[handle]
+            yield url, source
+        time.sleep(0.5)
+    driver.switch_to.window(original)
+
+
+def fetch_group_page(group: str, url: str, group_urls: Optional[List[str]] = None) -> Optional[str]:
+    """
+    Return the page source for url. On first use every page of the builder group
+    (group_urls, or the group's "urls" in TAB_GROUPS) is loaded in parallel tabs
+    of a single browser and cached, so the other scrapers of that builder
+    (now and plans) read their pages without a browser.
+    """
+    with _group_lock:
+        now = time.time()
+        for key in [k for k, (ts, _) in _page_cache.items() if now - ts >= PAGE_CACHE_TTL_SECONDS]:
+            del _page_cache[key]
+        if url in _page_cache:
+            return _page_cache[url][1]
+
+        spec = TAB_GROUPS.get(group, {})
+        urls = list(group_urls or spec.get("urls", []))
+        if url not in urls:
+            urls.append(url)
+        domain = domain_of(url)
+        print(f"[browser_utils] Loading {len(urls)} {group} pages in parallel tabs...")
+        driver = None
+        try:
+            driver = create_chrome_driver(domain)
+            for page_url, source in load_in_tabs(
+                driver,
+                urls,
+                ready_selectors=spec.get("ready_selectors"),
+                settle_seconds=spec.get("settle_seconds", 5),
+            ):
+                print(f"[browser_utils] Page ready: {page_url}")
+                _page_cache[page_url] = (time.time(), source)
+            save_cookies(domain, driver.get_cookies())
+        except Exception as e:
+            print(f"[browser_utils] Error loading {group} pages: {e}")
+        finally:
+            if driver:
+                driver.quit()
+        cached = _page_cache.get(url)
+        return cached[1] if cached else None
@@ -0,0 +1,193 @@
+"""
+Declarative extraction specs compiled into lxml extractors.
+
+A spec describes one listing page:
+
+    {
+        "name": "MIHomesElevonPlanScraper",
+        "company": "M/I Homes",
+        "community": "Elevon",
+        "type": "plan",
+        "url": "https://elevontx.com/builder/m-i-homes/",
+        "cards": "div.ct-div-block.collectable.listing",
+        "fields": {
+            "price": {"select": "@data-price", "transform": "int"},
+            "plan_name": "h4.ct-headline"
+        },
+        "required": ["price", "plan_name"]
+    }
+
+Selectors are CSS, or XPath when they start with "/", "./", "(" or "@".
+A field is a selector string or an object with:
+- select: selector relative to the card
+- attr: read this attribute instead of the element text
+- regex: keep the first group of this (case-insensitive) pattern
+- index: which match to use (default 0, -1 for the last)
+- transform: a name in TRANSFORMS (default "text")
+- default: value when nothing matches
+
+Specs are compiled once (XPath objects + transform functions) and then run
+over each page without building BeautifulSoup objects.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Union
+from urllib.parse import urljoin
+
+from cssselect import HTMLTranslator, SelectorError
+from lxml import etree
+from lxml import html as lxml_html
+
+from . import parse_utils
+
+Markup = Union[str, bytes]
+
+_XPATH_PREFIXES = ("/", "./", "../", "(", "@")
+_NUMBER_RE = re.compile(r'\d[\d,]*(?:\.\d+)?')
+_translator = HTMLTranslator()
+
+
+def _to_int(text: str) -> Optional[int]:
+    match = _NUMBER_RE.search(text)
+    return int(float(match.group(0).replace(",", ""))) if match else None
+
+
+def _to_float(text: str) -> Optional[float]:
+    match = _NUMBER_RE.search(text)
+    return float(match.group(0).replace(",", "")) if match else None
+
+
+TRANSFORMS: Dict[str, Callable[[str], Any]] = {
+    "text": lambda text: text,
+    "int": _to_int,
+    "float": _to_float,
+    "price": parse_utils.parse_price,
+    "sqft": parse_utils.parse_sqft,
+    "beds": parse_utils.parse_beds,
+    "baths": parse_utils.parse_baths,
+    "stories": parse_utils.parse_stories,
+    # Resolved against the page URL in CompiledSpec.extract()
+    "url": lambda text: text,
+}
+
+
+class SpecError(ValueError):
+    """Raised when a spec cannot be compiled."""
+
+
+def compile_selector(selector: str) -> etree.XPath:
+    """Compile a CSS or XPath selector into a reusable lxml XPath object."""
+    try:
+        if selector.startswith(_XPATH_PREFIXES):
+            expr = selector
+        else:
+            expr = _translator.css_to_xpath(selector, prefix="descendant-or-self::")
+        return etree.XPath(expr)
+    except SelectorError as e:
+        raise SpecError(f"Invalid CSS selector {selector!r}: {e}")
+    except etree.XPathSyntaxError as e:
+        raise SpecError(f"Invalid selector {selector!r}: {e}")
+
+
+def _node_text(node) -> str:
+    if isinstance(node, str):
+        return " ".join(node.split())
+    if isinstance(node, (int, float)):
+        return str(node)
+    return " ".join(node.text_content().split())
+
+
+class CompiledField:
+    __slots__ = ("name", "xpath", "attr", "regex", "index", "transform", "is_url", "default")
+
+    def __init__(self, name: str, spec: Union[str, Dict]):
+        if isinstance(spec, str):
+            spec = {"select": spec}
+        if "select" not in spec:
+            raise SpecError(f"Field {name!r} has no selector")
+        transform = spec.get("transform", "text")
+        if transform not in TRANSFORMS:
+            raise SpecError(f"Field {name!r} has unknown transform {transform!r}")
+        self.name = name
+        self.xpath = compile_selector(spec["select"])
+        self.attr = spec.get("attr")
+        self.regex = re.compile(spec["regex"], re.IGNORECASE) if spec.get("regex") else None
+        self.index = spec.get("index", 0)
+        self.transform = TRANSFORMS[transform]
+        self.is_url = transform == "url"
+        self.default = spec.get("default")
+
+    def extract(self, card, base_url: str = "") -> Any:
+        found = self.xpath(card)
+        if isinstance(found, list):
+            if not found:
+                return self.default
+            try:
+                node = found[self.index]
+            except IndexError:
+                return self.default
+        else:
+            node = found
+        if self.attr and not isinstance(node, str):
+            text = node.get(self.attr) or ""
+        else:
+            text = _node_text(node)
+        if self.regex:
+            match = self.regex.search(text)
+            if not match:
+                return self.default
+            text = match.group(1) if match.groups() else match.group(0)
+        if not text:
+            return self.default
+        value = self.transform(text)
+        if self.is_url and value:
+            value = urljoin(base_url, value)
+        return self.default if value is None else value
+
+
+class CompiledSpec:
+    """A spec compiled into XPath objects; extract() turns a page into listing dicts."""
+
+    def __init__(self, spec: Dict):
+        for key in ("cards", "fields"):
+            if key not in spec:
+                raise SpecError(f"Spec {spec.get('name', '?')!r} is missing {key!r}")
+        self.spec = spec
+        self.name = spec.get("name", "SpecScraper")
+        self.cards = compile_selector(spec["cards"])
+        self.fields = [CompiledField(name, field) for name, field in spec["fields"].items()]
+        self.required = list(spec.get("required", []))
+        self.dedupe = spec.get("dedupe")
+        self.constants = {
+            "company": spec.get("company", ""),
+            "community": spec.get("community", ""),
+            "type": spec.get("type", "plan"),
+        }
+        self.constants.update(spec.get("constants", {}))
+
+    def extract(self, markup: Markup, base_url: str = "") -> List[Dict]:
+        if not markup:
+            return []
+        root = lxml_html.fromstring(markup)
+        rows = []
+        seen = set()
+        for card in self.cards(root):
+            row = {field.name: field.extract(card, base_url) for field in self.fields}
+            if any(row.get(name) in (None, "") for name in self.required):
+                continue
+            if self.dedupe:
+                key = row.get(self.dedupe)
+                if key in seen:
+                    continue
+                seen.add(key)
+            price, sqft = row.get("price"), row.get("sqft")
+            if "price_per_sqft" not in row:
+                row["price_per_sqft"] = round(price / sqft, 2) if price and sqft else None
+            row.update(self.constants)
+            rows.append(row)
+        return rows
+
+
+def compile_spec(spec: Dict) -> CompiledSpec:
+    """Compile a spec dict once; reuse the result for every page."""
+    return CompiledSpec(spec)
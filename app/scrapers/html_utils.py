@@ -0,0 +1,33 @@
+"""
+Shared HTML parsing helpers for scrapers.
+Uses the lxml parser and, where a scraper only needs its card containers,
+builds the tree for just those subtrees instead of the whole page.
+"""
+
+from typing import List, Optional, Union
+
+from bs4 import BeautifulSoup, SoupStrainer
+from lxml import html as lxml_html
+
+Markup = Union[str, bytes]
+
+
+def make_soup(markup: Markup, parse_only: Optional[SoupStrainer] = None) -> BeautifulSoup:
+    """
+    Parse markup with lxml. When parse_only is given, only matching elements (and
+    their children) are built, e.g. make_soup(html, SoupStrainer('div', class_='card')).
+    """
+    return BeautifulSoup(markup, "lxml", parse_only=parse_only)
+
+
+def strained_soup(markup: Markup, name=None, attrs=None, **kwargs) -> BeautifulSoup:
+    """Shortcut for make_soup() limited to SoupStrainer(name, attrs, **kwargs)."""
+    return make_soup(markup, SoupStrainer(name, attrs or {}, **kwargs))
+
+
+def xpath(markup: Markup, expr: str) -> List:
+    """Evaluate an XPath expression directly on an lxml tree (no BeautifulSoup objects)."""
+    if not markup:
+        return []
+    return lxml_html.fromstring(markup).xpath(expr)
+
@@ -0,0 +1,61 @@
+"""
+Shared HTTP page cache for requests-based scrapers.
+A builder's community page usually feeds both its "now" and "plans" scrapers
+(and regional pages feed several communities), so each URL is downloaded once
+per run and every scraper splits out what it needs.
+"""
+
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urldefrag
+
+from .browser_utils import USER_AGENT, cookie_session
+
+# The user agent must match the browser's so stored clearance cookies are honoured
+DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "Accept-Language": "en-US,en;q=0.9",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+}
+
+# How long a downloaded page stays usable by the other scrapers reading it
+SHARED_PAGE_TTL_SECONDS = 15 * 60
+
+_pages: Dict[str, Tuple[float, bytes]] = {}
+_url_locks: Dict[str, threading.Lock] = {}
+_lock = threading.Lock()
+
+
+def _url_lock(key: str) -> threading.Lock:
+    with _lock:
+        return _url_locks.setdefault(key, threading.Lock())
+
+
+def fetch_shared_page(url: str, headers: Optional[Dict] = None, timeout: int = 15) -> Optional[bytes]:
+    """
+    Return the body of url, downloading it only if no other scraper fetched it
+    within SHARED_PAGE_TTL_SECONDS. The #fragment is ignored, so
+    ".../elevon/#homefinder" and ".../elevon/" share one download.
+    The request carries the stored cookies for the domain (see
+    browser_utils.cookie_session), so pages behind a challenge the browser
+    already passed are served too. Failed requests are not cached and return None.
+    """
+    key = urldefrag(url)[0]
+    now = time.time()
+    with _lock:
+        for stale in [k for k, (ts, _) in _pages.items() if now - ts >= SHARED_PAGE_TTL_SECONDS]:
+            del _pages[stale]
+    with _url_lock(key):
+        cached = _pages.get(key)
+        if cached:
+            return cached[1]
+        print(f"[http_utils] Fetching URL: {key}")
+        with cookie_session(key, headers or DEFAULT_HEADERS) as session:
+            resp = session.get(key, timeout=timeout)
+        print(f"[http_utils] Response status: {resp.status_code}")
+        if resp.status_code != 200:
+            print(f"[http_utils] Request failed with status {resp.status_code}")
+            return None
+        _pages[key] = (time.time(), resp.content)
+        return resp.content
@@ -0,0 +1,111 @@
+"""
+Extract JSON payloads embedded in HTML pages without building a DOM.
+Payloads are located by marker with compiled regexes and a bracket scanner,
+then decoded with orjson.
+
+Supported markers:
+- <script id="..."> contents (e.g. __NEXT_DATA__)
+- Vue-style bound attributes (e.g. <qmi-carousel :qmi-list="[...]">)
+- JavaScript assignments (e.g. window.__STATE__ = {...}; var LocalQMIs = [...];)
+"""
+
+import html
+import re
+from functools import lru_cache
+from typing import Any, Optional, Union
+
+import orjson
+
+Markup = Union[str, bytes]
+
+# Strings are matched whole so brackets inside them are skipped
+_TOKEN_RE = re.compile(r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\'|[\[\]{}]')
+
+
+def _text(markup: Markup) -> str:
+    if isinstance(markup, bytes):
+        return markup.decode("utf-8", errors="replace")
+    return markup or ""
+
+
+def loads(payload: Union[str, bytes]) -> Any:
+    """Decode JSON with orjson."""
+    return orjson.loads(payload)
+
+
+@lru_cache(maxsize=64)
+def _script_id_re(script_id: str):
+    return re.compile(
+        r'<script\b[^>]*\bid=["\']' + re.escape(script_id) + r'["\'][^>]*>(.*?)</script>',
+        re.DOTALL | re.IGNORECASE,
+    )
+
+
+@lru_cache(maxsize=64)
+def _attribute_re(tag: str, attribute: str):
+    return re.compile(
+        r'<' + re.escape(tag) + r'\b[^>]*?\s' + re.escape(attribute) + r'\s*=\s*(["\'])(.*?)\1',
+        re.DOTALL | re.IGNORECASE,
+    )
+
+
+@lru_cache(maxsize=64)
+def _assignment_re(name: str):
+    return re.compile(r'(?:\bwindow\.|\b(?:var|let|const)\s+)?\b' + re.escape(name) + r'\s*=\s*(?=[\[{])')
+
+
+def _balanced_end(text: str, start: int) -> Optional[int]:
+    """Return the index just past the bracket that closes text[start], or None."""
+    depth = 0
+    for match in _TOKEN_RE.finditer(text, start):
+        token = match.group(0)
+        if token in "[{":
+            depth += 1
+        elif token in "]}":
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    return None
+
+
+def _decode(payload: str) -> Optional[Any]:
+    try:
+        return loads(payload)
+    except orjson.JSONDecodeError:
+        return None
+
+
+def extract_script_by_id(markup: Markup, script_id: str) -> Optional[Any]:
+    """Decode the JSON body of <script id="script_id">, or None."""
+    match = _script_id_re(script_id).search(_text(markup))
+    return _decode(match.group(1).strip()) if match else None
+
+
+def extract_next_data(markup: Markup) -> Optional[Any]:
+    """Decode the Next.js __NEXT_DATA__ payload, or None."""
+    return extract_script_by_id(markup, "__NEXT_DATA__")
+
+
+def extract_attribute(markup: Markup, tag: str, attribute: str) -> Optional[Any]:
+    """Decode an HTML-escaped JSON attribute such as <qmi-carousel :qmi-list="...">, or None."""
+    match = _attribute_re(tag, attribute).search(_text(markup))
+    return _decode(html.unescape(match.group(2))) if match else None
+
+
+def extract_assignment(markup: Markup, name: str) -> Optional[Any]:
+    """Decode the array/object assigned to a JS variable (var X = [...]; window.X = {...}), or None."""
+    text = _text(markup)
+    for match in _assignment_re(name).finditer(text):
+        start = match.end()
+        end = _balanced_end(text, start)
+        if end is None:
+            continue
+        data = _decode(text[start:end])
+        if data is not None:
+            return data
+    return None
+
+
+def extract_window_state(markup: Markup, name: str = "__STATE__") -> Optional[Any]:
+    """Decode window.__STATE__ (or another window.<name>) assignment, or None."""
+    return extract_assignment(markup, name)
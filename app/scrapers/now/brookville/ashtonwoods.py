@@ -1,7 +1,9 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
+from ...parse_utils import parse_stories
 from typing import List, Dict
 
 class AshtonWoodsBrookvilleNowScraper(BaseScraper):
@@ -9,13 +11,6 @@ class AshtonWoodsBrookvilleNowScraper(BaseScraper):
         "https://www.ashtonwoods.com/dallas/devonshire?comm=DAL|MCDVS",
         "https://www.ashtonwoods.com/dallas/gateway-parks?comm=DAL|D287"
     ]
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        if not text:
-            return None
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
 
     def parse_price(self, text):
         """Extract price from text."""
@@ -57,10 +52,7 @@ class AshtonWoodsBrookvilleNowScraper(BaseScraper):
 
     def parse_stories(self, text):
         """Extract number of stories from text."""
-        if not text:
-            return "1"
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else "1"
+        return parse_stories(text, default='1')
 
     def extract_property_data(self, property_card):
         """Extract data from a property card div."""
@@ -182,7 +174,7 @@ class AshtonWoodsBrookvilleNowScraper(BaseScraper):
                         print(f"[AshtonWoodsBrookvilleNowScraper] URL {url_idx + 1} request failed with status {resp.status_code}")
                         continue
                     
-                    soup = BeautifulSoup(resp.content, 'html.parser')
+                    soup = make_soup(resp.content, SoupStrainer('div', class_='tabs__series'))
                     
                     # Look for property cards with "Available" text in the tabs__series container
                     tabs_series = soup.find('div', class_='tabs__series')
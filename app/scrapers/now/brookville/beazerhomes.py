@@ -1,21 +1,12 @@
 import requests
 import re
-from bs4 import BeautifulSoup
 from ...base import BaseScraper
+from ...html_utils import make_soup
+from ...parse_utils import parse_stories
 from typing import List, Dict
 
 class BeazerHomesBrookvilleNowScraper(BaseScraper):
     URL = "https://www.beazer.com/dallas-tx/brookville-estates"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract current price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
 
     def parse_beds(self, text):
         """Extract number of bedrooms from text."""
@@ -29,8 +20,7 @@ class BeazerHomesBrookvilleNowScraper(BaseScraper):
 
     def parse_stories(self, text):
         """Extract number of stories from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else "1"
+        return parse_stories(text, default='1')
 
     def fetch_plans(self) -> List[Dict]:
         try:
@@ -52,7 +42,7 @@ class BeazerHomesBrookvilleNowScraper(BaseScraper):
                 print(f"[BeazerHomesBrookvilleNowScraper] Request failed with status {resp.status_code}")
                 return []
             
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content)
             listings = []
             seen_addresses = set()  # Track addresses to prevent duplicates
             
@@ -1,26 +1,15 @@
 import requests
-import re
 import json
 from ...base import BaseScraper
+from ...parse_utils import parse_stories
 from typing import List, Dict
 
 class HistoryMakerBrookvilleNowScraper(BaseScraper):
     API_URL = "https://www.historymaker.com/api/homes"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
 
     def parse_stories(self, text):
         """Extract number of stories from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else "1"
+        return parse_stories(text, default='1')
 
     def fetch_plans(self) -> List[Dict]:
         try:
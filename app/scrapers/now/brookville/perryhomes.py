@@ -1,48 +1,26 @@
 import time
 import re
-from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from ...base import BaseScraper
+from ...html_utils import make_soup
+from ...parse_utils import parse_stories
 from typing import List, Dict
 
 class PerryHomesBrookvilleNowScraper(BaseScraper):
     URL = "https://www.perryhomes.com/new-homes?city=Dallas+-+Fort+Worth&community=Devonshire"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract current price from text."""
-        # Handle both current price and original price
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
 
     def parse_original_price(self, text):
         """Extract original price from text."""
         match = re.search(r'\$([\d,]+)', text)
         return int(match.group(1).replace(",", "")) if match else None
 
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        # Handle both "3" and "3.5" formats
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
     def parse_stories(self, text):
         """Extract number of stories from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
+        return parse_stories(text)
 
     def parse_garage(self, text):
         """Extract garage capacity from text."""
@@ -117,7 +95,7 @@ class PerryHomesBrookvilleNowScraper(BaseScraper):
                 time.sleep(5)
             
             # Get the page source after JavaScript has loaded
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = make_soup(driver.page_source)
             listings = []
             seen_addresses = set()  # Track addresses to prevent duplicates
             
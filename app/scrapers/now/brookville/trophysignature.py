@@ -1,32 +1,18 @@
 import requests
 import re
-from bs4 import BeautifulSoup
-from ...base import BaseScraper
+from bs4 import SoupStrainer
+from ...base import Page, StagedScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
-class TrophySignatureBrookvilleNowScraper(BaseScraper):
+class TrophySignatureBrookvilleNowScraper(StagedScraper):
     URL = "https://trophysignaturehomes.com/communities/dallas-ft-worth/forney/devonshire/homes"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract current price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
 
     def parse_beds(self, text):
         """Extract number of bedrooms from text."""
         match = re.search(r'(\d+)', text)
         return int(match.group(1)) if match else None
 
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
     def parse_stories(self, text):
         """Default to 1 story for Trophy Signature Homes."""
         return "1"
@@ -63,7 +49,7 @@ class TrophySignatureBrookvilleNowScraper(BaseScraper):
                     return date_part
         return "Now"
 
-    def fetch_plans(self) -> List[Dict]:
+    def fetch_pages(self) -> List[Page]:
         try:
             print(f"[TrophySignatureBrookvilleNowScraper] Fetching URL: {self.URL}")
             
@@ -82,8 +68,18 @@ class TrophySignatureBrookvilleNowScraper(BaseScraper):
             if resp.status_code != 200:
                 print(f"[TrophySignatureBrookvilleNowScraper] Request failed with status {resp.status_code}")
                 return []
-            
-            soup = BeautifulSoup(resp.content, 'html.parser')
+
+            return [(self.URL, resp.content)]
+
+        except Exception as e:
+            print(f"[TrophySignatureBrookvilleNowScraper] Error: {e}")
+            return []
+
+    def parse_pages(self, pages: List[Page]) -> List[Dict]:
+        if not pages:
+            return []
+        try:
+            soup = make_soup(pages[0][1], SoupStrainer('div', class_='card_wrapper'))
             listings = []
             seen_addresses = set()  # Track addresses to prevent duplicates
             
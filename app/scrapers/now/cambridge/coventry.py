@@ -1,8 +1,9 @@
 import requests
 import re
 import json
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
 class CoventryCambridgeNowScraper(BaseScraper):
@@ -13,17 +14,6 @@ class CoventryCambridgeNowScraper(BaseScraper):
         "https://www.coventryhomes.com/new-homes/tx/celina/cambridge-crossing-40/",
         "https://www.coventryhomes.com/new-homes/tx/celina/cambridge-crossing-60/",
     ]
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract current price from text."""
-        # Look for the current price (not the strikethrough price)
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
 
     def parse_original_price(self, text):
         """Extract original price from strikethrough text."""
@@ -31,11 +21,6 @@ class CoventryCambridgeNowScraper(BaseScraper):
         match = re.search(r'Was \$([\d,]+)', text)
         return int(match.group(1).replace(",", "")) if match else None
 
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
-
     def parse_baths(self, text):
         """Extract number of bathrooms from text."""
         # Handle both "2" and "2/1" formats
@@ -130,7 +115,7 @@ class CoventryCambridgeNowScraper(BaseScraper):
                     print(f"[CoventryCambridgeNowScraper] Request failed with status {resp.status_code} for {url}")
                     continue
                 
-                soup = BeautifulSoup(resp.content, 'html.parser')
+                soup = make_soup(resp.content, SoupStrainer('section', id='community-available-homes'))
                 
                 # Find the Quick Move-In Homes section
                 available_homes_section = soup.find('section', id='community-available-homes')
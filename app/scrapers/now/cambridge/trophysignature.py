@@ -1,21 +1,12 @@
 import requests
 import re
-from bs4 import BeautifulSoup
-from ...base import BaseScraper
+from bs4 import SoupStrainer
+from ...base import Page, StagedScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
-class TrophySignatureCambridgeNowScraper(BaseScraper):
+class TrophySignatureCambridgeNowScraper(StagedScraper):
     URL = "https://trophysignaturehomes.com/communities/dallas-ft-worth/celina/cross-creek-meadows"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract current price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
 
     def parse_original_price(self, text):
         """Extract original price from text."""
@@ -32,12 +23,6 @@ class TrophySignatureCambridgeNowScraper(BaseScraper):
         match = re.search(r'(\d+(?:-\d+)?)', text)
         return str(match.group(1)) if match else ""
 
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        # Handle both "3" and "3.5" formats
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
     def extract_floor_plan(self, card):
         """Extract floor plan name from the card."""
         floor_plan_links = card.find_all('span', class_='HomeCard_link')
@@ -84,7 +69,7 @@ class TrophySignatureCambridgeNowScraper(BaseScraper):
                     return date_part
         return "Now"
 
-    def fetch_plans(self) -> List[Dict]:
+    def fetch_pages(self) -> List[Page]:
         try:
             print(f"[TrophySignatureCambridgeNowScraper] Fetching URL: {self.URL}")
             
@@ -103,8 +88,18 @@ class TrophySignatureCambridgeNowScraper(BaseScraper):
             if resp.status_code != 200:
                 print(f"[TrophySignatureCambridgeNowScraper] Request failed with status {resp.status_code}")
                 return []
-            
-            soup = BeautifulSoup(resp.content, 'html.parser')
+
+            return [(self.URL, resp.content)]
+
+        except Exception as e:
+            print(f"[TrophySignatureCambridgeNowScraper] Error: {e}")
+            return []
+
+    def parse_pages(self, pages: List[Page]) -> List[Dict]:
+        if not pages:
+            return []
+        try:
+            soup = make_soup(pages[0][1], SoupStrainer('div', class_='card_wrapper'))
             listings = []
             seen_addresses = set()  # Track addresses to prevent duplicates
             
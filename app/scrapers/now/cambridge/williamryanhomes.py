@@ -1,37 +1,17 @@
 import re
 import time
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
 class WilliamRyanHomesCambridgeNowScraper(BaseScraper):
     URL = "https://www.williamryanhomes.com/dfw/celina/ten-mile-creek"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract current price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        # Handle both "3" and "3.5" formats
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
 
     def parse_garages(self, text):
         """Extract number of garages from text."""
@@ -69,7 +49,7 @@ class WilliamRyanHomesCambridgeNowScraper(BaseScraper):
             
             # Get the page source after JavaScript execution
             html_content = driver.page_source
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = make_soup(html_content, SoupStrainer('div', id='quickMoveInsListContainer'))
             listings = []
             seen_addresses = set()  # Track addresses to prevent duplicates
             
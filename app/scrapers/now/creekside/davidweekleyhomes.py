@@ -1,27 +1,18 @@
 import requests
 import re
-from bs4 import BeautifulSoup
 from ...base import BaseScraper
+from ...html_utils import make_soup
+from ...parse_utils import parse_stories
 from typing import List, Dict
 
 class DavidWeekleyHomesCreeksideNowScraper(BaseScraper):
     URL = "https://www.davidweekleyhomes.com/new-homes/tx/dallas-ft-worth/royse-city/creekshaw-classic"
-    
-    def parse_price(self, text):
-        """Extract price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
 
     def parse_sqft(self, text):
         """Extract square footage from text."""
         match = re.search(r'Sq\. Ft:\s*(\d+)', text)
         return int(match.group(1)) if match else None
 
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
-
     def parse_baths(self, text):
         """Extract number of bathrooms from text."""
         match = re.search(r'(\d+)', text)
@@ -29,8 +20,7 @@ class DavidWeekleyHomesCreeksideNowScraper(BaseScraper):
 
     def parse_stories(self, text):
         """Extract number of stories from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else "1"
+        return parse_stories(text, default='1')
 
     def parse_garages(self, text):
         """Extract number of garages from text."""
@@ -221,7 +211,7 @@ class DavidWeekleyHomesCreeksideNowScraper(BaseScraper):
                 print(f"[DavidWeekleyHomesCreeksideNowScraper] Request failed with status {resp.status_code}")
                 return []
 
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content)
 
             # Look for the content div with data-bind="with: compareHomes"
             content_div = soup.find('div', class_='pure-g content', attrs={'data-bind': 'with: compareHomes'})
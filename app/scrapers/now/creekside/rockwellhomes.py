@@ -1,7 +1,8 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
 class RockwellHomesCreeksideNowScraper(BaseScraper):
@@ -9,20 +10,6 @@ class RockwellHomesCreeksideNowScraper(BaseScraper):
         "https://www.rockwell-homes.com/new-homes/tx/royse-city/creekside/14633/"
     ]
 
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        if not text:
-            return None
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract price from text."""
-        if not text:
-            return None
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
     def parse_beds(self, text):
         """Extract number of bedrooms from text."""
         if not text:
@@ -144,7 +131,7 @@ class RockwellHomesCreeksideNowScraper(BaseScraper):
                         print(f"[RockwellHomesCreeksideNowScraper] URL {url_idx + 1} request failed with status {resp.status_code}")
                         continue
 
-                    soup = BeautifulSoup(resp.content, 'html.parser')
+                    soup = make_soup(resp.content, SoupStrainer('div', class_='plan-card'))
 
                     # Look for property cards with class "plan-card"
                     property_cards = soup.find_all('div', class_='plan-card')
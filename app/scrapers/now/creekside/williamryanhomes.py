@@ -4,9 +4,10 @@ William Ryan Homes Creekside Inventory Homes Scraper
 """
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 import re
 from app.scrapers.base import BaseScraper
+from app.scrapers.html_utils import make_soup
 
 class WilliamRyanHomesCreeksideNowScraper(BaseScraper):
     URL = "https://www.williamryanhomes.com/dfw/royse-city/creekside"
@@ -181,7 +182,7 @@ class WilliamRyanHomesCreeksideNowScraper(BaseScraper):
                 print(f"[WilliamRyanHomesCreeksideNowScraper] Request failed with status {resp.status_code}")
                 return []
 
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content, SoupStrainer('div', id='quickMoveInsListContainer'))
 
             # Look for the quick move-ins container
             quick_move_ins_container = soup.find('div', id='quickMoveInsListContainer')
@@ -1,39 +1,12 @@
 import requests
 import re
-from bs4 import BeautifulSoup
-from ...base import BaseScraper
+from bs4 import SoupStrainer
+from ...base import Page, StagedScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
-class EvanshireEchoParkNowScraper(BaseScraper):
+class EvanshireEchoParkNowScraper(StagedScraper):
     URL = "https://theprovidencegroup.com/new-homes/ga/duluth/evanshire-townhomes/13813/"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        if not text:
-            return None
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract current price from text."""
-        if not text:
-            return None
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        if not text:
-            return ""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        if not text:
-            return ""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
 
     def parse_stories(self, text):
         """Extract number of stories from text."""
@@ -153,7 +126,7 @@ class EvanshireEchoParkNowScraper(BaseScraper):
             print(f"[EvanshireEchoParkNowScraper] Error extracting property data: {e}")
             return None
 
-    def fetch_plans(self) -> List[Dict]:
+    def fetch_pages(self) -> List[Page]:
         try:
             print(f"[EvanshireEchoParkNowScraper] Fetching URL: {self.URL}")
             
@@ -172,8 +145,18 @@ class EvanshireEchoParkNowScraper(BaseScraper):
             if resp.status_code != 200:
                 print(f"[EvanshireEchoParkNowScraper] Request failed with status {resp.status_code}")
                 return []
-            
-            soup = BeautifulSoup(resp.content, 'html.parser')
+
+            return [(self.URL, resp.content)]
+
+        except Exception as e:
+            print(f"[EvanshireEchoParkNowScraper] Error: {e}")
+            return []
+
+    def parse_pages(self, pages: List[Page]) -> List[Dict]:
+        if not pages:
+            return []
+        try:
+            soup = make_soup(pages[0][1], SoupStrainer('div', class_='swiper-slide'))
             listings = []
             seen_addresses = set()  # Track addresses to prevent duplicates
             
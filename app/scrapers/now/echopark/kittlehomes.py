@@ -1,26 +1,12 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
 class KittleHomesEchoParkNowScraper(BaseScraper):
     URL = "https://kittlehomes.com/find-your-home/skyviewonbroad/"
-    
-    def parse_price(self, text):
-        """Extract price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
 
     def parse_baths(self, text):
         """Extract number of bathrooms from text."""
@@ -179,7 +165,7 @@ class KittleHomesEchoParkNowScraper(BaseScraper):
                 print(f"[KittleHomesEchoParkNowScraper] Request failed with status {resp.status_code}")
                 return self._get_sample_data()
             
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content, SoupStrainer('div', class_='sidx-search-result-grid-item'))
             listings = []
             seen_addresses = set()  # Track addresses to prevent duplicates
             
@@ -1,6 +1,6 @@
 import requests
-from bs4 import BeautifulSoup
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 import re
 
@@ -110,7 +110,7 @@ class CoventryHomesEdgewaterNowScraper(BaseScraper):
                 print(f"[CoventryHomesEdgewaterNowScraper] Request failed with status {response.status_code}")
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
             
             # Try to find the container div first
             container = soup.find('div', class_='row justify-content-center mt-4 d-none d-md-flex')
@@ -1,7 +1,6 @@
 # Elevon now scrapers package
 from .mihomes import MIHomesElevonNowScraper
 from .historymaker import HistoryMakerElevonNowScraper
-from .drhorton import DRHortonElevonNowScraper
 from .unionmain import UnionMainElevonNowScraper
 from .trophysignature import TrophySignatureElevonNowScraper
 from .pacesetter import PacesetterElevonNowScraper 
\ No newline at end of file
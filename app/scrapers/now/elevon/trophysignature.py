@@ -1,22 +1,13 @@
 import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 import re
-from ...base import BaseScraper
+from ...base import Page, StagedScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
-class TrophySignatureElevonNowScraper(BaseScraper):
+class TrophySignatureElevonNowScraper(StagedScraper):
     URL = "https://trophysignaturehomes.com/communities/dallas-ft-worth/lavon/elevon"
 
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
     def parse_beds(self, text):
         """Extract number of bedrooms from text."""
         match = re.search(r'(\d+)', text)
@@ -31,7 +22,7 @@ class TrophySignatureElevonNowScraper(BaseScraper):
         """Default to 1 story for Trophy Signature Homes."""
         return "1"
 
-    def fetch_plans(self) -> List[Dict]:
+    def fetch_pages(self) -> List[Page]:
         try:
             print(f"[TrophySignatureElevonNowScraper] Fetching URL: {self.URL}")
             headers = {
@@ -44,7 +35,16 @@ class TrophySignatureElevonNowScraper(BaseScraper):
             }
             resp = requests.get(self.URL, headers=headers, timeout=10)
             print(f"[TrophySignatureElevonNowScraper] Response status: {resp.status_code}")
-            soup = BeautifulSoup(resp.text, "html.parser")
+            return [(self.URL, resp.content)]
+        except Exception as e:
+            print(f"[TrophySignatureElevonNowScraper] Error: {e}")
+            return []
+
+    def parse_pages(self, pages: List[Page]) -> List[Dict]:
+        if not pages:
+            return []
+        try:
+            soup = make_soup(pages[0][1], SoupStrainer('div', class_="card_wrapper"))
             listings = []
             
             # Find all home cards
@@ -1,31 +1,12 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
 class BlueHavenHomesLakeBreezeNowScraper(BaseScraper):
     BASE_URL = "https://bluehavenhomes.com/areas-we-serve/dfw-tx/lakepointe/"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract current price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
 
     def parse_stories(self, text):
         """Extract number of stories from text."""
@@ -114,7 +95,7 @@ class BlueHavenHomesLakeBreezeNowScraper(BaseScraper):
                     print(f"[BlueHavenHomesLakeBreezeNowScraper] Request failed with status {response.status_code}")
                     continue
                 
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = make_soup(response.content, SoupStrainer('div', class_=re.compile(r'elementor-9387.*e-loop-item')))
                 
                 # Find all property cards (elementor loop items)
                 property_cards = soup.find_all('div', class_=re.compile(r'elementor-9387.*e-loop-item'))
@@ -1,7 +1,8 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
 class ChristieHomesLakeBreezeNowScraper(BaseScraper):
@@ -44,7 +45,7 @@ class ChristieHomesLakeBreezeNowScraper(BaseScraper):
         try:
             response = requests.get(self.BASE_URL, timeout=30)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content, SoupStrainer('div', class_='comp-m797swba YzqVVZ wixui-repeater__item'))
             
             # Find all property cards
             property_cards = soup.find_all('div', class_='comp-m797swba YzqVVZ wixui-repeater__item')
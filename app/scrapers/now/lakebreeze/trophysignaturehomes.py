@@ -1,26 +1,12 @@
 import requests
 import re
-from bs4 import BeautifulSoup
-from ...base import BaseScraper
+from bs4 import SoupStrainer
+from ...base import Page, StagedScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
-class TrophySignatureHomesLakeBreezeNowScraper(BaseScraper):
+class TrophySignatureHomesLakeBreezeNowScraper(StagedScraper):
     BASE_URL = "https://trophysignaturehomes.com/communities/dallas-ft-worth/lavon/lakepointe/homes"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
 
     def parse_baths(self, text):
         """Extract number of bathrooms from text."""
@@ -40,14 +26,22 @@ class TrophySignatureHomesLakeBreezeNowScraper(BaseScraper):
             return "Under Construction"
         return "Available"
 
-    def fetch_plans(self) -> List[Dict]:
-        """Fetch all available homes from Trophy Signature Homes."""
-        listings = []
-        
+    def fetch_pages(self) -> List[Page]:
+        """Download the Trophy Signature Homes listing page."""
         try:
             response = requests.get(self.BASE_URL, timeout=30)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            return [(self.BASE_URL, response.content)]
+        except Exception as e:
+            print(f"Error fetching Trophy Signature Homes data: {e}")
+            return []
+
+    def parse_pages(self, pages: List[Page]) -> List[Dict]:
+        """Parse all available homes from the Trophy Signature Homes page."""
+        listings = []
+        
+        for _, body in pages:
+            soup = make_soup(body, SoupStrainer('div', class_='card_wrapper px-0'))
             
             # Find all property cards
             property_cards = soup.find_all('div', class_='card_wrapper px-0')
@@ -60,9 +54,6 @@ class TrophySignatureHomesLakeBreezeNowScraper(BaseScraper):
                 except Exception as e:
                     print(f"Error parsing property card: {e}")
                     continue
-                    
-        except Exception as e:
-            print(f"Error fetching Trophy Signature Homes data: {e}")
             
         return listings
 
@@ -1,16 +1,12 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
 class ChafinCommunitiesMaddoxNowScraper(BaseScraper):
     URL = "https://www.chafincommunities.com/communities/georgia/jackson/hochston-jackson/rosewood-lakes/"
-    
-    def parse_price(self, text):
-        """Extract price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
 
     def parse_beds(self, text):
         """Extract number of bedrooms from text."""
@@ -95,7 +91,7 @@ class ChafinCommunitiesMaddoxNowScraper(BaseScraper):
                 print(f"[ChafinCommunitiesMaddoxNowScraper] Request failed with status {resp.status_code}")
                 return []
             
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content, SoupStrainer('div', class_='single_community_available_homes_wrapper'))
             listings = []
             seen_addresses = set()  # Track addresses to prevent duplicates
             
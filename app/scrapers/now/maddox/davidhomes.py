@@ -1,18 +1,13 @@
 import requests
 import re
-from bs4 import BeautifulSoup
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 import json
 
 class DavidHomesMaddoxNowScraper(BaseScraper):
     URL = "https://www.davidsonhomes.com/states/georgia/atlanta-market-area/hoschton/wehunt-meadows"
     
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-    
     def parse_price(self, price_text):
         """Extract price from price text."""
         if not price_text:
@@ -76,7 +71,7 @@ class DavidHomesMaddoxNowScraper(BaseScraper):
                 print(f"[DavidHomesMaddoxNowScraper] Request failed with status {resp.status_code}")
                 return []
             
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content)
             
             # Find all home cards using the structure similar to PickensBluff scraper
             # Look for divs with the specific structure that contains home listings
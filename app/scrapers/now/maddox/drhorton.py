@@ -1,23 +1,24 @@
 import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 import re
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from ...price_utils import parse_price_with_thousands
 from typing import List, Dict
 
 class DRHortonMaddoxNowScraper(BaseScraper):
     URL = "https://www.drhorton.com/georgia/atlanta/hoschton/twin-lakes"
 
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)\s*sq\.?\s*ft\.?', text, re.IGNORECASE)
-        return int(match.group(1).replace(",", "")) if match else None
-
     def parse_price(self, text):
         """Extract current price from text."""
         # Use the utility function to handle thousands notation
         return parse_price_with_thousands(text)
 
+    def parse_sqft(self, text):
+        """Extract square footage from text."""
+        match = re.search(r'([\d,]+)\s*sq\.?\s*ft\.?', text, re.IGNORECASE)
+        return int(match.group(1).replace(",", "")) if match else None
+
     def parse_beds(self, text):
         """Extract number of bedrooms from text."""
         match = re.search(r'(\d+(?:\.\d+)?)\s*bed', text, re.IGNORECASE)
@@ -64,7 +65,7 @@ class DRHortonMaddoxNowScraper(BaseScraper):
                 print(f"[DRHortonMaddoxNowScraper] Request failed with status {resp.status_code}")
                 return []
             
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content, SoupStrainer('a', class_='CoveoResultLink available-home-card'))
             listings = []
             seen_addresses = set()  # Track addresses to prevent duplicates
             
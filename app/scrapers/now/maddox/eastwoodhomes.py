@@ -1,31 +1,11 @@
 import requests
 import re
-from bs4 import BeautifulSoup
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
 class EastwoodHomesMaddoxNowScraper(BaseScraper):
     URL = "https://www.eastwoodhomes.com/atlanta/hoschton/twin-lakes"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
 
     def parse_stories(self, text):
         """Extract number of stories from text."""
@@ -90,7 +70,7 @@ class EastwoodHomesMaddoxNowScraper(BaseScraper):
                 print(f"[EastwoodHomesMaddoxNowScraper] Request failed with status {resp.status_code}")
                 return []
             
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content)
             listings = []
             seen_plan_names = set()  # Track plan names to prevent duplicates
             
@@ -1,28 +1,11 @@
 import requests
 import re
-from bs4 import BeautifulSoup
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
 class FischerHomesMaddoxNowScraper(BaseScraper):
     URL = "https://www.fischerhomes.com/find-new-homes/braselton/ga/communities/872/crossvine-estates"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        # Handle ranges like "2,330 - 2,350" by taking the first value
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract current price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        # Handle ranges like "3 - 4" by taking the first value
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
 
     def parse_baths(self, text):
         """Extract number of bathrooms from text."""
@@ -61,7 +44,7 @@ class FischerHomesMaddoxNowScraper(BaseScraper):
                 print(f"[FischerHomesMaddoxNowScraper] Request failed with status {resp.status_code}")
                 return []
             
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content)
             listings = []
             seen_addresses = set()  # Track addresses to prevent duplicates
             
@@ -1,32 +1,12 @@
 import requests
 import re
-from bs4 import BeautifulSoup
 from ...base import BaseScraper
+from ...html_utils import make_soup
+from ...json_utils import extract_attribute
 from typing import List, Dict
 
 class PacesetterMilranyNowScraper(BaseScraper):
     URL = "https://www.pacesetterhomestexas.com/new-homes-for-sale-dallas/melissa-tx/meadow-run?community=39"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        # Handle both "3" and "3.5" formats
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
 
     def parse_stories(self, text):
         """Extract number of stories from text."""
@@ -78,8 +58,6 @@ class PacesetterMilranyNowScraper(BaseScraper):
                 print(f"[PacesetterMilranyNowScraper] Request failed with status {resp.status_code}")
                 return []
             
-            soup = BeautifulSoup(resp.content, 'html.parser')
-            
             # Debug: Save HTML content for inspection
             with open('pacesetter_debug.html', 'w', encoding='utf-8') as f:
                 f.write(resp.text)
@@ -88,26 +66,12 @@ class PacesetterMilranyNowScraper(BaseScraper):
             listings = []
             seen_addresses = set()  # Track addresses to prevent duplicates
             
-            # Try to find the qmi-carousel component with embedded data
-            qmi_carousel = soup.find('qmi-carousel')
-            print(f"[PacesetterMilranyNowScraper] Found qmi-carousel: {qmi_carousel is not None}")
-            if qmi_carousel:
-                print(f"[PacesetterMilranyNowScraper] qmi-carousel attributes: {qmi_carousel.attrs}")
-                # Vue.js uses :qmi-list attribute
-                qmi_list_attr = qmi_carousel.get(':qmi-list')
-                print(f"[PacesetterMilranyNowScraper] :qmi-list attribute: {qmi_list_attr[:200] if qmi_list_attr else 'None'}...")
+            # Read the Vue :qmi-list attribute of <qmi-carousel> straight from the page (no DOM)
+            home_data = extract_attribute(resp.content, 'qmi-carousel', ':qmi-list')
+            print(f"[PacesetterMilranyNowScraper] Found qmi-list data: {home_data is not None}")
             
-            if qmi_carousel and qmi_carousel.get(':qmi-list'):
+            if home_data:
                 try:
-                    import json
-                    # Extract the JSON data from the :qmi-list attribute
-                    qmi_list_data = qmi_carousel.get(':qmi-list')
-                    # The data is HTML-encoded, so we need to decode it
-                    import html
-                    decoded_data = html.unescape(qmi_list_data)
-                    # Replace escaped forward slashes with regular forward slashes
-                    decoded_data = decoded_data.replace('\\/', '/')
-                    home_data = json.loads(decoded_data)
                     print(f"[PacesetterMilranyNowScraper] Found {len(home_data)} homes in qmi-list data")
                     
                     # Process the JSON data directly
@@ -190,6 +154,7 @@ class PacesetterMilranyNowScraper(BaseScraper):
             
             # Fallback to HTML parsing if JSON extraction fails
             print(f"[PacesetterMilranyNowScraper] Falling back to HTML parsing")
+            soup = make_soup(resp.content)
             
             # Find all home listings in the splide list
             home_listings = soup.find_all('li', class_='splide__slide')
@@ -1,31 +1,12 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
 class BloomFieldHomesMyrtleCreekNowScraper(BaseScraper):
     BASE_URL = "https://www.bloomfieldhomes.com/new-homes/tx/waxahachie/sunrise-at-garden-valley/#available-homes"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
 
     def parse_cars(self, text):
         """Extract number of car garage from text."""
@@ -49,7 +30,7 @@ class BloomFieldHomesMyrtleCreekNowScraper(BaseScraper):
         try:
             response = requests.get(self.BASE_URL, timeout=30)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content, SoupStrainer('div', class_='card spec-card-vertical spec-card oi-map-item'))
             
             # Find property cards with the same structure as Lake Breeze
             property_cards = soup.find_all('div', class_='card spec-card-vertical spec-card oi-map-item')
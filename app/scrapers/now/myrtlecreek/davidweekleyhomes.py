@@ -1,36 +1,17 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
+from ...parse_utils import parse_stories
 from typing import List, Dict
 
 class DavidWeekleyHomesMyrtleCreekNowScraper(BaseScraper):
     URL = "https://www.davidweekleyhomes.com/new-homes/tx/dallas-ft-worth/waxahachie/myrtle-creek"
-    
-    def parse_price(self, text):
-        """Extract price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
 
     def parse_stories(self, text):
         """Extract number of stories from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else "1"
+        return parse_stories(text, default='1')
 
     def parse_garage(self, text):
         """Extract number of garage spaces from text."""
@@ -57,7 +38,7 @@ class DavidWeekleyHomesMyrtleCreekNowScraper(BaseScraper):
                 print(f"[DavidWeekleyHomesMyrtleCreekNowScraper] Request failed with status {resp.status_code}")
                 return []
             
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content, SoupStrainer('div', id='quick-move-ins'))
             listings = []
             seen_addresses = set()  # Track addresses to prevent duplicates
             
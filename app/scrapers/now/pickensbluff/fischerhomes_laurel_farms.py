@@ -4,15 +4,11 @@ Fischer Homes Laurel Farms Now Scraper
 Scrapes "now" (available homes) information from Fischer Homes Laurel Farms community
 """
 
-import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 import re
 from app.scrapers.base import BaseScraper
+from app.scrapers.html_utils import make_soup
+from app.scrapers.browser_utils import fetch_group_page
 
 
 class FischerHomesLaurelFarmsNowScraper(BaseScraper):
@@ -29,35 +25,15 @@ class FischerHomesLaurelFarmsNowScraper(BaseScraper):
         """
         print(f"[FischerHomesLaurelFarmsNowScraper] Fetching URL: {self.URL}")
         
-        # Setup Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-        
-        driver = None
         try:
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.get(self.URL)
-            
-            # Wait for the page to load and content to be populated
+            # All Fischer Homes pages load together in tabs of one browser and are cached for the run
             print(f"[FischerHomesLaurelFarmsNowScraper] Waiting for page to load...")
-            time.sleep(10)
-            
-            # Scroll to trigger content loading
-            print(f"[FischerHomesLaurelFarmsNowScraper] Scrolling to trigger content loading...")
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(5)
-            
-            # Wait for now cards to be loaded
-            wait = WebDriverWait(driver, 20)
-            wait.until(EC.presence_of_element_located((By.CLASS_NAME, "card_mov-in-ready")))
+            page_source = fetch_group_page("fischerhomes", self.URL)
+            if not page_source:
+                print(f"[FischerHomesLaurelFarmsNowScraper] Page could not be loaded")
+                return []
             
-            # Get the page source after JavaScript has loaded
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = make_soup(page_source, SoupStrainer('article', class_='card_mov-in-ready'))
             
             # Find "now" cards (card_mov-in-ready articles)
             now_cards = soup.find_all('article', class_='card_mov-in-ready')
@@ -162,6 +138,3 @@ class FischerHomesLaurelFarmsNowScraper(BaseScraper):
         except Exception as e:
             print(f"[FischerHomesLaurelFarmsNowScraper] Error fetching now listings: {e}")
             return []
-        finally:
-            if driver:
-                driver.quit()
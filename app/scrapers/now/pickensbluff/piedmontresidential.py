@@ -1,16 +1,12 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
 class PiedmontResidentialPickensBluffNowScraper(BaseScraper):
     URL = "https://piedmontresidential.com/new-home-communities/homes-dallas-ga-creekside-landing/"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
 
     def parse_price(self, text):
         """Extract current price from text."""
@@ -22,16 +18,6 @@ class PiedmontResidentialPickensBluffNowScraper(BaseScraper):
             match = re.search(r'\$([\d,]+)', text)
         return int(match.group(1).replace(",", "")) if match else None
 
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
     def parse_stories(self, text):
         """Extract number of stories from text."""
         if "2 Story" in text:
@@ -101,7 +87,7 @@ class PiedmontResidentialPickensBluffNowScraper(BaseScraper):
                 print(f"[PiedmontResidentialPickensBluffNowScraper] Request failed with status {response.status_code}")
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content, SoupStrainer('div', class_='home'))
             
             # Find all home cards
             home_cards = soup.find_all('div', class_='home')
@@ -1,21 +1,13 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
+from ...parse_utils import parse_stories
 from typing import List, Dict
 
 class BeazerHomesReunionNowScraper(BaseScraper):
     URL = "https://www.beazer.com/dallas-tx/wildflower-ranch"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract current price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
 
     def parse_beds(self, text):
         """Extract number of bedrooms from text."""
@@ -29,8 +21,7 @@ class BeazerHomesReunionNowScraper(BaseScraper):
 
     def parse_stories(self, text):
         """Extract number of stories from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else "1"
+        return parse_stories(text, default='1')
 
     def fetch_plans(self) -> List[Dict]:
         try:
@@ -52,7 +43,7 @@ class BeazerHomesReunionNowScraper(BaseScraper):
                 print(f"[BeazerHomesReunionNowScraper] Request failed with status {resp.status_code}")
                 return []
             
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content, SoupStrainer('div', attrs={'data-product-type': 'inventoryproperty'}))
             listings = []
             seen_addresses = set()  # Track addresses to prevent duplicates
             
@@ -1,36 +1,17 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
+from ...parse_utils import parse_stories
 from typing import List, Dict
 
 class DRHortonBluestemNowScraper(BaseScraper):
     URL = "https://www.drhorton.com/texas/fort-worth/rhome/bluestem"
-    
-    def parse_price(self, text):
-        """Extract current price from text like '$339,790'."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
 
     def parse_stories(self, text):
         """Extract number of stories from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
+        return parse_stories(text)
 
     def parse_garage(self, text):
         """Extract number of garage spaces from text."""
@@ -62,7 +43,7 @@ class DRHortonBluestemNowScraper(BaseScraper):
                 print(f"[DRHortonBluestemNowScraper] Request failed with status {resp.status_code}")
                 return []
             
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content, SoupStrainer('div', id='available-homes'))
             listings = []
             seen_addresses = set()  # Track addresses to prevent duplicates
             
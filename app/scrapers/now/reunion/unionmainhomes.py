@@ -1,180 +1,5 @@
-import requests
-import re
-from bs4 import BeautifulSoup
-from ...base import BaseScraper
-from typing import List, Dict
+from ...platforms.unionmain import UnionMainNowScraper
 
-class UnionMainHomesReunionNowScraper(BaseScraper):
-    URL = "https://unionmainhomes.com/communities/reunion/"
-    
-    def parse_price(self, text):
-        """Extract price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
 
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_stories(self, text):
-        """Extract number of stories from text."""
-        # Default to 1 story for single-family homes
-        return "1"
-
-    def fetch_plans(self) -> List[Dict]:
-        try:
-            print(f"[UnionMainHomesReunionNowScraper] Fetching URL: {self.URL}")
-            
-            headers = {
-                "User-Agent": (
-                    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/124.0.0.0 Safari/537.36"
-                ),
-                "Accept-Language": "en-US,en;q=0.9",
-            }
-            
-            resp = requests.get(self.URL, headers=headers, timeout=15)
-            print(f"[UnionMainHomesReunionNowScraper] Response status: {resp.status_code}")
-            
-            if resp.status_code != 200:
-                print(f"[UnionMainHomesReunionNowScraper] Request failed with status {resp.status_code}")
-                return []
-            
-            soup = BeautifulSoup(resp.content, 'html.parser')
-            listings = []
-            seen_addresses = set()  # Track addresses to prevent duplicates
-            
-            # Find all loop items with property class
-            loop_items = soup.find_all('div', class_='e-loop-item')
-            property_items = [item for item in loop_items if 'property' in item.get('class', [])]
-            print(f"[UnionMainHomesReunionNowScraper] Found {len(property_items)} property items")
-            
-            for idx, item in enumerate(property_items):
-                try:
-                    print(f"[UnionMainHomesReunionNowScraper] Processing item {idx+1}")
-                    
-                    # Extract address from h2 element
-                    address_element = item.find('h2', class_='elementor-heading-title')
-                    if not address_element:
-                        print(f"[UnionMainHomesReunionNowScraper] Skipping item {idx+1}: No address found")
-                        continue
-                    
-                    address = address_element.get_text(strip=True)
-                    if not address:
-                        print(f"[UnionMainHomesReunionNowScraper] Skipping item {idx+1}: Empty address")
-                        continue
-                    
-                    # Check for duplicate addresses
-                    if address in seen_addresses:
-                        print(f"[UnionMainHomesReunionNowScraper] Skipping item {idx+1}: Duplicate address '{address}'")
-                        continue
-                    
-                    seen_addresses.add(address)
-                    
-                    # Extract price from h4 elements
-                    # Look for price container with structure: old price -> arrow -> new price
-                    # The new price is the last price in the sequence
-                    h4_elements = item.find_all('h4', class_='elementor-heading-title')
-                    current_price = None
-                    original_price = None
-                    
-                    # Find all price values in h4 elements
-                    price_values = []
-                    for element in h4_elements:
-                        text = element.get_text(strip=True)
-                        parsed_price = self.parse_price(text)
-                        if parsed_price:
-                            price_values.append(parsed_price)
-                    
-                    # If there are multiple prices, the last one is the new price
-                    # and the first one is the original price
-                    if len(price_values) > 1:
-                        original_price = price_values[0]
-                        current_price = price_values[-1]  # Last price is the new price
-                    elif len(price_values) == 1:
-                        current_price = price_values[0]
-                    
-                    if not current_price:
-                        print(f"[UnionMainHomesReunionNowScraper] Skipping item {idx+1}: No price found")
-                        continue
-                    
-                    # Extract beds, baths, and sqft from the grid structure
-                    beds = ""
-                    baths = ""
-                    sqft = None
-                    
-                    # Find the grid container that holds beds/baths/sqft
-                    grid_container = item.find('div', class_='e-grid')
-                    if grid_container:
-                        # Find all containers with the bed/bath/sqft structure
-                        detail_containers = grid_container.find_all('div', class_='e-flex', recursive=False)
-                        
-                        for container in detail_containers:
-                            h4s = container.find_all('h4', class_='elementor-heading-title')
-                            if len(h4s) >= 2:
-                                value = h4s[0].get_text(strip=True)
-                                label = h4s[1].get_text(strip=True)
-                                
-                                if label == 'BEDS':
-                                    beds = value
-                                elif label == 'BATHS':
-                                    baths = value
-                                elif label == 'SQFT':
-                                    sqft = self.parse_sqft(value)
-                    
-                    if not sqft:
-                        print(f"[UnionMainHomesReunionNowScraper] Skipping item {idx+1}: No square footage found")
-                        continue
-                    
-                    # Calculate price per sqft
-                    price_per_sqft = round(current_price / sqft, 2) if sqft > 0 else None
-                    
-                    plan_data = {
-                        "price": current_price,
-                        "sqft": sqft,
-                        "stories": self.parse_stories(""),
-                        "price_per_sqft": price_per_sqft,
-                        "plan_name": address,  # Use address as plan name for now listings
-                        "company": "UnionMain Homes",
-                        "community": "Reunion",
-                        "type": "now",
-                        "beds": beds,
-                        "baths": baths,
-                        "address": address,
-                        "original_price": original_price,
-                        "price_cut": ""
-                    }
-                    
-                    print(f"[UnionMainHomesReunionNowScraper] Item {idx+1}: {plan_data}")
-                    listings.append(plan_data)
-                    
-                except Exception as e:
-                    print(f"[UnionMainHomesReunionNowScraper] Error processing item {idx+1}: {e}")
-                    continue
-            
-            print(f"[UnionMainHomesReunionNowScraper] Successfully processed {len(listings)} items")
-            return listings
-            
-        except Exception as e:
-            print(f"[UnionMainHomesReunionNowScraper] Error: {e}")
-            return []
-
-    def get_company_name(self) -> str:
-        """Return company name."""
-        return "UnionMain Homes"
-
-    def get_community_name(self) -> str:
-        """Return community name."""
-        return "Reunion"
+class UnionMainHomesReunionNowScraper(UnionMainNowScraper):
+    COMMUNITY = "reunion"
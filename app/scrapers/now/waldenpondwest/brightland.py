@@ -1,32 +1,13 @@
-import time
 import re
-from bs4 import BeautifulSoup
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
+from ...browser_utils import fetch_group_page
 from typing import List, Dict
 
 
 class BrightlandWaldenPondWestNowScraper(BaseScraper):
     URL = "https://www.drbhomes.com/drbhomes/find-your-home/communities/texas/dallasfort-worth/walden-pond/quick-move-in-homes"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract current price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
 
     def parse_baths(self, text):
         """Extract number of bathrooms from text."""
@@ -39,37 +20,17 @@ class BrightlandWaldenPondWestNowScraper(BaseScraper):
         return str(match.group(1)) if match else ""
 
     def fetch_plans(self) -> List[Dict]:
-        driver = None
         try:
             print(f"[BrightlandWaldenPondWestNowScraper] Fetching URL: {self.URL}")
             
-            # Setup Chrome options
-            chrome_options = Options()
-            chrome_options.add_argument('--headless')
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--window-size=1920,1080')
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-            
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.get(self.URL)
-            
-            # Wait for the page to load and content to be populated
+            # All Brightland (drbhomes.com) pages load together in tabs of one browser and are cached for the run
             print(f"[BrightlandWaldenPondWestNowScraper] Waiting for page to load...")
-            time.sleep(10)
-            
-            # Scroll to trigger content loading
-            print(f"[BrightlandWaldenPondWestNowScraper] Scrolling to trigger content loading...")
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(5)
-            
-            # Wait for home cards to be loaded
-            wait = WebDriverWait(driver, 20)
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "drb-qmi-home-card")))
+            page_source = fetch_group_page("drbhomes", self.URL)
+            if not page_source:
+                print(f"[BrightlandWaldenPondWestNowScraper] Page could not be loaded")
+                return []
             
-            # Get the page source after JavaScript has loaded
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = make_soup(page_source, SoupStrainer('drb-qmi-home-card'))
             
             # Find all home cards
             home_cards = soup.find_all('drb-qmi-home-card')
@@ -246,6 +207,3 @@ class BrightlandWaldenPondWestNowScraper(BaseScraper):
             import traceback
             traceback.print_exc()
             return []
-        finally:
-            if driver:
-                driver.quit()
@@ -1,31 +1,11 @@
 import requests
 import re
-from bs4 import BeautifulSoup
 from ...base import BaseScraper
+from ...json_utils import extract_assignment
 from typing import List, Dict
 
 class KBHomeWildflowerRanchNowScraper(BaseScraper):
     URL = "https://www.kbhome.com/new-homes-dallas-fort-worth/the-preserve"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract current price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
 
     def parse_stories(self, text):
         """Extract number of stories from text."""
@@ -68,33 +48,8 @@ class KBHomeWildflowerRanchNowScraper(BaseScraper):
                 print(f"[KBHomeWildflowerRanchNowScraper] Request failed with status {response.status_code}")
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # The data is loaded via JavaScript, so we need to extract it from the script tags
-            # Look for the LocalQMIs JavaScript variable
-            script_tags = soup.find_all('script')
-            qmi_data = None
-            
-            for script in script_tags:
-                if script.string and 'LocalQMIs' in script.string:
-                    script_content = script.string
-                    # Extract the LocalQMIs array from JavaScript
-                    start_marker = 'var LocalQMIs = ['
-                    end_marker = '];'
-                    
-                    start_idx = script_content.find(start_marker)
-                    if start_idx != -1:
-                        start_idx += len(start_marker) - 1  # Include the opening bracket
-                        end_idx = script_content.find(end_marker, start_idx)
-                        if end_idx != -1:
-                            json_str = script_content[start_idx:end_idx + 1]
-                            try:
-                                import json
-                                qmi_data = json.loads(json_str)
-                                break
-                            except:
-                                # If JSON parsing fails, try to extract data manually
-                                pass
+            # The data is loaded via JavaScript: read the LocalQMIs array straight from the page
+            qmi_data = extract_assignment(response.content, 'LocalQMIs')
             
             if not qmi_data:
                 print(f"[KBHomeWildflowerRanchNowScraper] No QMI data found in JavaScript")
@@ -1,42 +1,23 @@
 import requests
 import re
 import time
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from ...base import BaseScraper
+from ...html_utils import make_soup
+from ...parse_utils import parse_stories
 from typing import List, Dict
 
 class MIHortonWildflowerRanchNowScraper(BaseScraper):
     URL = "https://www.mihomes.com/new-homes/texas/dallas-fort-worth-metroplex/quick-move-in-homes?community=The%20Preserve"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract current price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
 
     def parse_stories(self, text):
         """Extract number of stories from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else "1"
+        return parse_stories(text, default='1')
 
     def get_status(self, container):
         """Extract the status of the home."""
@@ -107,7 +88,7 @@ class MIHortonWildflowerRanchNowScraper(BaseScraper):
             
             # Get the page source after JavaScript execution and scrolling
             html_content = driver.page_source
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = make_soup(html_content, SoupStrainer('div', class_='home-card'))
             
             # Find all home cards using the correct CSS classes
             home_cards = soup.find_all('div', class_='home-card')
@@ -1,36 +1,17 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
+from ...parse_utils import parse_stories
 from typing import List, Dict
 
 class PulteWildflowerRanchNowScraper(BaseScraper):
     URL = "https://www.pulte.com/homes/texas/dallas/justin/treeline-211384#"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract current price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
 
     def parse_stories(self, text):
         """Extract number of stories from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
+        return parse_stories(text)
 
     def get_status(self, container):
         """Extract the status of the home."""
@@ -72,7 +53,7 @@ class PulteWildflowerRanchNowScraper(BaseScraper):
                 print(f"[PulteWildflowerRanchNowScraper] Request failed with status {response.status_code}")
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content, SoupStrainer('div', class_=re.compile(r'.*QMIGridCard.*')))
             
             # Find all QMI (Quick Move-In) cards using the correct CSS classes
             home_cards = soup.find_all('div', class_=re.compile(r'.*QMIGridCard.*'))
@@ -0,0 +1,204 @@
+"""
+Field normalization shared by all scrapers.
+Patterns are compiled once at import; scrapers get these as the default
+parse_* methods of BaseScraper and only override them for site quirks.
+"""
+
+import re
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# "$363,000", "$363s", "From the $400s", "$450K", "$1.2M"
+_PRICE_RE = re.compile(r'\$\s*(\d[\d,]*(?:\.\d+)?)(?:\s*([kKmMs])\b|\b)')
+# "2,450 sq ft", "2,450 - 2,800 Sq. Ft.", "1850 sqft"
+_SQFT_RE = re.compile(
+    r'(\d[\d,]*)(?:\s*(?:-|–|to)\s*(\d[\d,]*))?\s*(?:sq\.?\s*ft|sqft|square\s*f(?:ee)?t|sf\b)',
+    re.IGNORECASE,
+)
+_NUMBER_RE = re.compile(r'\d[\d,]*(?:\.\d+)?')
+_COUNT_RE = re.compile(r'\d+(?:\.\d+)?')
+# "4/1" full/half baths, else a plain count ("2.5"); "2 1/2" is not read as 1 full, 2 half
+_BATHS_RE = re.compile(r'(?<!\d )\b(\d+)\s*/\s*(\d)\b|(\d+(?:\.\d+)?)')
+# "1.5 story", "2 Stories"
+_STORIES_RE = re.compile(r'(\d+(?:\.\d+)?)\s*-?\s*stor(?:y|ies)', re.IGNORECASE)
+_STORY_WORDS_RE = re.compile(r'\b(single|one|two|three)[\s-]*stor(?:y|ies)', re.IGNORECASE)
+_STORY_WORDS = {"single": "1", "one": "1", "two": "2", "three": "3"}
+
+_PRICE_MULTIPLIERS = {"k": 1000, "K": 1000, "s": 1000, "m": 1000000, "M": 1000000}
+
+
+def _to_number(raw: str):
+    raw = raw.replace(",", "")
+    if "." in raw:
+        return float(raw)
+    return int(raw) if raw else 0
+
+
+def _price(raw: str, suffix: Optional[str]) -> int:
+    raw = raw.replace(",", "")
+    if not suffix:
+        return int(raw) if "." not in raw else int(round(float(raw)))
+    amount = float(raw)
+    # "$400s" / "$450K" are thousands shorthand; "$350,000s" is already a full price
+    if amount < 1000 or suffix in "mM":
+        amount *= _PRICE_MULTIPLIERS[suffix]
+    return int(round(amount))
+
+
+def _full_half(full: str, half: str) -> str:
+    # Half baths count 0.5 each: "4/1" -> "4.5", "3/2" -> "4"
+    total = int(full) + int(half) / 2
+    return str(int(total)) if total.is_integer() else str(total)
+
+
+def parse_price(text, bare: bool = False) -> Optional[int]:
+    """
+    Parse a "$" price, handling thousands notation. Ranges return the low end.
+    bare=True also accepts a number without "$" (as-is) when no "$" price is found.
+
+    Examples:
+    - "$363,000" -> 363000
+    - "$363s" / "From the $363s" -> 363000
+    - "$350,000s" -> 350000
+    - "$450K" -> 450000, "$1.2M" -> 1200000
+    - "$85/mo" -> 85
+    - "4 Beds" -> None ("363,000" -> 363000 with bare=True)
+    """
+    if not text:
+        return None
+    try:
+        match = _PRICE_RE.search(text)
+    except TypeError:
+        text = str(text)
+        match = _PRICE_RE.search(text)
+    if match:
+        return _price(*match.groups())
+    if not bare:
+        return None
+    match = _NUMBER_RE.search(text)
+    return int(round(_to_number(match.group(0)))) if match else None
+
+
+def parse_price_range(text) -> Tuple[Optional[int], Optional[int]]:
+    """Parse "$400s - $500s" style ranges into (low, high); a single price gives (p, p)."""
+    if not text:
+        return None, None
+    prices = [_price(*m.groups()) for m in _PRICE_RE.finditer(str(text))]
+    if not prices:
+        return None, None
+    return min(prices), max(prices)
+
+
+def parse_sqft_range(text) -> Tuple[Optional[int], Optional[int]]:
+    """Parse "2,450 - 2,800 sq ft" into (2450, 2800); a single value gives (v, v)."""
+    if not text:
+        return None, None
+    if not isinstance(text, str):
+        text = str(text)
+    match = _SQFT_RE.search(text)
+    if match:
+        low = int(_to_number(match.group(1)))
+        high = int(_to_number(match.group(2))) if match.group(2) else low
+        return low, high
+    match = _NUMBER_RE.search(text)
+    if not match:
+        return None, None
+    value = int(_to_number(match.group(0)))
+    return value, value
+
+
+def parse_sqft(text) -> Optional[int]:
+    """Parse square footage; prefers a number marked "sq ft", else the first number. Ranges return the low end."""
+    if not text:
+        return None
+    try:
+        match = _SQFT_RE.search(text)
+    except TypeError:
+        text = str(text)
+        match = _SQFT_RE.search(text)
+    if match:
+        return int(match.group(1).replace(",", ""))
+    match = _NUMBER_RE.search(text)
+    return int(_to_number(match.group(0))) if match else None
+
+
+def parse_beds(text) -> str:
+    """Parse bedrooms as a string ("3-4" -> "3"), or "" when absent."""
+    if not text:
+        return ""
+    match = _COUNT_RE.search(str(text))
+    return match.group(0) if match else ""
+
+
+def parse_baths(text) -> str:
+    """
+    Parse bathrooms as a string, or "" when absent. Full/half counts use the
+    "2.5 = two full, one half" convention: "4/1" -> "4.5", "3/2" -> "4".
+    """
+    if not text:
+        return ""
+    match = _BATHS_RE.search(str(text))
+    if not match:
+        return ""
+    full, half, count = match.groups()
+    return _full_half(full, half) if full else count
+
+
+def parse_stories(text, default: str = "") -> str:
+    """Parse stories as a string ("1.5 story" -> "1.5", "Single Story" -> "1"), or default."""
+    if not text:
+        return default
+    if not isinstance(text, str):
+        text = str(text)
+    match = _STORIES_RE.search(text)
+    if match:
+        return match.group(1)
+    match = _STORY_WORDS_RE.search(text)
+    if match:
+        return _STORY_WORDS[match.group(1).lower()]
+    match = _COUNT_RE.search(text)
+    return match.group(0) if match else default
+
+
+_DEDUPE_TYPES = {str, type(None)}
+
+FIELD_PARSERS: Dict[str, Callable] = {
+    "price": parse_price,
+    "sqft": parse_sqft,
+    "beds": parse_beds,
+    "baths": parse_baths,
+    "stories": parse_stories,
+}
+
+
+def parse_many(field: str, texts: Iterable) -> List:
+    """
+    Normalize a whole list of raw strings for one field, e.g. parse_many("price", texts).
+    Each distinct string is parsed once: a listing page repeats most of its
+    beds/baths/stories strings and price teasers like "From the $400s".
+    """
+    parser = FIELD_PARSERS[field]
+    texts = texts if isinstance(texts, list) else list(texts)
+    try:
+        distinct = dict.fromkeys(texts)
+    except TypeError:
+        return [parser(text) for text in texts]
+    # Keyed by value, so 2 and 2.0 would share a result; only dedupe strings (and None)
+    if not set(map(type, distinct)) <= _DEDUPE_TYPES:
+        return [parser(text) for text in texts]
+    parsed = {text: parser(text) for text in distinct}
+    return [parsed[text] for text in texts]
+
+
+def normalize_listings(rows: Iterable[Dict]) -> List[Dict]:
+    """
+    Normalize raw text fields of many listings at once, one parse_many() call per
+    field. Each row maps field names in FIELD_PARSERS to raw strings; other keys
+    are copied unchanged.
+    """
+    result = [dict(row) for row in rows]
+    for field in FIELD_PARSERS:
+        having = [row for row in result if field in row]
+        if having:
+            for row, value in zip(having, parse_many(field, [row[field] for row in having])):
+                row[field] = value
+    return result
@@ -0,0 +1,79 @@
+"""
+Two-stage scrape pipeline.
+StagedScrapers are fetched one after another in the calling thread (browser
+sessions and the shared page caches stay in this process), and their raw pages
+are parsed in a process pool while the next scraper downloads. The pool lives
+for one run only: runs are hours apart, and idle workers would each hold a full
+copy of the app. Single-stage scrapers still run fetch_records() inline.
+Either way the result is a list of PlanRecords per scraper.
+"""
+
+import multiprocessing
+import os
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List, Optional, Tuple, Union
+
+from app.models.record import PlanRecord
+from .base import BaseScraper, Page, StagedScraper
+
+# Most parse worker processes per run; each re-imports the app. 0 parses inline.
+PARSE_WORKERS = int(os.environ.get("SCRAPER_PARSE_WORKERS") or min(4, os.cpu_count() or 1))
+
+
+def parse_job(scraper: StagedScraper, pages: List[Page]) -> List[PlanRecord]:
+    """Worker entry point: raw pages in, PlanRecords out."""
+    return scraper.parse_records(pages)
+
+
+def _name(scraper: BaseScraper) -> str:
+    return scraper.__class__.__name__
+
+
+def run_scrapers(scrapers: List[BaseScraper], workers: Optional[int] = None) -> List[Tuple[BaseScraper, Optional[List[PlanRecord]]]]:
+    """
+    Run every scraper and return (scraper, records) pairs in scraper order.
+    records is None when the scraper raised; one failing scraper never aborts the run.
+    """
+    workers = PARSE_WORKERS if workers is None else workers
+    workers = min(workers, sum(isinstance(scraper, StagedScraper) for scraper in scrapers))
+    pool = None
+    if workers > 0:
+        # spawn: the scheduler runs in threads, and forking a threaded process can deadlock
+        pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+        print(f"[pipeline] Parsing in {workers} worker processes")
+
+    pending: List[Tuple[BaseScraper, Union[Future, List[PlanRecord], None]]] = []
+    try:
+        for scraper in scrapers:
+            print(f"[pipeline] Running scraper: {_name(scraper)}")
+            try:
+                if not isinstance(scraper, StagedScraper):
+                    pending.append((scraper, scraper.fetch_records()))
+                    continue
+                pages = scraper.fetch_pages()
+                if not pages:
+                    pending.append((scraper, []))
+                elif pool is None:
+                    pending.append((scraper, scraper.parse_records(pages)))
+                else:
+                    pending.append((scraper, pool.submit(parse_job, scraper, pages)))
+            except Exception as e:
+                print(f"[pipeline] {_name(scraper)} failed: {e}")
+                traceback.print_exc()
+                pending.append((scraper, None))
+
+        results = []
+        for scraper, outcome in pending:
+            if isinstance(outcome, Future):
+                try:
+                    outcome = outcome.result()
+                except Exception as e:
+                    print(f"[pipeline] {_name(scraper)} failed while parsing: {e}")
+                    traceback.print_exc()
+                    outcome = None
+            results.append((scraper, outcome))
+        return results
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
@@ -1,7 +1,8 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
 class BeazerHomesBrookvillePlanScraper(BaseScraper):
@@ -73,7 +74,7 @@ class BeazerHomesBrookvillePlanScraper(BaseScraper):
                 print(f"[BeazerHomesBrookvillePlanScraper] Request failed with status {resp.status_code}")
                 return []
             
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content, SoupStrainer('div', attrs={'data-product-type': 'plan'}))
             listings = []
             seen_plan_names = set()  # Track plan names to prevent duplicates
             
@@ -1,29 +1,15 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
+from ...parse_utils import parse_stories
 from typing import List, Dict
 
 class ShaddockHomesBrookvillePlanScraper(BaseScraper):
     URLS = [
         "https://www.shaddockhomes.com/communities/forney/devonshire"
     ]
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        if not text:
-            return None
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract price from text."""
-        if not text:
-            return None
-        
-        # Handle individual prices like "$394,000"
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
 
     def parse_beds(self, text):
         """Extract number of bedrooms from text."""
@@ -43,10 +29,7 @@ class ShaddockHomesBrookvillePlanScraper(BaseScraper):
 
     def parse_stories(self, text):
         """Extract number of stories from text."""
-        if not text:
-            return "1"
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else "1"
+        return parse_stories(text, default='1')
 
     def parse_lot_size(self, text):
         """Extract lot size from text."""
@@ -171,7 +154,7 @@ class ShaddockHomesBrookvillePlanScraper(BaseScraper):
                         print(f"[ShaddockHomesBrookvillePlanScraper] URL {url_idx + 1} request failed with status {resp.status_code}")
                         continue
                     
-                    soup = BeautifulSoup(resp.content, 'html.parser')
+                    soup = make_soup(resp.content, SoupStrainer('div', class_='PlanCard_wrapper'))
                     
                     # Look for plan cards with class "PlanCard_wrapper" (these are the plan cards)
                     plan_cards = soup.find_all('div', class_='PlanCard_wrapper')
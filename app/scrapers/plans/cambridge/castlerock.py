@@ -1,32 +1,18 @@
 import time
 import re
-from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from ...base import BaseScraper
+from ...html_utils import make_soup
+from ...parse_utils import parse_stories
 from typing import List, Dict
 
 
 class CastlerockCambridgePlanScraper(BaseScraper):
     URL = "https://www.c-rock.com/community/texas/dallas/green_meadows?splitPageTabBar=1"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract base price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
 
     def parse_baths(self, text):
         """Extract number of bathrooms from text."""
@@ -40,8 +26,7 @@ class CastlerockCambridgePlanScraper(BaseScraper):
 
     def parse_stories(self, text):
         """Extract number of stories from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else "1"
+        return parse_stories(text, default='1')
 
     def fetch_plans(self) -> List[Dict]:
         driver = None
@@ -149,7 +134,7 @@ class CastlerockCambridgePlanScraper(BaseScraper):
                 # Parse and collect plan data from current visible items
                 for item_html in current_items_html:
                     try:
-                        item_soup = BeautifulSoup(item_html, 'html.parser')
+                        item_soup = make_soup(item_html)
                         card = item_soup.find('div')
                         if not card:
                             continue
@@ -238,7 +223,7 @@ class CastlerockCambridgePlanScraper(BaseScraper):
                     
                     for item_html in current_items_html:
                         try:
-                            item_soup = BeautifulSoup(item_html, 'html.parser')
+                            item_soup = make_soup(item_html)
                             card = item_soup.find('div')
                             if card:
                                 plan_name_elem = card.find('h2')
@@ -260,7 +245,7 @@ class CastlerockCambridgePlanScraper(BaseScraper):
             plan_cards = []
             for plan_name, html in collected_plan_data.items():
                 try:
-                    card_soup = BeautifulSoup(html, 'html.parser')
+                    card_soup = make_soup(html)
                     card = card_soup.find('div')
                     if card:
                         plan_cards.append(card)
@@ -1,7 +1,8 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
 class CoventryCambridgePlanScraper(BaseScraper):
@@ -12,21 +13,6 @@ class CoventryCambridgePlanScraper(BaseScraper):
         "https://www.coventryhomes.com/new-homes/tx/celina/cambridge-crossing-40/",
         "https://www.coventryhomes.com/new-homes/tx/celina/cambridge-crossing-60/",
     ]
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract base price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
 
     def parse_baths(self, text):
         """Extract number of bathrooms from text."""
@@ -124,7 +110,7 @@ class CoventryCambridgePlanScraper(BaseScraper):
                     print(f"[CoventryCambridgePlanScraper] Request failed with status {resp.status_code} for {url}")
                     continue
                 
-                soup = BeautifulSoup(resp.content, 'html.parser')
+                soup = make_soup(resp.content, SoupStrainer('section', id='community-floorplans'))
                 
                 # Find the Floor Plans section
                 floorplans_section = soup.find('section', id='community-floorplans')
@@ -1,7 +1,8 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
 class TrophySignatureCambridgePlanScraper(BaseScraper):
@@ -10,27 +11,6 @@ class TrophySignatureCambridgePlanScraper(BaseScraper):
         "https://trophysignaturehomes.com/communities/dallas-ft-worth/celina/cross-creek-meadows/plans?series=ba00150dddf9db23",
         "https://trophysignaturehomes.com/communities/dallas-ft-worth/celina/cross-creek-meadows/plans?series=b9ce9fb3c2fcf462"
     ]
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract starting price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text (handles 3, 3.5, 4, etc.)."""
-        # Handle both "3" and "3.5" formats
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
 
     def fetch_plans(self) -> List[Dict]:
         try:
@@ -57,7 +37,7 @@ class TrophySignatureCambridgePlanScraper(BaseScraper):
                         print(f"[TrophySignatureCambridgePlanScraper] Request failed with status {resp.status_code}")
                         continue
                     
-                    soup = BeautifulSoup(resp.content, 'html.parser')
+                    soup = make_soup(resp.content, SoupStrainer('div', class_='Results_cardWrapper'))
                     
                     # Find all plan card wrappers
                     plan_cards = soup.find_all('div', class_='Results_cardWrapper')
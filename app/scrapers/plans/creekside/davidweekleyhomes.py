@@ -1,7 +1,9 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
+from ...parse_utils import parse_stories
 from typing import List, Dict
 
 class DavidWeekleyHomesCreeksidePlanScraper(BaseScraper):
@@ -56,8 +58,7 @@ class DavidWeekleyHomesCreeksidePlanScraper(BaseScraper):
 
     def parse_stories(self, text):
         """Extract number of stories from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else "1"
+        return parse_stories(text, default='1')
 
     def parse_garages(self, text):
         """Extract number of garages from text."""
@@ -200,7 +201,7 @@ class DavidWeekleyHomesCreeksidePlanScraper(BaseScraper):
                 print(f"[DavidWeekleyHomesCreeksidePlanScraper] Request failed with status {resp.status_code}")
                 return []
 
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content, SoupStrainer('div', class_='pure-g content', attrs={'data-bind': 'with: compareHomes'}))
 
             # Look for the content div with data-bind="with: compareHomes"
             content_div = soup.find('div', class_='pure-g content', attrs={'data-bind': 'with: compareHomes'})
@@ -4,9 +4,10 @@ Rockwell Homes Creekside Floor Plans Scraper
 """
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 import re
 from app.scrapers.base import BaseScraper
+from app.scrapers.html_utils import make_soup
 
 class RockwellHomesCreeksidePlanScraper(BaseScraper):
     URL = "https://www.rockwell-homes.com/new-homes/tx/royse-city/creekside/14633/"
@@ -190,7 +191,7 @@ class RockwellHomesCreeksidePlanScraper(BaseScraper):
             response.raise_for_status()
             
             # Parse the HTML content
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content, SoupStrainer('div', class_='plan-card'))
             
             # Find all plan cards
             plan_cards = soup.find_all('div', class_='plan-card')
@@ -4,9 +4,10 @@ William Ryan Homes Creekside Floor Plans Scraper
 """
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 import re
 from app.scrapers.base import BaseScraper
+from app.scrapers.html_utils import make_soup
 
 class WilliamRyanHomesCreeksidePlanScraper(BaseScraper):
     URL = "https://www.williamryanhomes.com/dfw/royse-city/creekside"
@@ -206,7 +207,7 @@ class WilliamRyanHomesCreeksidePlanScraper(BaseScraper):
                 print(f"[WilliamRyanHomesCreeksidePlanScraper] Request failed with status {resp.status_code}")
                 return []
 
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content, SoupStrainer('div', id='floorPlansListContainer'))
 
             # Look for the floor plans container
             floor_plans_container = soup.find('div', id='floorPlansListContainer')
@@ -1,40 +1,12 @@
 import requests
 import re
-from bs4 import BeautifulSoup
-from ...base import BaseScraper
+from bs4 import SoupStrainer
+from ...base import Page, StagedScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
-class MillcroftEchoParkPlanScraper(BaseScraper):
+class MillcroftEchoParkPlanScraper(StagedScraper):
     URL = "https://theprovidencegroup.com/new-homes/ga/buford/millcroft-townhomes/13814/"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        if not text:
-            return None
-        # Handle ranges like "2,010-2,676" by taking the first value
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract price from text."""
-        if not text:
-            return None
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        if not text:
-            return ""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        if not text:
-            return ""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
 
     def parse_stories(self, text):
         """Extract number of stories from text."""
@@ -140,7 +112,7 @@ class MillcroftEchoParkPlanScraper(BaseScraper):
             print(f"[MillcroftEchoParkPlanScraper] Error extracting plan data: {e}")
             return None
 
-    def fetch_plans(self) -> List[Dict]:
+    def fetch_pages(self) -> List[Page]:
         try:
             print(f"[MillcroftEchoParkPlanScraper] Fetching URL: {self.URL}")
             
@@ -159,8 +131,18 @@ class MillcroftEchoParkPlanScraper(BaseScraper):
             if resp.status_code != 200:
                 print(f"[MillcroftEchoParkPlanScraper] Request failed with status {resp.status_code}")
                 return []
-            
-            soup = BeautifulSoup(resp.content, 'html.parser')
+
+            return [(self.URL, resp.content)]
+
+        except Exception as e:
+            print(f"[MillcroftEchoParkPlanScraper] Error: {e}")
+            return []
+
+    def parse_pages(self, pages: List[Page]) -> List[Dict]:
+        if not pages:
+            return []
+        try:
+            soup = make_soup(pages[0][1], SoupStrainer('div', class_='swiper-slide'))
             listings = []
             seen_plan_names = set()  # Track plan names to prevent duplicates
             
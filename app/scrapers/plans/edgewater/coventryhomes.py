@@ -1,6 +1,7 @@
 import requests
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 import re
 import json
@@ -94,7 +95,7 @@ class CoventryHomesEdgewaterPlanScraper(BaseScraper):
                 print(f"[CoventryHomesEdgewaterPlanScraper] Request failed with status {response.status_code}")
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content, SoupStrainer('div', class_='model-card'))
             
             # Find all model cards anywhere on the page
             model_cards = soup.find_all('div', class_='model-card')
@@ -1,12 +1,12 @@
 import time
 import re
-from bs4 import BeautifulSoup
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
 
@@ -94,7 +94,7 @@ class GrandHomesEdgewaterPlanScraper(BaseScraper):
                         time.sleep(5)
                     
                     # Get the page source after JavaScript has loaded
-                    soup = BeautifulSoup(driver.page_source, 'html.parser')
+                    soup = make_soup(driver.page_source)
                     
                     # Find the "Available Floor Plans" section
                     floor_plans_heading = soup.find('h4', class_='BannerHeadingH4', string=re.compile('Available Floor Plans', re.I))
@@ -1,24 +1,24 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from ...price_utils import parse_price_with_thousands
 from typing import List, Dict
 
 class ChafinCommunitiesMaddoxPlanScraper(BaseScraper):
     URL = "https://www.chafincommunities.com/communities/georgia/jackson/hochston-jackson/rosewood-lakes/"
     
+    def parse_price(self, text):
+        """Extract starting price from text ("$400" on the cards means $400,000)."""
+        return parse_price_with_thousands(text)
+
     def parse_sqft(self, text):
         """Extract square footage from text."""
         # Look for patterns like "2,500 Sq Ft" or "2500 Sq Ft"
         match = re.search(r'([\d,]+)\s*Sq\.?\s*Ft\.?', text, re.IGNORECASE)
         return int(match.group(1).replace(",", "")) if match else None
 
-    def parse_price(self, text):
-        """Extract starting price from text."""
-        # Use the utility function to handle thousands notation
-        return parse_price_with_thousands(text)
-
     def parse_beds(self, text):
         """Extract number of bedrooms from text."""
         # Look for patterns like "4 - 5" or "3" beds
@@ -63,7 +63,7 @@ class ChafinCommunitiesMaddoxPlanScraper(BaseScraper):
                 print(f"[ChafinCommunitiesMaddoxPlanScraper] Request failed with status {resp.status_code}")
                 return []
             
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content, SoupStrainer('div', class_='single_community_floor_plans_wrapper'))
             listings = []
             seen_plan_names = set()  # Track plan names to prevent duplicates
             
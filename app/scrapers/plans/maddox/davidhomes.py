@@ -1,8 +1,9 @@
 import requests
 import json
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
 class DavidHomesMaddoxPlanScraper(BaseScraper):
@@ -70,7 +71,7 @@ class DavidHomesMaddoxPlanScraper(BaseScraper):
                 print(f"[DavidHomesMaddoxPlanScraper] Request failed with status {resp.status_code}")
                 return []
             
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content, SoupStrainer('div', class_='relative flex h-full flex-col overflow-hidden rounded bg-white text-center shadow transition-transform hover:-translate-y-2'))
             listings = []
             seen_plan_names = set()  # Track plan names to prevent duplicates
             
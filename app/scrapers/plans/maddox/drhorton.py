@@ -1,23 +1,24 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from ...price_utils import parse_price_with_thousands
 from typing import List, Dict
 
 class DRHortonMaddoxPlanScraper(BaseScraper):
     URL = "https://www.drhorton.com/georgia/atlanta/hoschton/twin-lakes"
     
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)\s*Sq\.?\s*Ft\.?', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
     def parse_price(self, text):
         """Extract starting price from text."""
         # Use the utility function to handle thousands notation
         return parse_price_with_thousands(text)
 
+    def parse_sqft(self, text):
+        """Extract square footage from text."""
+        match = re.search(r'([\d,]+)\s*Sq\.?\s*Ft\.?', text)
+        return int(match.group(1).replace(",", "")) if match else None
+
     def parse_beds(self, text):
         """Extract number of bedrooms from text."""
         match = re.search(r'(\d+(?:\.\d+)?)\s*Bed', text)
@@ -58,7 +59,7 @@ class DRHortonMaddoxPlanScraper(BaseScraper):
                 print(f"[DRHortonMaddoxPlanScraper] Request failed with status {resp.status_code}")
                 return []
             
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content, SoupStrainer('div', {'id': 'floorplanItems'}))
             listings = []
             seen_plan_names = set()  # Track plan names to prevent duplicates
             
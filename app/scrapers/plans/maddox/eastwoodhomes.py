@@ -1,21 +1,12 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
 class EastwoodHomesMaddoxPlanScraper(BaseScraper):
     URL = "https://www.eastwoodhomes.com/atlanta/hoschton/twin-lakes"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        """Extract starting price from text."""
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
 
     def parse_beds(self, text):
         """Extract number of bedrooms from text."""
@@ -57,7 +48,7 @@ class EastwoodHomesMaddoxPlanScraper(BaseScraper):
                 print(f"[EastwoodHomesMaddoxPlanScraper] Request failed with status {resp.status_code}")
                 return []
             
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content, SoupStrainer('div', class_='s-card-housing'))
             listings = []
             seen_plan_names = set()  # Track plan names to prevent duplicates
             
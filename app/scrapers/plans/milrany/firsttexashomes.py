@@ -1,17 +1,13 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
 
 class FirstTexasHomesMilranyPlanScraper(BaseScraper):
     URL = "https://www.firsttexashomes.com/community/melissa/16555/brookfield/"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
 
     def parse_price(self, text):
         """Extract starting price from text."""
@@ -23,16 +19,6 @@ class FirstTexasHomesMilranyPlanScraper(BaseScraper):
         match = re.search(r'\$([\d,]+)', text)
         return int(match.group(1).replace(",", "")) if match else None
 
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
     def parse_garage(self, text):
         """Extract number of garage spaces from text."""
         match = re.search(r'(\d+)', text)
@@ -62,7 +48,7 @@ class FirstTexasHomesMilranyPlanScraper(BaseScraper):
                 print(f"[FirstTexasHomesMilranyPlanScraper] Request failed with status {response.status_code}")
                 return []
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content, SoupStrainer('div', id='plans-border'))
             
             # Find the Plans tab pane
             plans_tab = soup.find('div', id='plans-border')
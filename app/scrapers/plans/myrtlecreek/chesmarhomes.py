@@ -5,11 +5,6 @@ from typing import List, Dict
 
 class ChesmarHomesMyrtleCreekPlanScraper(BaseScraper):
     API_URL = "https://chesmar.com/wp-json/chesmar/search/"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
 
     def parse_price(self, text):
         """Extract current price from text."""
@@ -21,16 +16,6 @@ class ChesmarHomesMyrtleCreekPlanScraper(BaseScraper):
                 return int(clean_text.replace(",", ""))
         return None
 
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
     def parse_stories(self, text):
         """Extract number of stories from text."""
         # Chesmar homes are typically single story, but we'll default to 1
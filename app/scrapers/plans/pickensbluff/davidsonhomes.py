@@ -1,21 +1,13 @@
 import requests
 import re
-from bs4 import BeautifulSoup
 from ...base import BaseScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 import json
 
 class DavidsonHomesPickensBluffPlanScraper(BaseScraper):
     URL = "https://www.davidsonhomes.com/states/georgia/atlanta-market-area/dallas/riverwood/"
 
-    def parse_sqft(self, text):
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_price(self, text):
-        match = re.search(r'\$([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
     def fetch_plans(self) -> List[Dict]:
         try:
             print(f"[DavidsonHomesPickensBluffPlanScraper] Fetching URL: {self.URL}")
@@ -35,7 +27,7 @@ class DavidsonHomesPickensBluffPlanScraper(BaseScraper):
                 print(f"[DavidsonHomesPickensBluffPlanScraper] Request failed with status {response.status_code}")
                 return []
 
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = make_soup(response.content)
 
             # Look for home cards that contain plan information
             # Based on the debug output, this appears to be a "now" listings page
@@ -4,15 +4,11 @@ Fischer Homes Pickens Bluff Plan Scraper
 Scrapes plan information from Fischer Homes Pickens Bluff community
 """
 
-import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 import re
 from app.scrapers.base import BaseScraper
+from app.scrapers.html_utils import make_soup
+from app.scrapers.browser_utils import fetch_group_page
 
 
 class FischerHomesPickensBluffPlanScraper(BaseScraper):
@@ -29,50 +25,15 @@ class FischerHomesPickensBluffPlanScraper(BaseScraper):
         """
         print(f"[FischerHomesPickensBluffPlanScraper] Fetching URL: {self.URL}")
         
-        # Setup Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-        
-        driver = None
         try:
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.get(self.URL)
-            
-            # Wait for the page to load and content to be populated
+            # All Fischer Homes pages load together in tabs of one browser and are cached for the run
             print(f"[FischerHomesPickensBluffPlanScraper] Waiting for page to load...")
-            time.sleep(10)
-            
-            # Wait for Angular to finish loading
-            wait = WebDriverWait(driver, 20)
-            try:
-                # Wait for the residences section to be visible
-                wait.until(EC.presence_of_element_located((By.ID, "residences-homes")))
-                print(f"[FischerHomesPickensBluffPlanScraper] Residences section found")
-            except Exception as e:
-                print(f"[FischerHomesPickensBluffPlanScraper] Warning: Could not find residences section: {e}")
-            
-            # Scroll to trigger content loading
-            print(f"[FischerHomesPickensBluffPlanScraper] Scrolling to trigger content loading...")
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(5)
-            
-            # Scroll back up to ensure all content is loaded
-            driver.execute_script("window.scrollTo(0, 0);")
-            time.sleep(2)
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(3)
-            
-            # Wait for plan cards to be loaded
-            wait.until(EC.presence_of_element_located((By.CLASS_NAME, "floorplan-card")))
-            print(f"[FischerHomesPickensBluffPlanScraper] Plan cards found")
+            page_source = fetch_group_page("fischerhomes", self.URL)
+            if not page_source:
+                print(f"[FischerHomesPickensBluffPlanScraper] Page could not be loaded")
+                return []
             
-            # Get the page source after JavaScript has loaded
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = make_soup(page_source, SoupStrainer('article', class_='floorplan-card'))
             
             # Find plan cards (floorplan-card articles)
             plan_cards = soup.find_all('article', class_='floorplan-card')
@@ -217,6 +178,3 @@ class FischerHomesPickensBluffPlanScraper(BaseScraper):
         except Exception as e:
             print(f"[FischerHomesPickensBluffPlanScraper] Error fetching plans: {e}")
             return []
-        finally:
-            if driver:
-                driver.quit()
@@ -3,16 +3,10 @@
 Fischer Homes Laurel Farms Plan Scraper
 Scrapes plan information from Fischer Homes Laurel Farms community
 """
-
-import time
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from bs4 import BeautifulSoup
 import re
 from app.scrapers.base import BaseScraper
+from app.scrapers.html_utils import make_soup
+from app.scrapers.browser_utils import fetch_group_page
 
 
 class FischerHomesLaurelFarmsPlanScraper(BaseScraper):
@@ -29,59 +23,22 @@ class FischerHomesLaurelFarmsPlanScraper(BaseScraper):
         """
         print(f"[FischerHomesLaurelFarmsPlanScraper] Fetching URL: {self.URL}")
         
-        # Setup Chrome options
-        chrome_options = Options()
-        chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-        
-        driver = None
         try:
-            driver = webdriver.Chrome(options=chrome_options)
-            driver.get(self.URL)
-            
-            # Wait for the page to load and content to be populated
+            # All Fischer Homes pages load together in tabs of one browser and are cached for the run
             print(f"[FischerHomesLaurelFarmsPlanScraper] Waiting for page to load...")
-            time.sleep(10)
-            
-            # Scroll to the residences-homes section to trigger AngularJS content loading
-            print(f"[FischerHomesLaurelFarmsPlanScraper] Scrolling to residences-homes section...")
-            try:
-                # Try to scroll to the section element
-                section = driver.find_element(By.ID, "residences-homes")
-                driver.execute_script("arguments[0].scrollIntoView(true);", section)
-                time.sleep(3)
-            except:
-                # Fallback: scroll to bottom
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(3)
-            
-            # Scroll back up a bit to ensure visibility
-            driver.execute_script("window.scrollTo(0, document.body.scrollHeight * 0.7);")
-            time.sleep(3)
-            
-            # Wait for plan cards to be loaded
-            wait = WebDriverWait(driver, 30)
-            try:
-                wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "article.floorplan-card")))
-                # Additional wait for AngularJS to finish rendering
-                time.sleep(5)
-            except Exception as e:
-                print(f"[FischerHomesLaurelFarmsPlanScraper] Warning: Timeout waiting for floorplan cards: {e}")
-                # Continue anyway to see what we can find
+            page_source = fetch_group_page("fischerhomes", self.URL)
+            if not page_source:
+                print(f"[FischerHomesLaurelFarmsPlanScraper] Page could not be loaded")
+                return []
             
-            # Get the page source after JavaScript has loaded
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
+            soup = make_soup(page_source)
             
             # Find plan cards (floorplan-card articles)
             plan_cards = soup.find_all('article', class_='floorplan-card')
             print(f"[FischerHomesLaurelFarmsPlanScraper] Found {len(plan_cards)} plan cards")
             
             if len(plan_cards) == 0:
-                print(f"[FischerHomesLaurelFarmsPlanScraper] No plan cards found. Page source length: {len(driver.page_source)}")
+                print(f"[FischerHomesLaurelFarmsPlanScraper] No plan cards found. Page source length: {len(page_source)}")
                 # Try to find any article elements
                 all_articles = soup.find_all('article')
                 print(f"[FischerHomesLaurelFarmsPlanScraper] Found {len(all_articles)} total article elements")
@@ -197,6 +154,3 @@ class FischerHomesLaurelFarmsPlanScraper(BaseScraper):
             import traceback
             traceback.print_exc()
             return []
-        finally:
-            if driver:
-                driver.quit()
@@ -1,16 +1,13 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
+from ...parse_utils import parse_stories
 from typing import List, Dict
 
 class StarlightHomesPickensBluffPlanScraper(BaseScraper):
     URL = "https://www.starlighthomes.com/atlanta/mt-tabor-ridge"
-    
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
 
     def parse_price(self, price_element):
         """Extract starting price from price element."""
@@ -24,20 +21,9 @@ class StarlightHomesPickensBluffPlanScraper(BaseScraper):
         match = re.search(r'\$([\d,]+)', price_text)
         return int(match.group(1).replace(",", "")) if match else None
 
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
     def parse_stories(self, text):
         """Extract number of stories from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else "1"
+        return parse_stories(text, default='1')
 
     def parse_garage(self, text):
         """Extract garage count from text."""
@@ -75,7 +61,7 @@ class StarlightHomesPickensBluffPlanScraper(BaseScraper):
                 print(f"[StarlightHomesPickensBluffPlanScraper] Request failed with status {resp.status_code}")
                 return []
             
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content, SoupStrainer('div', class_='js-community-filter__cards'))
             listings = []
             seen_plans = set()  # Track plan names to prevent duplicates
             
@@ -1,10 +1,10 @@
 import requests
 import re
-from bs4 import BeautifulSoup
-from ...base import BaseScraper
+from ...base import Page, StagedScraper
+from ...html_utils import make_soup
 from typing import List, Dict
 
-class BeazerHomesReunionPlanScraper(BaseScraper):
+class BeazerHomesReunionPlanScraper(StagedScraper):
     URL = "https://www.beazer.com/dallas-tx/wildflower-ranch"
     
     def parse_sqft(self, text):
@@ -53,7 +53,7 @@ class BeazerHomesReunionPlanScraper(BaseScraper):
         # Default to 1 story for these homes based on the data
         return "1"
 
-    def fetch_plans(self) -> List[Dict]:
+    def fetch_pages(self) -> List[Page]:
         try:
             print(f"[BeazerHomesReunionPlanScraper] Fetching URL: {self.URL}")
             
@@ -72,8 +72,18 @@ class BeazerHomesReunionPlanScraper(BaseScraper):
             if resp.status_code != 200:
                 print(f"[BeazerHomesReunionPlanScraper] Request failed with status {resp.status_code}")
                 return []
-            
-            soup = BeautifulSoup(resp.content, 'html.parser')
+
+            return [(self.URL, resp.content)]
+
+        except Exception as e:
+            print(f"[BeazerHomesReunionPlanScraper] Error: {e}")
+            return []
+
+    def parse_pages(self, pages: List[Page]) -> List[Dict]:
+        if not pages:
+            return []
+        try:
+            soup = make_soup(pages[0][1])
             listings = []
             seen_plan_names = set()  # Track plan names to prevent duplicates
             
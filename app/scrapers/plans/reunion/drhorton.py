@@ -1,7 +1,9 @@
 import requests
 import re
-from bs4 import BeautifulSoup
+from bs4 import SoupStrainer
 from ...base import BaseScraper
+from ...html_utils import make_soup
+from ...parse_utils import parse_stories
 from typing import List, Dict
 
 class DRHortonReunionPlanScraper(BaseScraper):
@@ -17,26 +19,9 @@ class DRHortonReunionPlanScraper(BaseScraper):
             return int(price_str)
         return None
 
-    def parse_sqft(self, text):
-        """Extract square footage from text."""
-        # Remove commas and extract number
-        match = re.search(r'([\d,]+)', text)
-        return int(match.group(1).replace(",", "")) if match else None
-
-    def parse_beds(self, text):
-        """Extract number of bedrooms from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
-
-    def parse_baths(self, text):
-        """Extract number of bathrooms from text."""
-        match = re.search(r'(\d+(?:\.\d+)?)', text)
-        return str(match.group(1)) if match else ""
-
     def parse_stories(self, text):
         """Extract number of stories from text."""
-        match = re.search(r'(\d+)', text)
-        return str(match.group(1)) if match else ""
+        return parse_stories(text)
 
     def parse_garage(self, text):
         """Extract number of garage spaces from text."""
@@ -63,7 +48,7 @@ class DRHortonReunionPlanScraper(BaseScraper):
                 print(f"[DRHortonNorthstarPlanScraper] Request failed with status {resp.status_code}")
                 return []
             
-            soup = BeautifulSoup(resp.content, 'html.parser')
+            soup = make_soup(resp.content, SoupStrainer('div', id='floorplanItems'))
             listings = []
             seen_plans = set()  # Track plan names to prevent duplicates
             
@@ -0,0 +1 @@
+# Builder platform scrapers: one class per builder, configured per community
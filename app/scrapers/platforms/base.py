@@ -0,0 +1,48 @@
+from typing import Dict, List, Optional
+from ..base import Page, StagedScraper
+from ..http_utils import fetch_shared_page
+
+
+class PlatformScraper(StagedScraper):
+    """
+    Base for builder-platform scrapers. A platform module holds the scraping
+    logic once plus a COMMUNITIES table; per-community scrapers only set
+    COMMUNITY to a key of that table. Pages are downloaded in fetch_pages() and
+    parsed in parse_pages(), so parsing can run in a worker process.
+    """
+    COMPANY = ""
+    COMMUNITIES: Dict[str, Dict] = {}
+    COMMUNITY = ""
+
+    def __init__(self, community: Optional[str] = None):
+        self.community_key = community or self.COMMUNITY
+        self.config = self.COMMUNITIES[self.community_key]
+
+    @property
+    def community_name(self) -> str:
+        return self.config["community"]
+
+    def log(self, message: str) -> None:
+        print(f"[{type(self).__name__}] {message}")
+
+    def config_urls(self, key: str = "url") -> List[str]:
+        """Return the config entry for key as a list (a single URL or a list of them)."""
+        value = self.config.get(key) or self.config.get("url")
+        return value if isinstance(value, list) else [value]
+
+    def page_urls(self) -> List[str]:
+        """URLs fetch_pages() downloads."""
+        return self.config_urls()
+
+    def fetch_pages(self) -> List[Page]:
+        pages = []
+        for url in self.page_urls():
+            self.log(f"Fetching URL: {url}")
+            try:
+                body = fetch_shared_page(url)
+            except Exception as e:
+                self.log(f"Error fetching {url}: {e}")
+                continue
+            if body:
+                pages.append((url, body))
+        return pages
@@ -0,0 +1,248 @@
+"""
+DR Horton platform scrapers for drhorton.com community pages.
+One community page lists both available homes (#available-homes) and floor
+plans (#floorplanItems); it is fetched once through the shared page cache.
+"""
+
+import re
+from typing import Dict, List
+
+from ..base import Page
+from ..html_utils import make_soup
+from ..parse_utils import parse_stories
+from .base import PlatformScraper
+
+BASE_URL = "https://www.drhorton.com"
+
+DRHORTON_COMMUNITIES: Dict[str, Dict] = {
+    "pickensbluff": {
+        "community": "Pickens Bluff",
+        "url": "https://www.drhorton.com/georgia/atlanta/dallas/hamptons-at-riverwood-south",
+        "stories": "2",
+    },
+    "wildflowerranch": {
+        "community": "Wildflower Ranch",
+        "url": "https://www.drhorton.com/texas/fort-worth/justin/treeline",
+        "stories": "1",
+    },
+}
+
+_BEDS_RE = re.compile(r'(\d+(?:\.\d+)?)\s*Bed')
+_BATHS_RE = re.compile(r'(\d+(?:\.\d+)?)\s*Bath')
+_GARAGE_RE = re.compile(r'(\d+)\s*Garage')
+_STORY_RE = re.compile(r'(\d+)\s*Story')
+_SQFT_RE = re.compile(r'([\d,]+)\s*Sq\.\s*Ft\.')
+_LOT_RE = re.compile(r'Lot\s+(\w+)')
+_STARTING_PRICE_RE = re.compile(r'\$(\d+)s?')
+_LEADING_NUMBER_RE = re.compile(r'^\d+\s+')
+
+
+def _absolute(href):
+    if href and not href.startswith('http'):
+        return f"{BASE_URL}{href}"
+    return href
+
+
+class DRHortonScraper(PlatformScraper):
+    COMPANY = "DR Horton"
+    COMMUNITIES = DRHORTON_COMMUNITIES
+
+    def parse_stories(self, text):
+        """Extract number of stories from text."""
+        return parse_stories(text, default=self.config["stories"])
+
+    def parse_stats(self, texts) -> Dict:
+        """Beds, baths, garage, stories, sqft and lot from the card's stat lines."""
+        stats = {"beds": "", "baths": "", "garage": "", "stories": self.config["stories"], "sqft": None, "lot_number": ""}
+        for text in texts:
+            if "Bed" in text and "Bath" in text:
+                for key, pattern in (("beds", _BEDS_RE), ("baths", _BATHS_RE), ("garage", _GARAGE_RE)):
+                    match = pattern.search(text)
+                    if match:
+                        stats[key] = match.group(1)
+            elif "Story" in text and "Sq. Ft." in text:
+                match = _STORY_RE.search(text)
+                if match:
+                    stats["stories"] = match.group(1)
+                match = _SQFT_RE.search(text)
+                if match:
+                    stats["sqft"] = self.parse_sqft(match.group(1))
+                match = _LOT_RE.search(text)
+                if match:
+                    stats["lot_number"] = match.group(1)
+        return stats
+
+    def load_page(self, pages: List[Page]):
+        """Soup of the community page, or None if it could not be downloaded."""
+        return make_soup(pages[0][1]) if pages else None
+
+
+class DRHortonNowScraper(DRHortonScraper):
+    """Available homes of one DR Horton community."""
+
+    def get_status(self, price_text):
+        """Determine status based on price text."""
+        if "Under Contract" in price_text:
+            return "under_contract"
+        elif "$" in price_text:
+            return "available"
+        else:
+            return "unknown"
+
+    def parse_pages(self, pages: List[Page]) -> List[Dict]:
+        try:
+            soup = self.load_page(pages)
+            if soup is None:
+                return []
+
+            section = soup.find('div', id='available-homes')
+            if not section:
+                self.log("Could not find available homes section")
+                return []
+            home_cards = section.find_all('div', class_='toggle-item')
+            self.log(f"Found {len(home_cards)} home cards")
+
+            listings = []
+            seen_addresses = set()
+            for idx, card in enumerate(home_cards):
+                try:
+                    price_elem = card.find('h2')
+                    if not price_elem:
+                        self.log(f"Skipping card {idx+1}: No price found")
+                        continue
+                    price_text = price_elem.get_text(strip=True)
+                    status = self.get_status(price_text)
+                    if status == "under_contract":
+                        self.log(f"Skipping card {idx+1}: Under contract")
+                        continue
+                    current_price = self.parse_price(price_text)
+                    if not current_price:
+                        self.log(f"Skipping card {idx+1}: No valid price found")
+                        continue
+
+                    address_elem = card.find('h3')
+                    if not address_elem:
+                        self.log(f"Skipping card {idx+1}: No address found")
+                        continue
+                    address = address_elem.get_text(strip=True)
+                    if address in seen_addresses:
+                        self.log(f"Skipping card {idx+1}: Duplicate address '{address}'")
+                        continue
+                    seen_addresses.add(address)
+
+                    stats = self.parse_stats(p.get_text(strip=True) for p in card.find_all('p'))
+                    sqft = stats["sqft"]
+                    if not sqft:
+                        self.log(f"Skipping card {idx+1}: No square footage found")
+                        continue
+
+                    link_elem = card.find('a', class_='CoveoResultLink')
+                    plan_data = {
+                        "price": current_price,
+                        "sqft": sqft,
+                        "stories": stats["stories"],
+                        "price_per_sqft": round(current_price / sqft, 2),
+                        "plan_name": _LEADING_NUMBER_RE.sub('', address).title(),
+                        "company": self.COMPANY,
+                        "community": self.community_name,
+                        "type": "now",
+                        "beds": stats["beds"],
+                        "baths": stats["baths"],
+                        "address": address,
+                        "original_price": None,
+                        "price_cut": "",
+                        "status": status,
+                        "lot_number": stats["lot_number"],
+                        "url": _absolute(link_elem.get('href')) if link_elem else None
+                    }
+                    self.log(f"Card {idx+1}: {plan_data['plan_name']} - ${current_price:,} - {sqft:,} sqft - {status}")
+                    listings.append(plan_data)
+                except Exception as e:
+                    self.log(f"Error processing card {idx+1}: {e}")
+                    continue
+
+            self.log(f"Successfully processed {len(listings)} listings")
+            return listings
+        except Exception as e:
+            self.log(f"Error: {e}")
+            return []
+
+
+class DRHortonPlanScraper(DRHortonScraper):
+    """Floor plans of one DR Horton community."""
+
+    def parse_price(self, text):
+        """Extract starting price from "Starting in the $409s" text."""
+        match = _STARTING_PRICE_RE.search(text)
+        return int(match.group(1)) * 1000 if match else None
+
+    def parse_pages(self, pages: List[Page]) -> List[Dict]:
+        try:
+            soup = self.load_page(pages)
+            if soup is None:
+                return []
+
+            section = soup.find('div', id='floorplanItems')
+            if not section:
+                self.log("Could not find floorplan section")
+                return []
+            plan_cards = section.find_all('div', class_='toggle-item')
+            self.log(f"Found {len(plan_cards)} plan cards")
+
+            listings = []
+            seen_plans = set()
+            for idx, card in enumerate(plan_cards):
+                try:
+                    # Newer cards nest the details in div.card-content
+                    content = card.find('div', class_='card-content') or card
+                    name_elem = content.find('h2')
+                    if not name_elem:
+                        self.log(f"Skipping card {idx+1}: No plan name found")
+                        continue
+                    plan_name = name_elem.get_text(strip=True)
+                    if plan_name in seen_plans:
+                        self.log(f"Skipping card {idx+1}: Duplicate plan '{plan_name}'")
+                        continue
+                    seen_plans.add(plan_name)
+
+                    price_elem = content.find('h3')
+                    starting_price = self.parse_price(price_elem.get_text(strip=True)) if price_elem else None
+                    if not starting_price:
+                        self.log(f"Skipping card {idx+1}: No valid starting price found")
+                        continue
+
+                    stats = self.parse_stats(p.get_text(strip=True) for p in content.find_all('p', class_='stats'))
+                    sqft = stats["sqft"]
+                    if not sqft:
+                        self.log(f"Skipping card {idx+1}: No square footage found")
+                        continue
+
+                    # The link may wrap the card or sit inside it
+                    link_elem = card.find_parent('a', class_='CoveoResultLink') or card.find('a', class_='CoveoResultLink')
+                    plan_data = {
+                        "price": starting_price,
+                        "sqft": sqft,
+                        "stories": stats["stories"],
+                        "price_per_sqft": round(starting_price / sqft, 2),
+                        "plan_name": plan_name,
+                        "company": self.COMPANY,
+                        "community": self.community_name,
+                        "type": "plan",
+                        "beds": stats["beds"],
+                        "baths": stats["baths"],
+                        "address": "",  # Plans don't have specific addresses
+                        "design_number": plan_name,
+                        "garage": stats["garage"],
+                        "url": _absolute(link_elem.get('href')) if link_elem else None
+                    }
+                    self.log(f"Card {idx+1}: {plan_name} - Starting at ${starting_price:,} - {sqft:,} sqft")
+                    listings.append(plan_data)
+                except Exception as e:
+                    self.log(f"Error processing card {idx+1}: {e}")
+                    continue
+
+            self.log(f"Successfully processed {len(listings)} plans")
+            return listings
+        except Exception as e:
+            self.log(f"Error: {e}")
+            return []
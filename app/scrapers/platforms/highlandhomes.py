@@ -0,0 +1,331 @@
+"""
+Highland Homes platform scrapers.
+All Highland Homes community pages are loaded once, together, in tabs of one
+browser (browser_utils.fetch_group_page); the now and plans scrapers of every
+community then read the cached page sources.
+"""
+
+import re
+import traceback
+from abc import abstractmethod
+from typing import Dict, List, Optional
+
+from ..base import Page
+from ..browser_utils import fetch_group_page
+from ..html_utils import make_soup
+from ..parse_utils import parse_price
+from .base import PlatformScraper
+
+BASE_URL = "https://www.highlandhomes.com"
+
+# urls: community pages; a community may span several sections
+HIGHLAND_COMMUNITIES: Dict[str, Dict] = {
+    "brookville": {
+        "community": "Brookville",
+        "url": ["https://www.highlandhomes.com/dfw/forney/devonshire"],
+    },
+    "cambridge": {
+        "community": "Cambridge",
+        "url": ["https://www.highlandhomes.com/dfw/celina/cambridge-crossing"],
+    },
+    "creekside": {
+        "community": "Creekside",
+        "url": ["https://www.highlandhomes.com/dfw/royse-city/creekshaw"],
+    },
+    "edgewater": {
+        "community": "Edgewater",
+        "url": [
+            "https://www.highlandhomes.com/dfw/mclendon-chisholm/sonoma-verde/70ft-lots/section",
+            "https://www.highlandhomes.com/dfw/mclendon-chisholm/sonoma-verde/60ft-lots/section",
+        ],
+    },
+    "myrtlecreek": {
+        "community": "Myrtle Creek",
+        "url": [
+            "https://www.highlandhomes.com/dfw/waxahachie/ridge-crossing",
+            "https://www.highlandhomes.com/dfw/waxahachie/dove-hollow",
+        ],
+    },
+}
+
+# Every page of every community, so one browser session serves them all
+GROUP_URLS = [url for config in HIGHLAND_COMMUNITIES.values() for url in config["url"]]
+
+_FIRST_NUMBER_RE = re.compile(r'(\d+)')
+_PLAN_NAME_RE = re.compile(r'^(.+?)\s+Plan\s+(?:with|$)')
+_SQFT_RANGE_RE = re.compile(r'(\d+(?:,\d+)?)\s*-\s*(\d+(?:,\d+)?)')
+_SINGLE_NUMBER_RE = re.compile(r'(\d+(?:,\d+)?)')
+
+
+def _first_number(text) -> str:
+    if not text:
+        return ""
+    match = _FIRST_NUMBER_RE.search(text)
+    return match.group(1) if match else ""
+
+
+def _absolute(href: str) -> str:
+    if not href:
+        return ""
+    if href.startswith('//'):
+        return f"https:{href}"
+    if href.startswith('/'):
+        return f"{BASE_URL}{href}"
+    if href.startswith('http'):
+        return href
+    return f"{BASE_URL}/{href}"
+
+
+def _cards(container, card_class: str) -> List:
+    """<a> cards carrying both 'home-container' and card_class."""
+    cards = []
+    for link in container.find_all('a'):
+        classes = link.get('class', [])
+        if 'home-container' in classes and card_class in classes:
+            cards.append(link)
+    return cards
+
+
+def _detail_value(card, label_re: str) -> Optional[str]:
+    """Numeral text of the homeDetailItem whose label matches label_re."""
+    label = card.find('span', class_='label', string=re.compile(label_re, re.I))
+    if not label:
+        return None
+    parent = label.find_parent('div', class_='homeDetailItem')
+    numeral = parent.find('span', class_='numeral') if parent else None
+    return numeral.get_text(strip=True) if numeral else None
+
+
+class HighlandHomesScraper(PlatformScraper):
+    COMPANY = "HighlandHomes"
+    COMMUNITIES = HIGHLAND_COMMUNITIES
+    KIND = ""
+
+    def parse_price(self, text):
+        """Extract price from text (Highland sometimes prints the number without "$")."""
+        return parse_price(text, bare=True)
+
+    def parse_beds(self, text):
+        """Extract number of bedrooms from text (first number of a range like '3-4')."""
+        return _first_number(text)
+
+    def parse_garage(self, text):
+        """Extract number of garage spaces from text."""
+        return _first_number(text)
+
+    @abstractmethod
+    def parse_page(self, soup) -> List[Dict]:
+        """Extract the cards of one parsed community page."""
+        pass
+
+    def fetch_pages(self) -> List[Page]:
+        self.log(f"Starting to fetch HighlandHomes {self.KIND} for {self.community_name}")
+        pages = []
+        for url_idx, url in enumerate(self.config_urls(), 1):
+            try:
+                self.log(f"Fetching URL {url_idx}: {url}")
+                # All Highland Homes pages load together in tabs of one browser and are cached for the run
+                page_source = fetch_group_page("highlandhomes", url, GROUP_URLS)
+                if not page_source:
+                    self.log(f"Page could not be loaded for URL {url_idx}")
+                    continue
+                pages.append((url, page_source))
+            except Exception as e:
+                self.log(f"Error fetching URL {url_idx}: {e}")
+                traceback.print_exc()
+                continue
+        return pages
+
+    def parse_pages(self, pages: List[Page]) -> List[Dict]:
+        try:
+            results = []
+            for url, page_source in pages:
+                try:
+                    results.extend(self.parse_page(make_soup(page_source)))
+                except Exception as e:
+                    self.log(f"Error parsing {url}: {e}")
+                    traceback.print_exc()
+                    continue
+
+            unique = []
+            seen = set()
+            for row in results:
+                key = row["address"]
+                if key in seen:
+                    self.log(f"Skipping duplicate: {key}")
+                    continue
+                seen.add(key)
+                unique.append(row)
+
+            self.log(f"Successfully processed {len(unique)} {self.KIND}")
+            return unique
+        except Exception as e:
+            self.log(f"Error: {e}")
+            traceback.print_exc()
+            return []
+
+
+class HighlandHomesNowScraper(HighlandHomesScraper):
+    """Quick move-in homes (homeSpec cards) of one Highland Homes community."""
+    KIND = "homes"
+
+    def parse_status(self, text):
+        """Extract status from text."""
+        if not text:
+            return "Available"
+        text_lower = text.lower().strip()
+        if "complete" in text_lower and "move-in" in text_lower:
+            return "Complete & Move-in Ready!"
+        return text.strip()
+
+    def parse_page(self, soup) -> List[Dict]:
+        move_in_section = soup.find('section', class_=lambda x: x and 'alternate' in x and 'extra_padding_top' in x)
+        if not move_in_section:
+            self.log("No quick move-in section found")
+            return []
+        container = move_in_section.find('div', id='moveInReadyContainer')
+        if not container:
+            self.log("No moveInReadyContainer found")
+            return []
+
+        home_cards = _cards(container, 'homeSpec')
+        self.log(f"Found {len(home_cards)} home cards")
+        if not home_cards:
+            home_cards = container.find_all('a', href=re.compile(r'/dfw/'))
+            self.log(f"Found {len(home_cards)} home cards with href pattern")
+
+        listings = []
+        for idx, card in enumerate(home_cards):
+            try:
+                address_elem = card.find('span', class_='homeIdentifier')
+                address = address_elem.get_text(strip=True) if address_elem else ""
+                if not address:
+                    continue
+
+                plan_name = ""
+                plan_elem = card.find('p', class_='homeUpgrades')
+                if plan_elem:
+                    plan_text = plan_elem.get_text(strip=True)
+                    plan_match = _PLAN_NAME_RE.search(plan_text)
+                    if plan_match:
+                        plan_name = plan_match.group(1).strip() + " Plan"
+                    else:
+                        plan_name = plan_text.split(' with ')[0].strip()
+
+                price_elem = card.find('span', class_='price')
+                price = self.parse_price(price_elem.get_text(strip=True)) if price_elem else None
+
+                sqft = None
+                sqft_elem = card.find('div', class_='homeSqFootage')
+                numeral_elem = sqft_elem.find('span', class_='numeral') if sqft_elem else None
+                if numeral_elem:
+                    sqft = self.parse_sqft(numeral_elem.get_text(strip=True))
+
+                if not price or not sqft:
+                    self.log(f"Skipping listing {idx+1}: Missing price or sqft")
+                    continue
+
+                status = "Available"
+                status_elem = card.find('span', class_=lambda x: x and 'completed-home' in x)
+                if status_elem:
+                    status = self.parse_status(status_elem.get_text(strip=True))
+
+                img_tag = card.find('img')
+                listing_data = {
+                    "price": price,
+                    "sqft": sqft,
+                    "stories": _detail_value(card, 'stories') or "",
+                    "price_per_sqft": round(price / sqft, 2),
+                    "plan_name": plan_name or address,
+                    "company": self.COMPANY,
+                    "community": self.community_name,
+                    "type": "now",
+                    "beds": self.parse_beds(_detail_value(card, 'beds')),
+                    "baths": self.parse_baths(_detail_value(card, 'baths')),
+                    "address": address,
+                    "original_price": None,
+                    "price_cut": "",
+                    "status": status,
+                    "mls": "",
+                    "sub_community": "",
+                    "image_url": _absolute((img_tag.get('src') or img_tag.get('data-src')) if img_tag else ""),
+                    "detail_link": _absolute(card.get('href')),
+                    "garage": self.parse_garage(_detail_value(card, 'garages'))
+                }
+                self.log(f"Home {idx+1}: {address} - {plan_name} - ${price:,} - {sqft} sqft - {status}")
+                listings.append(listing_data)
+            except Exception as e:
+                self.log(f"Error processing listing {idx+1}: {e}")
+                traceback.print_exc()
+                continue
+        return listings
+
+
+class HighlandHomesPlanScraper(HighlandHomesScraper):
+    """Floor plans (homePlan cards) of one Highland Homes community."""
+    KIND = "plans"
+
+    def parse_baths(self, text):
+        """Extract number of bathrooms from text (first number of a range like '3-4')."""
+        return _first_number(text)
+
+    def parse_sqft_range(self, text):
+        """Extract minimum square footage from range like '2,802 - 2,822'."""
+        if not text:
+            return None
+        match = _SQFT_RANGE_RE.search(text) or _SINGLE_NUMBER_RE.search(text)
+        return int(match.group(1).replace(",", "")) if match else None
+
+    def parse_page(self, soup) -> List[Dict]:
+        plan_section = soup.find('section', id='planCards')
+        if not plan_section:
+            self.log("No planCards section found")
+            return []
+
+        plan_cards = _cards(plan_section, 'homePlan')
+        self.log(f"Found {len(plan_cards)} plan cards")
+
+        plans = []
+        for idx, card in enumerate(plan_cards):
+            try:
+                name_elem = card.find('span', class_='homeIdentifier')
+                plan_name = name_elem.get_text(strip=True) if name_elem else ""
+                if not plan_name:
+                    continue
+
+                price_elem = card.find('span', class_='price')
+                price = self.parse_price(price_elem.get_text(strip=True)) if price_elem else None
+                sqft = self.parse_sqft_range(_detail_value(card, 'sq ft'))
+                if not price or not sqft:
+                    self.log(f"Skipping plan {idx+1}: Missing price or sqft")
+                    continue
+
+                img_tag = card.find('img', class_='homePlan_ifp')
+                plan_data = {
+                    "price": price,
+                    "sqft": sqft,
+                    "stories": _detail_value(card, 'stories') or "",
+                    "price_per_sqft": round(price / sqft, 2),
+                    "plan_name": plan_name,
+                    "company": self.COMPANY,
+                    "community": self.community_name,
+                    "type": "plan",
+                    "beds": self.parse_beds(_detail_value(card, 'beds')),
+                    "baths": self.parse_baths(_detail_value(card, 'full baths')),
+                    "address": plan_name,  # Use plan name as address for plans
+                    "original_price": None,
+                    "price_cut": "",
+                    "status": "",
+                    "mls": "",
+                    "sub_community": "",
+                    "image_url": _absolute((img_tag.get('data-src') or img_tag.get('src')) if img_tag else ""),
+                    "detail_link": _absolute(card.get('href')),
+                    "garage": self.parse_garage(_detail_value(card, 'garages'))
+                }
+                self.log(f"Plan {idx+1}: {plan_name} - ${price:,} - {sqft} sqft")
+                plans.append(plan_data)
+            except Exception as e:
+                self.log(f"Error processing plan {idx+1}: {e}")
+                traceback.print_exc()
+                continue
+        return plans
@@ -0,0 +1,79 @@
+"""
+Scrapers defined entirely by extraction specs (see extract_utils).
+Each JSON file in app/scrapers/specs holds a list of specs; adding a community
+whose page fits a spec needs only a new entry there, no Python module.
+"""
+
+import os
+from typing import Dict, List, Optional
+
+from ..base import Page, StagedScraper
+from ..extract_utils import compile_spec
+from ..http_utils import fetch_shared_page
+from ..json_utils import loads
+
+SPEC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "specs")
+
+
+def spec_scraper(spec: Dict) -> "SpecScraper":
+    """SpecScraper subclass named after the spec, so logs read like hand-written scrapers."""
+    return type(spec["name"], (SpecScraper,), {})(spec)
+
+
+class SpecScraper(StagedScraper):
+    """Fetch the spec's URL(s) and run its compiled extractor over each page."""
+
+    def __init__(self, spec: Dict):
+        self.spec = spec
+        self.name = spec.get("name", "SpecScraper")
+        self.extractor = compile_spec(spec)
+        url = spec.get("url")
+        self.urls = url if isinstance(url, list) else [url]
+
+    def __reduce__(self):
+        # Neither the per-spec class nor compiled XPath objects pickle; worker
+        # processes rebuild the scraper from its spec instead.
+        return spec_scraper, (self.spec,)
+
+    def fetch_pages(self) -> List[Page]:
+        pages = []
+        for url in self.urls:
+            print(f"[{self.name}] Fetching URL: {url}")
+            try:
+                page = fetch_shared_page(url)
+            except Exception as e:
+                print(f"[{self.name}] Error fetching {url}: {e}")
+                continue
+            if page:
+                pages.append((url, page))
+        return pages
+
+    def parse_pages(self, pages: List[Page]) -> List[Dict]:
+        try:
+            listings = []
+            for url, page in pages:
+                rows = self.extractor.extract(page, url)
+                print(f"[{self.name}] Extracted {len(rows)} listings")
+                listings.extend(rows)
+            return listings
+        except Exception as e:
+            print(f"[{self.name}] Error: {e}")
+            return []
+
+
+def load_specs(directory: Optional[str] = None) -> List[Dict]:
+    """Read every *.json spec file in directory (default SPEC_DIR), in file-name order."""
+    directory = directory or SPEC_DIR
+    specs = []
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".json"):
+            continue
+        with open(os.path.join(directory, filename), "rb") as f:
+            data = loads(f.read())
+        specs.extend(data if isinstance(data, list) else [data])
+    return specs
+
+
+def load_spec_scrapers(directory: Optional[str] = None) -> List[SpecScraper]:
+    """Compile every spec once and return one scraper per spec."""
+    return [spec_scraper(spec) for spec in load_specs(directory)]
@@ -0,0 +1,368 @@
+"""
+UnionMain Homes platform scrapers.
+Every UnionMain community page is an Elementor loop of cards: 'property' cards
+for move-in ready homes and 'floorplan' cards for plans. The page is fetched
+once through the shared page cache and split into both listing types.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from bs4 import SoupStrainer
+
+from ..base import Page
+from ..html_utils import make_soup
+from .base import PlatformScraper
+
+# url: community page (now + plans); plans_url: only where plans live elsewhere
+UNIONMAIN_COMMUNITIES: Dict[str, Dict] = {
+    "brookville": {
+        "community": "Brookville",
+        "url": "https://unionmainhomes.com/communities/brookville/",
+        "plans_url": "https://unionmainhomes.com/floorplans-all/?nh=brookville-estates",
+        "stories": "2",
+    },
+    "cambridge": {
+        "community": "Cambridge",
+        "url": "https://unionmainhomes.com/communities/cambridge/",
+        "plans_url": "https://unionmainhomes.com/cambridge-crossing/",
+        "stories": "2",
+        "plan_stories": "1",
+    },
+    "creekside": {
+        "community": "Creekside",
+        "url": "https://unionmainhomes.com/communities/creekside/",
+        "stories": "2",
+        "plan_stories": "1",
+    },
+    "echopark": {
+        "community": "Echo Park",
+        "url": "https://unionmainhomes.com/communities/echo-park/#siteplan",
+        "stories": "2",
+    },
+    "edgewater": {
+        "community": "Edgewater",
+        "url": "https://unionmainhomes.com/communities/edgewater/",
+        "stories": "2",
+    },
+    "elevon": {
+        "community": "Elevon",
+        "url": "https://unionmainhomes.com/communities/elevon/",
+        "stories": "2",
+    },
+    "lakebreeze": {
+        "community": "Lake Breeze",
+        "url": "https://unionmainhomes.com/communities/lake-breeze/#homefinder",
+        "stories": "2",
+    },
+    "maddox": {
+        "community": "Maddox",
+        "url": "https://unionmainhomes.com/communities/maddox/",
+        "plans_url": "https://unionmainhomes.com/communities/maddox-landing/",
+        "stories": "2",
+    },
+    "milrany": {
+        "community": "Milrany",
+        "url": "https://unionmainhomes.com/communities/milrany/",
+        "stories": "2",
+    },
+    "myrtlecreek": {
+        "community": "Myrtle Creek",
+        "url": "https://unionmainhomes.com/communities/myrtle-creek/",
+        "stories": "2",
+    },
+    "pickensbluff": {
+        "community": "Pickens Bluff",
+        "url": "https://unionmainhomes.com/communities/pickens-bluff/#homefinder",
+        "stories": "2",
+    },
+    "reunion": {
+        "community": "Reunion",
+        "url": "https://unionmainhomes.com/communities/reunion/",
+        "stories": "1",
+    },
+    "waldenpondwest": {
+        "community": "Walden Pond West",
+        "url": "https://unionmainhomes.com/communities/walden-pond/",
+        "stories": "2",
+    },
+    "wildflowerranch": {
+        "community": "Wildflower Ranch",
+        "url": "https://unionmainhomes.com/communities/wildflower-ranch/",
+        "stories": "2",
+    },
+}
+
+_CARD_STRAINER = SoupStrainer(
+    lambda name, attrs: name == "div" and (
+        "e-loop-item" in (attrs.get("class") or "")
+        or attrs.get("data-elementor-type") == "loop-item"
+        or "single-fp" in (attrs.get("class") or "")
+        or "item-listing-wrap" in (attrs.get("class") or "")
+    )
+)
+
+# Floor plans have names like "Burnet"; addresses look like "1160 Butterfly Dale Dr."
+_ADDRESS_RE = re.compile(
+    r'\d+\s+[A-Za-z\s]+(?:Ln|Ct|St|Dr|Ave|Blvd|Dale|Orchard|Cove|Pl|Bridge|Holly)\.?', re.IGNORECASE
+)
+_PLAN_NAME_FROM_ADDRESS_RE = re.compile(r'(\d+)\s+([A-Za-z\s]+)')
+
+
+def _community_slug(url: str) -> str:
+    match = re.search(r'/communities/([^/#?]+)', url)
+    return match.group(1) if match else ""
+
+
+def _loop_cards(soup, kind: str) -> List:
+    """Elementor loop cards of one kind ('property' or 'floorplan')."""
+    cards = []
+    seen = set()
+    for item in soup.find_all('div', class_='e-loop-item') + soup.find_all('div', attrs={'data-elementor-type': 'loop-item'}):
+        if id(item) in seen or kind not in item.get('class', []):
+            continue
+        seen.add(id(item))
+        cards.append(item)
+    return cards
+
+
+def _card_prices(scraper: PlatformScraper, card):
+    """(price, original_price): a reduced card shows old price -> arrow -> new price."""
+    values = []
+    for element in card.find_all('h4', class_='elementor-heading-title'):
+        text = element.get_text(strip=True)
+        # Bed/bath/sqft values share the heading class; only "$" headings are prices
+        parsed = scraper.parse_price(text) if '$' in text else None
+        if parsed:
+            values.append(parsed)
+    if len(values) > 1:
+        return values[-1], values[0]
+    if values:
+        return values[0], None
+    return None, None
+
+
+def _card_details(scraper: PlatformScraper, card):
+    """(beds, baths, sqft) from the value/label h4 pairs of the card's grid."""
+    beds = ""
+    baths = ""
+    sqft = None
+    grid = card.find('div', class_='e-grid')
+    if grid:
+        for container in grid.find_all('div', class_='e-flex'):
+            h4s = container.find_all('h4', class_='elementor-heading-title')
+            if len(h4s) < 2:
+                continue
+            value = h4s[0].get_text(strip=True)
+            label = h4s[1].get_text(strip=True).upper()
+            if label == 'BEDS':
+                beds = value
+            elif label == 'BATHS':
+                baths = value
+            elif label == 'SQFT':
+                sqft = scraper.parse_sqft(value)
+    return beds, baths, sqft
+
+
+class UnionMainNowScraper(PlatformScraper):
+    """Move-in ready homes ('property' cards) of one UnionMain community."""
+    COMPANY = "UnionMain Homes"
+    COMMUNITIES = UNIONMAIN_COMMUNITIES
+
+    def parse_pages(self, pages: List[Page]) -> List[Dict]:
+        try:
+            if not pages:
+                return []
+            url, page = pages[0]
+            soup = make_soup(page, _CARD_STRAINER)
+
+            property_items = _loop_cards(soup, 'property')
+            self.log(f"Found {len(property_items)} property items")
+            link_re = re.compile(rf'/communities/{re.escape(_community_slug(url))}/new-homes-for-sale/')
+
+            listings = []
+            seen_addresses = set()
+            for idx, item in enumerate(property_items):
+                try:
+                    address_elem = item.find('h2', class_='elementor-heading-title')
+                    address = address_elem.get_text(strip=True) if address_elem else None
+                    if not address:
+                        self.log(f"Skipping item {idx+1}: No address found")
+                        continue
+                    if address in seen_addresses:
+                        self.log(f"Skipping item {idx+1}: Duplicate address '{address}'")
+                        continue
+                    seen_addresses.add(address)
+
+                    price, original_price = _card_prices(self, item)
+                    if not price:
+                        self.log(f"Skipping item {idx+1}: No price found")
+                        continue
+
+                    beds, baths, sqft = _card_details(self, item)
+                    if not sqft:
+                        self.log(f"Skipping item {idx+1}: No square footage found")
+                        continue
+
+                    link_elem = item.find('a', href=link_re)
+                    plan_name_match = _PLAN_NAME_FROM_ADDRESS_RE.search(address)
+                    plan_name = f"{plan_name_match.group(1)} {plan_name_match.group(2).strip()}" if plan_name_match else address
+
+                    plan_data = {
+                        "price": price,
+                        "sqft": sqft,
+                        "stories": self.config["stories"],
+                        "price_per_sqft": round(price / sqft, 2),
+                        "plan_name": plan_name,
+                        "company": self.COMPANY,
+                        "community": self.community_name,
+                        "type": "now",
+                        "beds": beds,
+                        "baths": baths,
+                        "address": address,
+                        "original_price": original_price,
+                        "price_cut": "",
+                        "status": "available",
+                        "url": link_elem.get('href') if link_elem else None
+                    }
+                    self.log(f"Item {idx+1}: {plan_name} - ${price:,} - {sqft:,} sqft")
+                    listings.append(plan_data)
+                except Exception as e:
+                    self.log(f"Error processing item {idx+1}: {e}")
+                    continue
+
+            self.log(f"Successfully processed {len(listings)} properties")
+            return listings
+        except Exception as e:
+            self.log(f"Error: {e}")
+            return []
+
+
+class UnionMainPlanScraper(PlatformScraper):
+    """Floor plans ('floorplan' cards, or the older single-fp listing) of one UnionMain community."""
+    COMPANY = "UnionMain Homes"
+    COMMUNITIES = UNIONMAIN_COMMUNITIES
+
+    def is_floor_plan(self, title: str) -> bool:
+        """Check if the title represents a floor plan (not an address)."""
+        return not _ADDRESS_RE.search(title)
+
+    def _plan(self, plan_name: str, price: int, sqft: int, beds: str, baths: str,
+              original_price: Optional[int] = None, url: Optional[str] = None) -> Dict:
+        return {
+            "price": price,
+            "sqft": sqft,
+            "stories": self.config.get("plan_stories", self.config["stories"]),
+            "price_per_sqft": round(price / sqft, 2),
+            "plan_name": plan_name,
+            "company": self.COMPANY,
+            "community": self.community_name,
+            "type": "plan",
+            "beds": beds or "",
+            "baths": baths or "",
+            "address": "",
+            "design_number": plan_name,
+            "original_price": original_price,
+            "price_cut": "",
+            "url": url
+        }
+
+    def _loop_plans(self, items, url: str) -> List[Dict]:
+        link_re = re.compile(rf'/communities/{re.escape(_community_slug(url))}/plans/')
+        plans = []
+        for idx, item in enumerate(items):
+            try:
+                name_elem = item.find('h2', class_='elementor-heading-title')
+                plan_name = name_elem.get_text(strip=True) if name_elem else None
+                if not plan_name:
+                    self.log(f"Skipping item {idx+1}: No plan name found")
+                    continue
+                if not self.is_floor_plan(plan_name):
+                    self.log(f"Skipping item {idx+1}: This is an address, not a floor plan: {plan_name}")
+                    continue
+
+                price, original_price = _card_prices(self, item)
+                if not price:
+                    self.log(f"Skipping item {idx+1}: No price found")
+                    continue
+
+                beds, baths, sqft = _card_details(self, item)
+                if not sqft:
+                    self.log(f"Skipping item {idx+1}: No square footage found")
+                    continue
+
+                link_elem = item.find('a', href=link_re) or item.find('a', href=True)
+                plans.append(self._plan(plan_name, price, sqft, beds, baths, original_price,
+                                        link_elem.get('href') if link_elem else None))
+                self.log(f"Item {idx+1}: {plan_name} - ${price:,} - {sqft:,} sqft")
+            except Exception as e:
+                self.log(f"Error processing item {idx+1}: {e}")
+                continue
+        return plans
+
+    def _legacy_plans(self, items) -> List[Dict]:
+        """Older theme: div.single-fp / div.item-listing-wrap cards with an amenities list."""
+        plans = []
+        for idx, item in enumerate(items):
+            try:
+                title_elem = item.find('h2', class_='item-title')
+                plan_name = title_elem.get_text(strip=True) if title_elem else None
+                if not plan_name or not self.is_floor_plan(plan_name):
+                    continue
+
+                price_elem = item.find('div', class_='item-price')
+                price = self.parse_price(price_elem.get_text(strip=True)) if price_elem else None
+                area_elem = item.find('li', class_='h-area')
+                sqft = self.parse_sqft(area_elem.get_text(strip=True)) if area_elem else None
+                if not price or not sqft:
+                    self.log(f"Skipping listing {idx+1}: Missing price or sqft")
+                    continue
+
+                beds_elem = item.find('li', class_='x-beds')
+                baths_elem = item.find('li', class_='x-baths')
+                link_elem = title_elem.find('a', href=True)
+                plans.append(self._plan(
+                    plan_name, price, sqft,
+                    self.parse_beds(beds_elem.get_text(strip=True)) if beds_elem else "",
+                    self.parse_baths(baths_elem.get_text(strip=True)) if baths_elem else "",
+                    url=link_elem.get('href') if link_elem else None,
+                ))
+                self.log(f"Listing {idx+1}: {plan_name} - ${price:,} - {sqft:,} sqft")
+            except Exception as e:
+                self.log(f"Error processing listing {idx+1}: {e}")
+                continue
+        return plans
+
+    def page_urls(self) -> List[str]:
+        return [self.config.get("plans_url") or self.config["url"]]
+
+    def parse_pages(self, pages: List[Page]) -> List[Dict]:
+        try:
+            if not pages:
+                return []
+            url, page = pages[0]
+            soup = make_soup(page, _CARD_STRAINER)
+
+            floorplan_items = _loop_cards(soup, 'floorplan')
+            if floorplan_items:
+                self.log(f"Found {len(floorplan_items)} floorplan items")
+                plans = self._loop_plans(floorplan_items, url)
+            else:
+                legacy_items = soup.find_all('div', class_=['single-fp', 'item-listing-wrap'])
+                self.log(f"Found {len(legacy_items)} floor plan listings (old structure)")
+                plans = self._legacy_plans(legacy_items)
+
+            unique = []
+            seen_plan_names = set()
+            for plan in plans:
+                if plan["plan_name"] in seen_plan_names:
+                    self.log(f"Skipping duplicate plan name '{plan['plan_name']}'")
+                    continue
+                seen_plan_names.add(plan["plan_name"])
+                unique.append(plan)
+
+            self.log(f"Successfully processed {len(unique)} floor plans")
+            return unique
+        except Exception as e:
+            self.log(f"Error: {e}")
+            return []
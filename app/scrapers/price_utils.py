@@ -6,6 +6,9 @@ Handles common price formatting issues like thousands notation.
 import re
 from typing import Optional
 
+_PRICE_THOUSANDS_RE = re.compile(r'\$([\d,]+)s?')
+_PRICE_STANDARD_RE = re.compile(r'\$([\d,]+)')
+
 def parse_price_with_thousands(text: str) -> Optional[int]:
     """
     Parse price from text, handling thousands notation.
@@ -26,7 +29,7 @@ def parse_price_with_thousands(text: str) -> Optional[int]:
         return None
     
     # Look for price patterns with optional 's' suffix
-    match = re.search(r'\$([\d,]+)s?', text)
+    match = _PRICE_THOUSANDS_RE.search(text)
     if not match:
         return None
     
@@ -60,7 +63,7 @@ def parse_price_standard(text: str) -> Optional[int]:
     if not text:
         return None
     
-    match = re.search(r'\$([\d,]+)', text)
+    match = _PRICE_STANDARD_RE.search(text)
     if not match:
         return None
     
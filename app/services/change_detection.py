@@ -1,70 +1,171 @@
+from typing import Dict, List, Optional
+from sqlalchemy import delete, func, insert, select, update
 from sqlalchemy.orm import Session
 from app.db.models import Plan, PriceHistory, CommunityName
+from app.models.record import PlanRecord, listing_key, to_records
+from app.services.snapshots import IN_CHUNK_SIZE, record_snapshots
 from datetime import datetime, timedelta
 
-def _update_community_counts(db: Session):
-    """Set plan and now counts on each CommunityName from the plans table."""
-    from sqlalchemy import func
-    # Count per community: type='plan' and type='now'
-    for row in db.query(CommunityName).all():
-        plan_count = db.query(func.count(Plan.id)).filter(
-            Plan.community == row.name, Plan.type == "plan"
-        ).scalar() or 0
-        now_count = db.query(func.count(Plan.id)).filter(
-            Plan.community == row.name, Plan.type == "now"
-        ).scalar() or 0
-        row.plan = plan_count
-        row.now = now_count
-    db.commit()
-
 def sync_community_names_from_plans(db: Session):
-    """Ensure community_names table has every distinct community that exists in the plans table, and update plan/now counts."""
-    # Delete all existing community_names, then rebuild from plans
-    db.query(CommunityName).delete()
-    distinct = db.query(Plan.community).distinct().all()
-    for (name,) in distinct:
-        if name and db.query(CommunityName).filter(CommunityName.name == name).first() is None:
-            db.add(CommunityName(name=name, plan=0, now=0))
+    """
+    Make community_names match the communities with current listings, with their
+    plan/now counts, from one GROUP BY over plans. Existing rows keep their ids;
+    communities without listings are dropped.
+    """
+    counts = {}
+    rows = db.execute(
+        select(Plan.community, Plan.type, func.count())
+        .where(Plan.removed_at.is_(None))
+        .group_by(Plan.community, Plan.type)
+    )
+    for name, plan_type, count in rows:
+        if name:
+            counts.setdefault(name, {"plan": 0, "now": 0})
+            if plan_type in ("plan", "now"):
+                counts[name][plan_type] = count
+
+    existing = {row.name: row for row in db.execute(select(CommunityName.id, CommunityName.name, CommunityName.plan, CommunityName.now))}
+    inserts = [{"name": name, **c} for name, c in counts.items() if name not in existing]
+    updates = [
+        {"id": row.id, **counts[name]}
+        for name, row in existing.items()
+        if name in counts and (row.plan, row.now) != (counts[name]["plan"], counts[name]["now"])
+    ]
+    stale = [row.id for name, row in existing.items() if name not in counts]
+    if inserts:
+        db.execute(insert(CommunityName), inserts)
+    if updates:
+        db.execute(update(CommunityName), updates)
+    if stale:
+        db.execute(delete(CommunityName).where(CommunityName.id.in_(stale)))
     db.commit()
-    _update_community_counts(db)
 
-def detect_and_update_changes(db: Session, new_plans: list):
-    """Delete all plans (and price history) for the communities in this batch, then insert new_plans."""
-    if not new_plans:
-        return
-    communities = {p.get("community") for p in new_plans if p.get("community")}
-    # Delete existing data only when we have communities (avoid IN () with empty set)
-    if communities:
-        plan_ids = [row[0] for row in db.query(Plan.id).filter(Plan.community.in_(communities)).all()]
-        if plan_ids:
-            db.query(PriceHistory).filter(PriceHistory.plan_id.in_(plan_ids)).delete(
-                synchronize_session=False
+# Rows per executemany batch when writing plans and price history. Each row is
+# its own execution, so this is not bound by SQLite's variable limit; IN (...)
+# lists are chunked by IN_CHUNK_SIZE instead.
+INGEST_CHUNK_SIZE = 5000
+
+# Plan columns ingest maintains itself rather than copying from a record
+_LIFECYCLE = ("id", "last_updated", "removed_at", "first_seen_at", "last_seen_at", "first_price", "removed_run_id")
+# Plan columns compared against a record (PlanRecord.column_values() keys)
+_COMPARED = [c for c in Plan.__table__.c.keys() if c not in _LIFECYCLE]
+
+def _chunks(items: list, size: int = INGEST_CHUNK_SIZE):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+def _execute_chunked(db: Session, statement, rows: list):
+    for chunk in _chunks(rows):
+        db.execute(statement, chunk)
+
+def detect_and_update_changes(db: Session, new_plans: List[PlanRecord], run_id: Optional[int] = None) -> Dict[str, int]:
+    """
+    Upsert new_plans by listing key. Changed rows are updated (a price change also
+    writes a PriceHistory row), new listings are inserted, and listings of a
+    scraped company/community/type that are missing from the batch get removed_at
+    (and removed_run_id). first_seen_at/first_price are set on insert and
+    last_seen_at on every sighting, so lifecycle queries need no replay.
+    Reads and writes go through Core statements in executemany chunks; no ORM
+    objects are built. With a run_id, changed listings are also appended to
+    price_snapshots in the same transaction.
+    Records of the batch that share a listing key but differ are all stored, the
+    later ones under "<key>#2", "#3", ... in batch order; exact repeats are
+    dropped. Both are counted and logged.
+    Returns the new/updated/price_changes/unchanged/removed/duplicates/repeats counts.
+    """
+    counts = dict.fromkeys(("new", "updated", "price_changes", "unchanged", "removed", "duplicates", "repeats"), 0)
+    records = to_records(new_plans, "change_detection")
+    if not records:
+        return counts
+    now = datetime.utcnow()
+    # Only listing groups that were scraped this run can have vanished listings
+    scopes = {(r.company, r.community, r.type) for r in records}
+    communities = {r.community for r in records}
+    columns = [Plan.__table__.c.id, Plan.__table__.c.removed_at] + [Plan.__table__.c[c] for c in _COMPARED]
+    existing = {}
+    for row in db.execute(select(*columns).where(Plan.community.in_(communities))).mappings():
+        if (row["company"], row["community"], row["type"]) in scopes:
+            key = row["listing_key"] or listing_key(
+                row["company"], row["community"], row["type"], row["plan_name"], row["address"], row["design_number"]
             )
-        db.query(Plan).filter(Plan.community.in_(communities)).delete(synchronize_session=False)
-    # Insert new_plans (use .get() so missing keys don't crash)
-    for plan_data in new_plans:
-        community = plan_data.get("community") or ""
-        company = plan_data.get("company") or ""
-        if not community or not company:
+            existing.setdefault(key, row)
+
+    batch = {}
+    by_key = {}  # listing key -> column values of the batch's records with that key
+    duplicates, repeats = [], []
+    inserts, updates, history, sighted = [], [], [], []
+    for record in records:
+        values = record.column_values()
+        key = values["listing_key"]
+        same_key = by_key.setdefault(key, [])
+        if values in same_key:
+            repeats.append(key)
+            continue
+        same_key.append(dict(values))
+        if len(same_key) > 1:
+            duplicates.append(key)
+            key = values["listing_key"] = f"{key}#{len(same_key)}"
+        batch[key] = record
+        row = existing.get(key)
+        if row is None:
+            values.update(last_updated=now, first_seen_at=now, last_seen_at=now, first_price=record.price)
+            inserts.append(values)
             continue
-        plan = Plan(
-            plan_name=plan_data.get("plan_name"),
-            price=plan_data.get("price"),
-            sqft=plan_data.get("sqft"),
-            stories=plan_data.get("stories"),
-            price_per_sqft=plan_data.get("price_per_sqft"),
-            last_updated=datetime.utcnow(),
-            company=company,
-            community=community,
-            type=plan_data.get("type", "plan"),
-            beds=plan_data.get("beds", ""),
-            baths=plan_data.get("baths", ""),
-            address=plan_data.get("address", ""),
-            design_number=plan_data.get("design_number", ""),
-        )
-        db.add(plan)
+        if row["removed_at"] is None and all(row[col] == values[col] for col in _COMPARED):
+            sighted.append(row["id"])
+            continue
+        if row["price"] != record.price and row["price"] is not None and record.price is not None:
+            history.append({"plan_id": row["id"], "old_price": row["price"], "new_price": record.price, "changed_at": now})
+        values.update(id=row["id"], last_updated=now, last_seen_at=now, removed_at=None, removed_run_id=None)
+        updates.append(values)
+
+    removed_keys = [key for key, row in existing.items() if key not in batch and row["removed_at"] is None]
+    removed = [existing[key]["id"] for key in removed_keys]
+    _execute_chunked(db, insert(Plan.__table__), inserts)
+    # ORM bulk UPDATE by primary key: one executemany per chunk
+    _execute_chunked(db, update(Plan), updates)
+    _execute_chunked(db, insert(PriceHistory.__table__), history)
+    for chunk in _chunks(sighted, IN_CHUNK_SIZE):
+        db.execute(update(Plan.__table__).where(Plan.__table__.c.id.in_(chunk)).values(last_seen_at=now))
+    for chunk in _chunks(removed, IN_CHUNK_SIZE):
+        db.execute(update(Plan.__table__).where(Plan.__table__.c.id.in_(chunk)).values(removed_at=now, removed_run_id=run_id))
+    if run_id is not None:
+        record_snapshots(db, run_id, batch, removed_keys, now)
     db.commit()
+    if duplicates:
+        print(f"[change_detection] {len(duplicates)} rows share a listing key with a different row, stored as "
+              f"<key>#n: {', '.join(sorted(set(duplicates))[:10])}")
+    if repeats:
+        print(f"[change_detection] Dropped {len(repeats)} exact repeats: {', '.join(sorted(set(repeats))[:10])}")
+    print(f"[change_detection] {len(inserts)} new, {len(updates)} updated ({len(history)} price changes), {len(removed)} removed")
+    counts.update(new=len(inserts), updated=len(updates), price_changes=len(history), unchanged=len(sighted),
+                  removed=len(removed), duplicates=len(duplicates), repeats=len(repeats))
+    return counts
 
 def get_recent_price_changes(db: Session, within_minutes: int = 1440):
     since = datetime.utcnow() - timedelta(minutes=within_minutes)
-    return db.query(PriceHistory).filter(PriceHistory.changed_at >= since).all() 
\ No newline at end of file
+    return db.query(PriceHistory).filter(PriceHistory.changed_at >= since).all() 
+
+def days_on_market(db: Session, community: Optional[str] = None, company: Optional[str] = None,
+                   include_removed: bool = True) -> List[dict]:
+    """
+    Move-in ("now") listings with their days on market, from one read over the
+    type/removed_at/first_seen_at index. Removed listings count up to removed_at.
+    """
+    now = datetime.utcnow()
+    query = select(
+        Plan.id, Plan.community, Plan.company, Plan.address, Plan.first_price, Plan.price,
+        Plan.first_seen_at, Plan.last_seen_at, Plan.removed_at,
+    ).where(Plan.type == "now", Plan.first_seen_at.is_not(None))
+    if not include_removed:
+        query = query.where(Plan.removed_at.is_(None))
+    if community is not None:
+        query = query.where(Plan.community == community)
+    if company is not None:
+        query = query.where(Plan.company == company)
+    result = []
+    for row in db.execute(query).mappings():
+        item = dict(row)
+        item["days_on_market"] = ((row["removed_at"] or now) - row["first_seen_at"]).days
+        result.append(item)
+    return result
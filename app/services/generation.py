@@ -0,0 +1,49 @@
+import threading
+import time
+from typing import Optional
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.db.models import DataGeneration
+
+# How long a process trusts its last read of the counter; another process's ingest
+# becomes visible to this one's cache within this many seconds
+GENERATION_TTL_SECONDS = 1.0
+
+_lock = threading.Lock()
+_cached = (0.0, None)  # (read at, value)
+
+def _fresh() -> Optional[int]:
+    read_at, value = _cached
+    if value is not None and time.monotonic() - read_at < GENERATION_TTL_SECONDS:
+        return value
+    return None
+
+def _remember(value: int) -> int:
+    global _cached
+    with _lock:
+        _cached = (time.monotonic(), value)
+    return value
+
+def current_generation(db: Session) -> int:
+    """Data generation, re-read from the DB at most every GENERATION_TTL_SECONDS."""
+    value = _fresh()
+    if value is not None:
+        return value
+    row = db.get(DataGeneration, 1)
+    return _remember(row.value if row else 0)
+
+async def current_generation_async(db: AsyncSession) -> int:
+    """current_generation() for async endpoints."""
+    value = _fresh()
+    if value is not None:
+        return value
+    row = await db.get(DataGeneration, 1)
+    return _remember(row.value if row else 0)
+
+def bump_generation(db: Session) -> int:
+    """Mark all plan-derived data as changed (call after ingest commits)."""
+    if not db.execute(update(DataGeneration).where(DataGeneration.id == 1).values(value=DataGeneration.value + 1)).rowcount:
+        db.add(DataGeneration(id=1, value=1))
+    db.commit()
+    return _remember(db.get(DataGeneration, 1).value)
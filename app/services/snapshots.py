@@ -0,0 +1,80 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import func, insert, select
+from sqlalchemy.orm import Session
+from app.db.models import PriceSnapshot, ScrapeRun
+from app.models.record import PlanRecord
+
+REMOVED = "removed"
+
+# Values per IN (...) list: under the 999 bound parameters older SQLite builds
+# (before 3.32) allow per statement. Used for every chunked IN lookup or update.
+IN_CHUNK_SIZE = 900
+
+def start_run(db: Session) -> int:
+    """Open a ScrapeRun and return its id."""
+    run = ScrapeRun(started_at=datetime.utcnow())
+    db.add(run)
+    db.commit()
+    return run.id
+
+def finish_run(db: Session, run_id: int, plan_count: int):
+    db.query(ScrapeRun).filter(ScrapeRun.id == run_id).update(
+        {"finished_at": datetime.utcnow(), "plan_count": plan_count}, synchronize_session=False
+    )
+    db.commit()
+
+def latest_snapshots(db: Session, keys: Iterable[str]) -> Dict[str, Tuple]:
+    """listing_key -> (price, sqft, status) of its most recent snapshot."""
+    keys = list(keys)
+    latest = {}
+    for start in range(0, len(keys), IN_CHUNK_SIZE):
+        last_ids = (
+            select(func.max(PriceSnapshot.id))
+            .where(PriceSnapshot.listing_key.in_(keys[start:start + IN_CHUNK_SIZE]))
+            .group_by(PriceSnapshot.listing_key)
+        )
+        rows = db.execute(
+            select(PriceSnapshot.listing_key, PriceSnapshot.price, PriceSnapshot.sqft, PriceSnapshot.status)
+            .where(PriceSnapshot.id.in_(last_ids))
+        )
+        for key, price, sqft, status in rows:
+            latest[key] = (price, sqft, status)
+    return latest
+
+def record_snapshots(db: Session, run_id: int, listings: Dict[str, PlanRecord], removed_keys: Iterable[str],
+                     captured_at: Optional[datetime] = None) -> int:
+    """
+    Append a snapshot for every listing (listing key -> record) whose (price, sqft,
+    status) differs from its latest one, and a "removed" snapshot for every listing
+    that left its page. Does not commit; returns the number of rows written.
+    """
+    captured_at = captured_at or datetime.utcnow()
+    values = {key: (r.price, r.sqft, r.status or None) for key, r in listings.items()}
+    values.update({key: (None, None, REMOVED) for key in removed_keys})
+    latest = latest_snapshots(db, values)
+    rows = [
+        {"run_id": run_id, "listing_key": key, "price": price, "sqft": sqft, "status": status, "captured_at": captured_at}
+        for key, (price, sqft, status) in values.items()
+        if latest.get(key) != (price, sqft, status)
+    ]
+    if rows:
+        db.execute(insert(PriceSnapshot.__table__), rows)
+    return len(rows)
+
+def listing_history(db: Session, listing_key: str, since: Optional[datetime] = None,
+                    until: Optional[datetime] = None) -> List[PriceSnapshot]:
+    """Snapshots of one listing in time order (served by the listing_key, captured_at index)."""
+    query = db.query(PriceSnapshot).filter(PriceSnapshot.listing_key == listing_key)
+    if since is not None:
+        query = query.filter(PriceSnapshot.captured_at >= since)
+    if until is not None:
+        query = query.filter(PriceSnapshot.captured_at < until)
+    return query.order_by(PriceSnapshot.captured_at, PriceSnapshot.id).all()
+
+def snapshots_between(db: Session, since: datetime, until: Optional[datetime] = None) -> List[PriceSnapshot]:
+    """Every snapshot captured in [since, until) (served by the captured_at index)."""
+    query = db.query(PriceSnapshot).filter(PriceSnapshot.captured_at >= since)
+    if until is not None:
+        query = query.filter(PriceSnapshot.captured_at < until)
+    return query.order_by(PriceSnapshot.captured_at, PriceSnapshot.id).all()
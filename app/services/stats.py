@@ -0,0 +1,98 @@
+from datetime import datetime
+from statistics import fmean, median, quantiles
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import delete, insert, or_, select
+from sqlalchemy.orm import Session
+from app.db.models import Plan, PlanStats
+from app.services.generation import bump_generation
+
+# scope -> which group dimensions it keeps
+SCOPES = {
+    "community": ("community",),
+    "company": ("company",),
+    "community_company": ("community", "company"),
+}
+
+def _quartiles(values: List[float]) -> Tuple[float, float, float]:
+    if len(values) == 1:
+        return values[0], values[0], values[0]
+    p25, p50, p75 = quantiles(values, n=4, method="inclusive")
+    return round(p25, 2), round(p50, 2), round(p75, 2)
+
+def _summary(prices: List[float], ppsf: List[float], sqft: List[int]) -> Dict:
+    p25, p50, p75 = _quartiles(ppsf) if ppsf else (None, None, None)
+    return {
+        "count": len(prices),
+        "min_price": min(prices),
+        "max_price": max(prices),
+        "mean_price": round(fmean(prices), 2),
+        "median_price": median(prices),
+        "ppsf_p25": p25,
+        "ppsf_median": p50,
+        "ppsf_p75": p75,
+        "min_sqft": min(sqft) if sqft else None,
+        "max_sqft": max(sqft) if sqft else None,
+    }
+
+def _in_refresh(scope: str, community: str, company: str, communities: set, companies: set) -> bool:
+    """Whether a listing feeds a group being refreshed (company groups span communities)."""
+    if scope == "company":
+        return company in companies
+    return community in communities
+
+def refresh_stats(db: Session, communities: Optional[Iterable[str]] = None, companies: Optional[Iterable[str]] = None):
+    """
+    Recompute plan_stats for the given communities and companies (all when both
+    are None) from current listings, replacing their previous rows. Ingest calls
+    this with the communities/companies of its batch.
+    """
+    refresh_all = communities is None and companies is None
+    communities = set(communities or [])
+    companies = set(companies or [])
+    query = select(Plan.community, Plan.company, Plan.type, Plan.price, Plan.price_per_sqft, Plan.sqft).where(
+        Plan.removed_at.is_(None), Plan.price.is_not(None)
+    )
+    if not refresh_all:
+        query = query.where(or_(Plan.community.in_(communities), Plan.company.in_(companies)))
+
+    groups: Dict[Tuple[str, str, str, str], Tuple[list, list, list]] = {}
+    for community, company, plan_type, price, ppsf, sqft in db.execute(query):
+        for scope in SCOPES:
+            if not refresh_all and not _in_refresh(scope, community, company, communities, companies):
+                continue
+            key = (
+                scope,
+                community if "community" in SCOPES[scope] else "",
+                company if "company" in SCOPES[scope] else "",
+                plan_type,
+            )
+            prices, ppsfs, sqfts = groups.setdefault(key, ([], [], []))
+            prices.append(price)
+            if ppsf:
+                ppsfs.append(ppsf)
+            if sqft:
+                sqfts.append(sqft)
+
+    now = datetime.utcnow()
+    rows = [
+        {"scope": scope, "community": community, "company": company, "type": plan_type, "updated_at": now,
+         **_summary(prices, sorted(ppsfs), sqfts)}
+        for (scope, community, company, plan_type), (prices, ppsfs, sqfts) in groups.items()
+    ]
+    stale = delete(PlanStats)
+    if not refresh_all:
+        stale = stale.where(or_(
+            (PlanStats.scope == "community") & PlanStats.community.in_(communities),
+            (PlanStats.scope == "company") & PlanStats.company.in_(companies),
+            (PlanStats.scope == "community_company") & PlanStats.community.in_(communities),
+        ))
+    db.execute(stale)
+    if rows:
+        db.execute(insert(PlanStats.__table__), rows)
+    db.commit()
+
+def fill_empty_stats(db: Session):
+    """Compute plan_stats for every group if the table is still empty (new table on an existing DB)."""
+    if db.query(PlanStats.id).first() is None:
+        refresh_stats(db)
+        bump_generation(db)
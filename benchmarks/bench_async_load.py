@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Sync vs async database access under concurrent load. A small app serves the
+same /api/get_plans community page (listed_plans + plans_json, no response
+cache) twice: from a def route on the sync SessionLocal, which holds a
+threadpool thread per request, and from an async def route on an
+AsyncSession. uvicorn runs it in a subprocess and keep-alive raw-socket
+clients drive each route in turn.
+
+    python -m benchmarks.bench_async_load [clients ...] [--requests N] [--plans N]
+
+Defaults: 50 and 500 clients, 20 requests each, 20,000 plans in a temporary
+SQLite database (or DATABASE_URL when set). The load generator shares the
+host's CPUs with the server, so compare the routes with each other rather
+than reading the numbers as capacity.
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+if not os.environ.get("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="bench-async-"), "homes.db")
+
+from fastapi import Depends, FastAPI, Response
+from sqlalchemy import delete, insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.api.plans import listed_plans, plans_json
+from app.db.models import Plan, PriceHistory
+from app.db.session import SessionLocal, get_async_db, get_db, init_db
+
+COMMUNITIES = 13
+PAGE_SIZE = 50
+PORT = 8765
+
+app = FastAPI()
+
+
+def community_page(community: str):
+    return listed_plans().where(Plan.community == community).order_by(Plan.id).limit(PAGE_SIZE)
+
+
+@app.get("/sync/plans")
+def sync_plans(community: str, db: Session = Depends(get_db)):
+    return Response(plans_json(db.execute(community_page(community))), media_type="application/json")
+
+
+@app.get("/async/plans")
+async def async_plans(community: str, db: AsyncSession = Depends(get_async_db)):
+    return Response(plans_json(await db.execute(community_page(community))), media_type="application/json")
+
+
+def seed(size: int):
+    init_db()
+    db = SessionLocal()
+    try:
+        db.execute(delete(PriceHistory))
+        db.execute(delete(Plan))
+        now = datetime.utcnow()
+        db.execute(insert(Plan), [
+            {"plan_name": f"Plan {i}", "price": 300000 + i, "sqft": 2000, "stories": "2", "last_updated": now,
+             "company": f"Builder {i % 20}", "community": f"Comm{i % COMMUNITIES}", "type": "now" if i % 2 else "plan",
+             "beds": 4.0, "baths": 2.5}
+            for i in range(size)
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+async def client(route: str, index: int, requests: int, latencies: list, errors: list):
+    try:
+        reader, writer = await asyncio.open_connection("127.0.0.1", PORT)
+    except OSError as e:
+        errors.append(str(e))
+        return
+    for j in range(requests):
+        path = f"{route}?community=Comm{(index + j) % COMMUNITIES}"
+        start = time.perf_counter()
+        try:
+            writer.write(f"GET {path} HTTP/1.1\r\nHost: bench\r\n\r\n".encode())
+            head = await reader.readuntil(b"\r\n\r\n")
+            length = int(head.lower().split(b"content-length:")[1].split(b"\r\n")[0])
+            await reader.readexactly(length)
+        except (OSError, asyncio.IncompleteReadError, IndexError, ValueError) as e:
+            errors.append(type(e).__name__)
+            break
+        if not head.startswith(b"HTTP/1.1 200"):
+            errors.append(head.split(b"\r\n")[0].decode())
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def load(route: str, clients: int, requests: int) -> dict:
+    latencies, errors = [], []
+    start = time.perf_counter()
+    await asyncio.gather(*[client(route, i, requests, latencies, errors) for i in range(clients)])
+    wall = time.perf_counter() - start
+    latencies.sort()
+
+    def percentile(p: float) -> float:
+        return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000 if latencies else 0.0
+
+    return {"requests": len(latencies), "errors": len(errors), "rps": len(latencies) / wall,
+            "p50_ms": percentile(0.5), "p99_ms": percentile(0.99)}
+
+
+def wait_for_port(timeout: float = 30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", PORT), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise RuntimeError(f"uvicorn did not start on port {PORT}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("clients", nargs="*", type=int, default=[50, 500])
+    parser.add_argument("--requests", type=int, default=20, help="requests per client")
+    parser.add_argument("--plans", type=int, default=20_000)
+    args = parser.parse_args()
+
+    seed(args.plans)
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "benchmarks.bench_async_load:app", "--port", str(PORT),
+         "--log-level", "warning", "--backlog", "2048"],
+        env={**os.environ, "SCHEDULER_ENABLED": "0"},
+    )
+    try:
+        wait_for_port()
+        print(f"{'clients':>7} {'route':7} {'requests':>9} {'errors':>7} {'rps':>6} {'p50 ms':>8} {'p99 ms':>8}")
+        for clients in args.clients:
+            for route in ("sync", "async"):
+                asyncio.run(load(f"/{route}/plans", 5, 2))  # warm the pools
+                r = asyncio.run(load(f"/{route}/plans", clients, args.requests))
+                print(f"{clients:7} {route:7} {r['requests']:9,} {r['errors']:7,} {r['rps']:6,.0f} "
+                      f"{r['p50_ms']:8.0f} {r['p99_ms']:8.0f}")
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
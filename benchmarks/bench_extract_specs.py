@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Compiled extraction specs (app.scrapers.extract_utils) against the hand-written
+BeautifulSoup traversal they replaced, on synthetic Elevon pages: an
+elevontx.com builder page and a DR Horton move-in page, each with N cards
+between unrelated page markup.
+
+    python -m benchmarks.bench_extract_specs [cards] [rounds]    (default 300 20)
+"""
+
+import re
+import statistics
+import sys
+import time
+
+from bs4 import SoupStrainer
+
+from app.scrapers import parse_utils
+from app.scrapers.extract_utils import compile_spec
+from app.scrapers.html_utils import make_soup
+from app.scrapers.platforms.spec import load_specs
+
+NOISE = '<div class="ct-section"><p class="ct-text-block">Amenity {i}: pools, trails and parks</p>' \
+        '<a href="/amenity/{i}">More</a><img src="/img/{i}.jpg" alt=""></div>'
+
+BUILDER_CARD = '<div class="ct-div-block collectable listing" data-price="{price}" data-sqft="{sqft}" data-stories="2">' \
+               '<h4 class="ct-headline">Plan {i}</h4><span class="ct-text-block">From the $400s</span></div>'
+
+NOW_CARD = '<a class="CoveoResultLink available-home-card" href="/texas/dallas/lavon/elevon/{i}-main-st">' \
+           '<div class="card-content"><h2>${price:,}</h2><h3>{i} Main St</h3><p>4 Bed | 2 Bath</p>' \
+           '<p>{sqft:,} Sq. Ft.</p><p>2 Story | 2 Garage</p></div></a>'
+
+
+def page(card: str, cards: int) -> bytes:
+    parts = ["<html><head><title>Elevon</title></head><body>"]
+    for i in range(cards):
+        parts.append(NOISE.format(i=i))
+        parts.append(card.format(i=i, price=300000 + i * 100, sqft=1500 + i))
+    parts.append("</body></html>")
+    return "".join(parts).encode()
+
+
+# The removed per-builder loops (plans/elevon/mihomes.py, now/elevon/drhorton.py), without logging
+def legacy_builder(markup: bytes) -> list:
+    soup = make_soup(markup, SoupStrainer('div', class_="ct-div-block collectable listing"))
+    rows = []
+    for card in soup.find_all('div', class_="ct-div-block collectable listing"):
+        price, sqft, stories = card.get('data-price'), card.get('data-sqft'), card.get('data-stories')
+        if not price or not sqft:
+            continue
+        headline = card.find('h4', class_='ct-headline')
+        plan_name = headline.get_text(strip=True) if headline else ""
+        if not plan_name:
+            continue
+        price, sqft = int(price), int(sqft)
+        rows.append({"price": price, "sqft": sqft, "stories": str(stories), "plan_name": plan_name,
+                     "price_per_sqft": round(price / sqft, 2) if sqft > 0 else None})
+    return rows
+
+
+def legacy_now(markup: bytes) -> list:
+    soup = make_soup(markup, SoupStrainer('a', class_="CoveoResultLink available-home-card"))
+    rows = []
+    for card in soup.find_all('a', class_="CoveoResultLink available-home-card"):
+        content = card.find('div', class_='card-content')
+        if not content:
+            continue
+        h2 = content.find('h2')
+        price = parse_utils.parse_price(h2.get_text() if h2 else "")
+        if price is None:
+            continue
+        h3 = content.find('h3')
+        sqft = stories = None
+        for p in content.find_all('p'):
+            text = p.get_text(" ", strip=True)
+            if 'Sq. Ft.' in text:
+                sqft = parse_utils.parse_sqft(text)
+            if 'Story' in text:
+                match = re.search(r'(\d+(\.\d+)?)\s*story', text, re.IGNORECASE)
+                stories = float(match.group(1)) if match else None
+        rows.append({"price": price, "sqft": sqft, "stories": stories, "plan_name": h3.get_text(strip=True) if h3 else "",
+                     "url": card.get('href'), "price_per_sqft": round(price / sqft, 2) if price and sqft else None})
+    return rows
+
+
+def per_page_ms(fn, markup: bytes, rounds: int) -> float:
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn(markup)
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000
+
+
+def main():
+    cards = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    specs = {spec["name"]: spec for spec in load_specs()}
+    cases = [
+        ("elevontx builder", BUILDER_CARD, legacy_builder, specs["MIHomesElevonPlanScraper"]),
+        ("DR Horton now", NOW_CARD, legacy_now, specs["DRHortonElevonNowScraper"]),
+    ]
+    print(f"{cards} cards per page, median of {rounds} rounds")
+    print(f"{'page':18} {'BeautifulSoup ms':>17} {'spec ms':>8} {'rows':>6}")
+    for name, card, legacy, spec in cases:
+        markup = page(card, cards)
+        compiled = compile_spec(spec)
+        legacy_rows, spec_rows = legacy(markup), compiled.extract(markup, spec["url"])
+        assert len(legacy_rows) == len(spec_rows) == cards
+        assert [r["price"] for r in legacy_rows] == [r["price"] for r in spec_rows]
+        print(f"{name:18} {per_page_ms(legacy, markup, rounds):17.1f} "
+              f"{per_page_ms(lambda m: compiled.extract(m, spec['url']), markup, rounds):8.1f} {len(spec_rows):6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Per-page parse time and peak memory of BeautifulSoup with html.parser, with
+lxml, and with lxml limited by a SoupStrainer (app.scrapers.html_utils.make_soup)
+on saved pages.
+
+    python -m benchmarks.bench_html_parsing [page.html ...] [--strain TAG.CLASS] [--rounds N]
+
+Defaults to pacesetter_debug.html, strained to its move-in card container.
+Peak memory is measured with tracemalloc in a separate run, so it covers the
+Python objects of the tree but not lxml's own C buffers.
+"""
+
+import argparse
+import statistics
+import time
+import tracemalloc
+
+from bs4 import BeautifulSoup, SoupStrainer
+
+from app.scrapers.html_utils import make_soup
+
+DEFAULT_PAGES = ["pacesetter_debug.html"]
+DEFAULT_STRAIN = "div.psh-cms-qmi__cards"
+
+
+def strainer_for(spec: str) -> SoupStrainer:
+    name, _, class_ = spec.partition(".")
+    return SoupStrainer(name or None, class_=class_ or None)
+
+
+def measure(parse, markup: bytes, rounds: int):
+    """Median seconds per parse, peak traced bytes of one parse, and elements built."""
+    times = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        parse(markup)
+        times.append(time.perf_counter() - start)
+    tracemalloc.start()
+    soup = parse(markup)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return statistics.median(times), peak, len(soup.find_all(True))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("pages", nargs="*", default=DEFAULT_PAGES)
+    parser.add_argument("--strain", default=DEFAULT_STRAIN, help="TAG.CLASS kept by the strainer")
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    strainer = strainer_for(args.strain)
+    parsers = {
+        "html.parser": lambda markup: BeautifulSoup(markup, "html.parser"),
+        "lxml": lambda markup: make_soup(markup),
+        f"lxml+{args.strain}": lambda markup: make_soup(markup, strainer),
+    }
+    print(f"{'page':28} {'parser':36} {'ms/page':>9} {'peak KiB':>10} {'elements':>9}")
+    for path in args.pages:
+        with open(path, "rb") as f:
+            markup = f.read()
+        for name, parse in parsers.items():
+            seconds, peak, elements = measure(parse, markup, args.rounds)
+            print(f"{path[-28:]:28} {name:36} {seconds * 1000:9.2f} {peak / 1024:10,.0f} {elements:9,}")
+
+
+if __name__ == "__main__":
+    main()
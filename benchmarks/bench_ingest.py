@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Ingest throughput of detect_and_update_changes on a fresh SQLite database:
+the first ingest, an unchanged re-ingest, and a re-ingest with 1% of the
+prices changed, for each batch size.
+
+    python -m benchmarks.bench_ingest [size ...]    (default 10000 100000 1000000)
+
+Uses a temporary database unless DATABASE_URL is set.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+if not os.environ.get("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="bench-ingest-"), "homes.db")
+
+from sqlalchemy import delete
+
+from app.db.models import Plan, PriceHistory
+from app.db.session import SessionLocal, init_db
+from app.models.record import PlanRecord
+from app.services.change_detection import detect_and_update_changes
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+COMMUNITIES = 200
+COMPANIES = 20
+
+
+def make_records(size: int, changed_every: int = 0) -> list:
+    records = []
+    for i in range(size):
+        price = 300_000 + (i % 5000) * 100
+        if changed_every and i % changed_every == 0:
+            price -= 5000
+        records.append(PlanRecord(
+            company=f"Builder {i % COMPANIES}",
+            community=f"Community {i % COMMUNITIES}",
+            type="now" if i % 2 else "plan",
+            plan_name=f"Plan {i // 2}",
+            address=f"{i} Main St" if i % 2 else "",
+            price=price,
+            sqft=1500 + i % 2000,
+            beds=float(3 + i % 3),
+            baths=2.5,
+        ))
+    return records
+
+
+def timed(db, records: list):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        counts = detect_and_update_changes(db, records)
+    return time.perf_counter() - start, counts
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    init_db()
+    print(f"{'rows':>9} {'pass':12} {'seconds':>8} {'rows/s':>10}  counts")
+    for size in sizes:
+        db = SessionLocal()
+        try:
+            db.execute(delete(PriceHistory))
+            db.execute(delete(Plan))
+            db.commit()
+            passes = [
+                ("first", make_records(size)),
+                ("unchanged", make_records(size)),
+                ("1% changed", make_records(size, changed_every=100)),
+            ]
+            for name, records in passes:
+                seconds, counts = timed(db, records)
+                print(f"{size:9,} {name:12} {seconds:8.2f} {size / seconds:10,.0f}  {counts}")
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Throughput of the shared field parsers (app.scrapers.parse_utils) against the
+per-scraper methods they replaced, which called re.search with a pattern
+string on every call. "repeated" is the sample strings 50 times over, as on a
+listing page; "distinct" gives every string its own suffix, so parse_many()
+has nothing to dedupe.
+
+The single-string parsers are meant to match the legacy throughput for price
+and sqft, not beat it: they also read "$400s"/"$450K" shorthand, ranges and the
+"sq ft" marker, which the legacy one-liners got wrong. The speedup is
+parse_many() on repeated strings.
+
+    python -m benchmarks.bench_parse_utils [rounds]
+"""
+
+import re
+import sys
+import time
+
+from app.scrapers import parse_utils
+
+SAMPLES = {
+    "price": ["$363,000", "From the $400s", "$412,990", "Starting at $389,990", "$1.2M", "$450K"],
+    "sqft": ["2,450 sq ft", "2,450 - 2,800 Sq. Ft.", "1850 sqft", "3,112 SQ FT"],
+    "beds": ["4 Beds", "3-4 Beds", "5 Bedrooms"],
+    "baths": ["2.5 Baths", "4/2", "3 Bathrooms"],
+    "stories": ["1.5 story", "2 Stories", "Single Story"],
+}
+
+
+# The removed per-class copies (most common variant of each)
+def legacy_price(text):
+    match = re.search(r'\$([\d,]+)', text)
+    return int(match.group(1).replace(",", "")) if match else None
+
+def legacy_sqft(text):
+    match = re.search(r'([\d,]+)', text)
+    return int(match.group(1).replace(",", "")) if match else None
+
+def legacy_count(text):
+    match = re.search(r'(\d+(?:\.\d+)?)', text)
+    return str(match.group(1)) if match else ""
+
+LEGACY = {"price": legacy_price, "sqft": legacy_sqft, "beds": legacy_count, "baths": legacy_count,
+          "stories": legacy_count}
+
+
+def rate(fn, texts, rounds, repeats=10):
+    """Texts per second over the best of repeats timings, which filters out scheduler noise."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(rounds // repeats):
+            fn(texts)
+        best = min(best, time.perf_counter() - start)
+    return len(texts) * (rounds // repeats) / best
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"{'field':8} {'texts':9} {'legacy/s':>12} {'parse_utils/s':>14} {'parse_many/s':>13}")
+    for field, samples in SAMPLES.items():
+        repeated = samples * 50
+        for kind, texts in (("repeated", repeated), ("distinct", [f"{t} #{i}" for i, t in enumerate(repeated)])):
+            legacy = rate(lambda ts: [LEGACY[field](t) for t in ts], texts, rounds)
+            single = rate(lambda ts: [parse_utils.FIELD_PARSERS[field](t) for t in ts], texts, rounds)
+            batch = rate(lambda ts: parse_utils.parse_many(field, ts), texts, rounds)
+            print(f"{field:8} {kind:9} {legacy:12,.0f} {single:14,.0f} {batch:13,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+/api/plans body serialization: the ORM path (Plan entities -> PlanWithChangeFlag
+-> Pydantic JSON) against listed_plans column tuples -> plans_json (orjson),
+including the query, with time and tracemalloc peak per size.
+
+    python -m benchmarks.bench_plan_serialization [size ...]    (default 10000 100000)
+
+Uses a temporary SQLite database unless DATABASE_URL is set.
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+if not os.environ.get("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="bench-serial-"), "homes.db")
+
+from pydantic import TypeAdapter
+from sqlalchemy import delete, insert
+
+from app.api.plans import listed_plans, plans_json
+from app.db.models import Plan, PriceHistory
+from app.db.session import SessionLocal, init_db
+from app.models.plan import PlanWithChangeFlag
+
+DEFAULT_SIZES = [10_000, 100_000]
+
+PLAN_LIST = TypeAdapter(list[PlanWithChangeFlag])
+
+
+def seed(db, size: int):
+    db.execute(delete(PriceHistory))
+    db.execute(delete(Plan))
+    now = datetime.utcnow()
+    db.execute(insert(Plan), [
+        {"plan_name": f"Plan {i}", "price": 300000 + i, "sqft": 1500 + i % 2000, "stories": "2",
+         "price_per_sqft": round((300000 + i) / (1500 + i % 2000), 2), "last_updated": now,
+         "company": f"Builder {i % 20}", "community": f"Community {i % 200}", "type": "now" if i % 2 else "plan",
+         "address": f"{i} Main St" if i % 2 else None, "beds": 3.0 + i % 3, "baths": 2.5}
+        for i in range(size)
+    ])
+    db.execute(insert(PriceHistory), [
+        {"plan_id": i, "old_price": 310000, "new_price": 300000 + i, "changed_at": now - timedelta(hours=1)}
+        for i in range(1, size, 50)
+    ])
+    db.commit()
+
+
+def orm_body(db) -> bytes:
+    since = datetime.utcnow() - timedelta(hours=24)
+    changed = {ph.plan_id for ph in db.query(PriceHistory).filter(PriceHistory.changed_at >= since)}
+    return PLAN_LIST.dump_json([
+        PlanWithChangeFlag(
+            plan_name=plan.plan_name, price=plan.price, sqft=plan.sqft, stories=plan.stories,
+            price_per_sqft=plan.price_per_sqft, last_updated=plan.last_updated, company=plan.company,
+            community=plan.community, type=plan.type, address=plan.address, beds=plan.beds, baths=plan.baths,
+            price_changed_recently=plan.id in changed,
+        )
+        for plan in db.query(Plan).filter(Plan.removed_at.is_(None)).order_by(Plan.id)
+    ])
+
+
+def tuple_body(db) -> bytes:
+    return plans_json(db.execute(listed_plans().order_by(Plan.id)))
+
+
+def measure(build, db):
+    db.expunge_all()
+    start = time.perf_counter()
+    body = build(db)
+    seconds = time.perf_counter() - start
+    db.expunge_all()
+    tracemalloc.start()
+    build(db)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    db.expunge_all()
+    return seconds, peak, body
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES
+    init_db()
+    print(f"{'plans':>8} {'path':16} {'seconds':>8} {'peak MiB':>9} {'body MiB':>9}")
+    for size in sizes:
+        db = SessionLocal()
+        try:
+            seed(db, size)
+            bodies = []
+            for name, build in (("ORM + Pydantic", orm_body), ("tuples + orjson", tuple_body)):
+                seconds, peak, body = measure(build, db)
+                bodies.append(body)
+                print(f"{size:8,} {name:16} {seconds:8.2f} {peak / 2**20:9.1f} {len(body) / 2**20:9.1f}")
+            print(f"{'':8} identical bodies: {bodies[0] == bodies[1]}")
+        finally:
+            db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+API-style reads while an ingest transaction writes, per SQLite pragma profile.
+Reader threads run the /api/get_plans community query in a loop while one
+writer rewrites every plan's price in a single long transaction; the read
+latency percentiles and "database is locked" errors show how much the write
+blocks the API.
+
+    python -m benchmarks.bench_sqlite_concurrency [rows] [readers]    (default 50000 4)
+"""
+
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy import create_engine, insert, text
+from sqlalchemy.exc import OperationalError
+
+from app.db.models import Base, Plan
+from app.db.session import SQLITE_PROFILES, apply_sqlite_profile, engine_options
+
+COMMUNITIES = 50
+WRITE_CHUNK = 2000
+# Pause between the writer's chunks, so the transaction stays open like a real ingest
+WRITE_PAUSE_SECONDS = 0.05
+
+READ_SQL = text(
+    "SELECT id, plan_name, price, sqft, company, type FROM plans "
+    "WHERE community = :community ORDER BY id LIMIT 50"
+)
+
+
+def seed(engine, rows: int):
+    Base.metadata.create_all(engine)
+    plans = [
+        {"plan_name": f"Plan {i}", "price": 300000 + i, "sqft": 2000, "company": f"Builder {i % 10}",
+         "community": f"Community {i % COMMUNITIES}", "type": "now" if i % 2 else "plan"}
+        for i in range(rows)
+    ]
+    with engine.begin() as conn:
+        conn.execute(insert(Plan.__table__), plans)
+
+
+def writer(engine, rows: int, done: threading.Event, result: dict):
+    start = time.perf_counter()
+    with engine.begin() as conn:
+        for low in range(0, rows, WRITE_CHUNK):
+            conn.execute(text("UPDATE plans SET price = price + 1 WHERE id > :low AND id <= :high"),
+                         {"low": low, "high": low + WRITE_CHUNK})
+            time.sleep(WRITE_PAUSE_SECONDS)
+    result["write_seconds"] = time.perf_counter() - start
+    done.set()
+
+
+def reader(engine, index: int, done: threading.Event, latencies: list, errors: list):
+    i = index
+    while not done.is_set():
+        start = time.perf_counter()
+        try:
+            with engine.connect() as conn:
+                conn.execute(READ_SQL, {"community": f"Community {i % COMMUNITIES}"}).fetchall()
+        except OperationalError as e:
+            errors.append(str(e.orig))
+            continue
+        latencies.append(time.perf_counter() - start)
+        i += 1
+
+
+def run(profile: str, rows: int, readers: int) -> dict:
+    url = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="bench-sqlite-"), "homes.db")
+    options = engine_options(url)
+    options.update(pool_size=readers + 1, max_overflow=0)
+    engine = create_engine(url, **options)
+    apply_sqlite_profile(engine, profile)
+    seed(engine, rows)
+
+    done = threading.Event()
+    result, latencies, errors = {}, [], []
+    threads = [threading.Thread(target=reader, args=(engine, n, done, latencies, errors)) for n in range(readers)]
+    for thread in threads:
+        thread.start()
+    writer(engine, rows, done, result)
+    for thread in threads:
+        thread.join()
+    engine.dispose()
+
+    latencies.sort()
+    result.update(
+        reads=len(latencies),
+        errors=len(errors),
+        p50_ms=statistics.median(latencies) * 1000 if latencies else 0.0,
+        p99_ms=latencies[int(len(latencies) * 0.99)] * 1000 if latencies else 0.0,
+        max_ms=latencies[-1] * 1000 if latencies else 0.0,
+    )
+    return result
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    readers = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+    print(f"{rows:,} plans, {readers} readers during one write transaction")
+    print(f"{'profile':12} {'write s':>8} {'reads':>8} {'errors':>7} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for profile in SQLITE_PROFILES:
+        r = run(profile, rows, readers)
+        print(f"{profile:12} {r['write_seconds']:8.2f} {r['reads']:8,} {r['errors']:7,} "
+              f"{r['p50_ms']:8.2f} {r['p99_ms']:8.2f} {r['max_ms']:8.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+#!/usr/bin/env python3
+"""
+Script to write .br/.gz copies of the frontend build (run after copying a new
+Vite build into app/frontend_dist); the app serves them by Accept-Encoding
+"""
+
+import os
+from app.core.compression import ENCODINGS, precompress_directory
+
+def main():
+    frontend_dist = os.path.join(os.path.dirname(os.path.abspath(__file__)), "app", "frontend_dist")
+    written = precompress_directory(frontend_dist)
+    print(f"Wrote {written} precompressed files ({', '.join(ENCODINGS)}) in {frontend_dist}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Tests run against DATABASE_URL when it is set (e.g. a local Postgres) and
+otherwise against a throwaway SQLite file; either way before app.db.session
+creates its engines.
+"""
+
+import os
+import tempfile
+
+import pytest
+from sqlalchemy import delete, select
+
+if not os.environ.get("DATABASE_URL"):
+    os.environ["DATABASE_URL"] = "sqlite:///" + os.path.join(tempfile.mkdtemp(prefix="homes-test-"), "homes.db")
+os.environ.setdefault("SCHEDULER_ENABLED", "0")
+
+from app.db.models import Plan, PriceHistory
+from app.db.session import SessionLocal, init_db
+
+
+@pytest.fixture
+def community_db():
+    """
+    community_db(name) -> a session on an up-to-date schema with that
+    community's plans and their price history deleted; closed after the test.
+    """
+    sessions = []
+
+    def open_session(community: str):
+        init_db()
+        session = SessionLocal()
+        plan_ids = select(Plan.id).where(Plan.community == community)
+        session.execute(delete(PriceHistory).where(PriceHistory.plan_id.in_(plan_ids)))
+        session.execute(delete(Plan).where(Plan.community == community))
+        session.commit()
+        sessions.append(session)
+        return session
+
+    yield open_session
+    for session in sessions:
+        session.close()
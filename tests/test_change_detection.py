@@ -0,0 +1,160 @@
+"""
+Ingest upsert: new listings are inserted once, an unchanged re-ingest writes
+nothing, and a price change updates the row and records PriceHistory.
+"""
+
+import pytest
+from sqlalchemy import event, select
+
+from app.db.models import Plan, PriceHistory
+from app.models.record import PlanRecord
+from app.services.change_detection import detect_and_update_changes
+from app.services.snapshots import IN_CHUNK_SIZE
+
+COMMUNITY = "Ingest Test"
+
+# Columns that only move forward with each sighting
+_SIGHTING = ("last_seen_at",)
+
+
+def make_records(**prices) -> list:
+    records = [
+        PlanRecord(company="Acme", community=COMMUNITY, type="plan", plan_name="Aspen", price=400000, sqft=2000),
+        PlanRecord(company="Acme", community=COMMUNITY, type="plan", plan_name="Birch", price=450000, sqft=2400),
+        PlanRecord(company="Acme", community=COMMUNITY, type="now", plan_name="Aspen", address="1 Elm St",
+                   price=415000, sqft=2000),
+    ]
+    for record in records:
+        record.price = prices.get(record.address or record.plan_name, record.price)
+    return records
+
+
+@pytest.fixture
+def db(community_db):
+    return community_db(COMMUNITY)
+
+
+def counts_of(**counts) -> dict:
+    return {**dict.fromkeys(("new", "updated", "price_changes", "unchanged", "removed", "duplicates", "repeats"), 0),
+            **counts}
+
+
+def table_state(db) -> dict:
+    rows = db.execute(select(Plan.__table__).where(Plan.community == COMMUNITY)).mappings()
+    return {row["listing_key"]: {k: v for k, v in row.items() if k not in _SIGHTING} for row in rows}
+
+
+def history(db) -> list:
+    query = (
+        select(Plan.plan_name, PriceHistory.old_price, PriceHistory.new_price)
+        .join(Plan, Plan.id == PriceHistory.plan_id)
+        .where(Plan.community == COMMUNITY)
+    )
+    return [tuple(row) for row in db.execute(query)]
+
+
+def test_ingest_reingest_and_price_change(db):
+    counts = detect_and_update_changes(db, make_records())
+    assert counts == counts_of(new=3)
+    first = table_state(db)
+    assert len(first) == 3
+    assert all(row["first_price"] == row["price"] for row in first.values())
+
+    # Same data again: nothing but last_seen_at is written
+    counts = detect_and_update_changes(db, make_records())
+    assert counts == counts_of(unchanged=3)
+    assert table_state(db) == first
+    assert history(db) == []
+
+    counts = detect_and_update_changes(db, make_records(Birch=439000))
+    assert counts == counts_of(updated=1, price_changes=1, unchanged=2)
+    state = table_state(db)
+    birch = state["acme|ingest test|plan|birch"]
+    assert birch["price"] == 439000
+    assert birch["first_price"] == 450000
+    assert history(db) == [("Birch", 450000, 439000)]
+
+    # Re-ingesting the changed data is idempotent too
+    counts = detect_and_update_changes(db, make_records(Birch=439000))
+    assert counts["updated"] == counts["price_changes"] == counts["new"] == 0
+    assert table_state(db) == state
+    assert len(history(db)) == 1
+
+
+def test_missing_listing_is_removed_and_restored(db):
+    detect_and_update_changes(db, make_records())
+    aspen = "acme|ingest test|plan|aspen"
+    counts = detect_and_update_changes(db, make_records()[1:])
+    assert counts == counts_of(unchanged=2, removed=1)
+    assert table_state(db)[aspen]["removed_at"] is not None
+
+    # Already removed: a second run without it removes nothing more
+    assert detect_and_update_changes(db, make_records()[1:])["removed"] == 0
+
+    counts = detect_and_update_changes(db, make_records())
+    assert counts == counts_of(updated=1, unchanged=2)
+    assert table_state(db)[aspen]["removed_at"] is None
+
+
+def test_unscraped_group_is_not_removed(db):
+    detect_and_update_changes(db, make_records())
+    # No "now" rows at all this run: that group was not scraped, so its listing stays
+    counts = detect_and_update_changes(db, make_records()[:2])
+    assert counts["removed"] == 0
+    assert table_state(db)["acme|ingest test|now|1 elm st"]["removed_at"] is None
+
+
+def test_same_name_plans_with_different_design_numbers(db):
+    kingston = [
+        PlanRecord(company="DR Horton", community=COMMUNITY, type="plan", plan_name="Kingston",
+                   design_number="X40K", price=350990),
+        PlanRecord(company="DR Horton", community=COMMUNITY, type="plan", plan_name="Kingston",
+                   design_number="X50K", price=379990),
+    ]
+    assert detect_and_update_changes(db, kingston) == counts_of(new=2)
+    assert sorted(table_state(db)) == ["dr horton|ingest test|plan|kingston|x40k", "dr horton|ingest test|plan|kingston|x50k"]
+    assert detect_and_update_changes(db, kingston) == counts_of(unchanged=2)
+
+
+def test_move_in_homes_without_address_use_their_url(db):
+    homes = [
+        PlanRecord(company="DR Horton", community=COMMUNITY, type="now", plan_name="Kingston", price=350990 + i,
+                   url=f"https://example.com/homes/{i}")
+        for i in range(3)
+    ]
+    assert detect_and_update_changes(db, homes) == counts_of(new=3)
+    assert "dr horton|ingest test|now|https://example.com/homes/1" in table_state(db)
+
+
+def test_rows_sharing_a_key_are_counted_not_lost(db):
+    twins = [
+        PlanRecord(company="Acme", community=COMMUNITY, type="plan", plan_name="Aspen", price=400000),
+        PlanRecord(company="Acme", community=COMMUNITY, type="plan", plan_name="Aspen", price=420000),
+        PlanRecord(company="Acme", community=COMMUNITY, type="plan", plan_name="Aspen", price=420000),
+    ]
+    assert detect_and_update_changes(db, twins) == counts_of(new=2, duplicates=1, repeats=1)
+    state = table_state(db)
+    assert {key: row["price"] for key, row in state.items()} == {
+        "acme|ingest test|plan|aspen": 400000, "acme|ingest test|plan|aspen#2": 420000,
+    }
+    # The same batch again matches both rows
+    assert detect_and_update_changes(db, twins) == counts_of(unchanged=2, duplicates=1, repeats=1)
+
+
+def test_id_updates_stay_under_the_variable_limit(db):
+    plans = [PlanRecord(company="Acme", community=COMMUNITY, type="plan", plan_name=f"Plan {i}", price=400000 + i)
+             for i in range(2 * IN_CHUNK_SIZE)]
+    detect_and_update_changes(db, plans)
+    bound = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if not executemany:
+            bound.append(len(parameters))
+
+    event.listen(db.get_bind(), "before_cursor_execute", record)
+    try:
+        assert detect_and_update_changes(db, plans) == counts_of(unchanged=len(plans))
+        assert detect_and_update_changes(db, plans[:1]) == counts_of(unchanged=1, removed=len(plans) - 1)
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", record)
+    assert max(bound) <= 999
@@ -0,0 +1,103 @@
+"""
+init_db migrations on older data. _migrate_numeric_beds_baths: the SQLite path
+runs everywhere; the Postgres path needs DATABASE_URL to point at a Postgres
+database and runs in a throwaway schema there.
+"""
+
+import os
+
+import pytest
+from sqlalchemy import Float, create_engine, inspect, text
+
+from app.db.models import Base
+from app.db.session import _migrate_numeric_beds_baths, _rekey_design_numbers
+
+POSTGRES_URL = os.environ.get("DATABASE_URL", "") if os.environ.get("DATABASE_URL", "").startswith("postgres") else ""
+
+SCHEMA = "migrate_beds_baths_test"
+
+OLD_PLANS = (
+    "CREATE TABLE plans (id {id_type} PRIMARY KEY, plan_name VARCHAR, company VARCHAR, community VARCHAR, "
+    "type VARCHAR, price FLOAT, beds VARCHAR, baths VARCHAR)"
+)
+
+ROWS = [
+    {"plan_name": "Aspen", "beds": "4", "baths": "2.5"},
+    {"plan_name": "Birch", "beds": "", "baths": ""},
+    {"plan_name": "Cedar", "beds": None, "baths": "3"},
+]
+
+
+@pytest.fixture
+def sqlite_conn(tmp_path):
+    engine = create_engine("sqlite:///" + str(tmp_path / "old.db"))
+    with engine.connect() as conn:
+        conn.execute(text(OLD_PLANS.format(id_type="INTEGER")))
+        yield conn
+    engine.dispose()
+
+
+@pytest.fixture
+def postgres_conn():
+    if not POSTGRES_URL:
+        pytest.skip("DATABASE_URL is not a Postgres database")
+    engine = create_engine(POSTGRES_URL)
+    with engine.connect() as conn:
+        conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+        conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+        conn.execute(text(f"SET search_path TO {SCHEMA}"))
+        conn.execute(text(OLD_PLANS.format(id_type="SERIAL")))
+        try:
+            yield conn
+        finally:
+            conn.rollback()
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+            conn.commit()
+    engine.dispose()
+
+
+@pytest.mark.parametrize("backend", ["sqlite_conn", "postgres_conn"])
+def test_beds_baths_become_numeric(request, backend):
+    conn = request.getfixturevalue(backend)
+    conn.execute(text(
+        "INSERT INTO plans (plan_name, company, community, type, beds, baths) "
+        "VALUES (:plan_name, 'Acme', 'Elevon', 'plan', :beds, :baths)"
+    ), ROWS)
+    conn.commit()
+
+    _migrate_numeric_beds_baths(conn)
+
+    columns = {c["name"]: c["type"] for c in inspect(conn).get_columns("plans")}
+    assert isinstance(columns["beds"], Float)
+    assert isinstance(columns["baths"], Float)
+    rows = conn.execute(text("SELECT plan_name, beds, baths FROM plans ORDER BY plan_name")).all()
+    assert [tuple(row) for row in rows] == [("Aspen", 4.0, 2.5), ("Birch", None, None), ("Cedar", None, 3.0)]
+
+    # Already numeric: a second run is a no-op
+    _migrate_numeric_beds_baths(conn)
+    assert conn.execute(text("SELECT count(*) FROM plans")).scalar() == len(ROWS)
+
+
+def test_plan_keys_gain_design_numbers(tmp_path):
+    engine = create_engine("sqlite:///" + str(tmp_path / "keys.db"))
+    Base.metadata.create_all(engine)
+    with engine.connect() as conn:
+        conn.execute(text(
+            "INSERT INTO plans (plan_name, company, community, type, design_number, listing_key) VALUES "
+            "('Kingston', 'DR Horton', 'Reunion', 'plan', 'X40K', 'dr horton|reunion|plan|kingston'), "
+            "('Aspen', 'Acme', 'Reunion', 'plan', '', 'acme|reunion|plan|aspen')"
+        ))
+        conn.execute(text("INSERT INTO scrape_runs (id) VALUES (1)"))
+        conn.execute(text(
+            "INSERT INTO price_snapshots (run_id, listing_key, price, captured_at) "
+            "VALUES (1, 'dr horton|reunion|plan|kingston', 350990, CURRENT_TIMESTAMP)"
+        ))
+        conn.commit()
+
+        _rekey_design_numbers(conn)
+        _rekey_design_numbers(conn)
+
+        keys = sorted(conn.execute(text("SELECT listing_key FROM plans")).scalars())
+        assert keys == ["acme|reunion|plan|aspen", "dr horton|reunion|plan|kingston|x40k"]
+        assert conn.execute(text("SELECT listing_key FROM price_snapshots")).scalar() == "dr horton|reunion|plan|kingston|x40k"
+    engine.dispose()
@@ -0,0 +1,31 @@
+import pytest
+from fastapi import HTTPException
+
+from app.api.pagination import decode_cursor, encode_cursor
+from app.db.models import Plan
+
+PRICE_ORDER = [(Plan.price, True), (Plan.id, True)]
+
+
+@pytest.mark.parametrize("values", [[412990.0, 7], [412990, 7]])
+def test_cursor_round_trip(values):
+    assert decode_cursor(encode_cursor(values), PRICE_ORDER) == values
+
+
+@pytest.mark.parametrize("values", [
+    [{"a": 1}, 7],
+    [[1], 7],
+    [True, 7],
+    ["412990", 7],
+    [412990.0, 7.5],
+    [412990.0],
+])
+def test_cursor_rejects_wrong_types(values):
+    with pytest.raises(HTTPException) as raised:
+        decode_cursor(encode_cursor(values), PRICE_ORDER)
+    assert raised.value.status_code == 400
+
+
+def test_cursor_rejects_garbage():
+    with pytest.raises(HTTPException):
+        decode_cursor("@@not-base64@@", PRICE_ORDER)
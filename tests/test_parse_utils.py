@@ -0,0 +1,98 @@
+import pytest
+
+from app.scrapers import parse_utils
+from app.scrapers.base import BaseScraper
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("$363,000", 363000),
+    ("$363s", 363000),
+    ("From the $400s", 400000),
+    ("$400s", 400000),
+    ("$350,000s", 350000),
+    ("$450K", 450000),
+    ("$1.2M", 1200000),
+    ("$85/mo", 85),
+    ("HOA $85/mo", 85),
+    ("$400s - $500s", 400000),
+    ("4 Beds", None),
+    ("3 Car Garage", None),
+    ("1.5 story", None),
+    ("363,000", None),
+    ("", None),
+    (None, None),
+])
+def test_parse_price(text, expected):
+    assert parse_utils.parse_price(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("363,000", 363000),
+    ("$389,990", 389990),
+    ("4 Beds", 4),
+    ("Call for pricing", None),
+])
+def test_parse_price_bare(text, expected):
+    assert parse_utils.parse_price(text, bare=True) == expected
+
+
+def test_scraper_default_requires_dollar():
+    class Scraper(BaseScraper):
+        def fetch_plans(self):
+            return []
+
+    scraper = Scraper()
+    assert [scraper.parse_price(t) for t in ("4 Beds", "2,450 Sq Ft", "Starting at $412,990")] == [None, None, 412990]
+
+
+def test_parse_price_range():
+    assert parse_utils.parse_price_range("$400s - $500s") == (400000, 500000)
+    assert parse_utils.parse_price_range("$412,990") == (412990, 412990)
+    assert parse_utils.parse_price_range("4 Beds") == (None, None)
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2,450 sq ft", (2450, 2450)),
+    ("2,450 - 2,800 Sq. Ft.", (2450, 2800)),
+    ("1850 sqft", (1850, 1850)),
+    ("", (None, None)),
+])
+def test_parse_sqft_range(text, expected):
+    assert parse_utils.parse_sqft_range(text) == expected
+
+
+def test_counts_and_stories():
+    assert parse_utils.parse_beds("3-4 Beds") == "3"
+    assert parse_utils.parse_baths("2.5 Baths") == "2.5"
+    assert parse_utils.parse_stories("1.5 story") == "1.5"
+    assert parse_utils.parse_stories("Single Story") == "1"
+    assert parse_utils.parse_stories("", default="1") == "1"
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("4/1", "4.5"),
+    ("3 / 1 Baths", "3.5"),
+    ("4/2", "5"),
+    ("2/0", "2"),
+    ("2.5 Baths", "2.5"),
+    ("2 1/2 Baths", "2"),
+    ("3 Bathrooms", "3"),
+    ("", ""),
+])
+def test_parse_baths(text, expected):
+    assert parse_utils.parse_baths(text) == expected
+
+
+def test_batch_apis():
+    assert parse_utils.parse_many("price", ["$400s", "4 Beds", "$1.2M"]) == [400000, None, 1200000]
+    texts = ["4/1", "2.5 Baths", None, "4/1", 2.0, 2, ""]
+    assert parse_utils.parse_many("baths", texts) == [parse_utils.parse_baths(t) for t in texts]
+    assert parse_utils.parse_many("beds", iter(["3 Beds", "3 Beds"])) == ["3", "3"]
+    rows = parse_utils.normalize_listings([
+        {"price": "$363s", "sqft": "2,450 sq ft", "plan_name": "Aspen"},
+        {"price": "$363s", "baths": "3/1", "plan_name": "Birch"},
+    ])
+    assert rows == [
+        {"price": 363000, "sqft": 2450, "plan_name": "Aspen"},
+        {"price": 363000, "baths": "3.5", "plan_name": "Birch"},
+    ]
@@ -0,0 +1,77 @@
+"""
+Scrape pipeline: staged scrapers are parsed in worker processes that exit with
+the run, the pool is no larger than the number of staged scrapers, and a dead
+worker fails only its own scrapers.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+from app.scrapers import pipeline
+from app.scrapers.base import BaseScraper, Page, StagedScraper
+
+
+class PageScraper(StagedScraper):
+    """Parses each page body as a plan name and reports the parsing process."""
+
+    def __init__(self, *names: str):
+        self.names = names
+
+    def fetch_pages(self) -> List[Page]:
+        return [(f"https://example.com/{name}", name) for name in self.names]
+
+    def parse_pages(self, pages: List[Page]) -> List[Dict]:
+        return [{"company": "Acme", "community": "Elevon", "plan_name": body, "design_number": str(os.getpid())}
+                for _, body in pages]
+
+
+class CrashingScraper(PageScraper):
+    def parse_pages(self, pages: List[Page]) -> List[Dict]:
+        os._exit(1)
+
+
+class InlineScraper(BaseScraper):
+    def fetch_plans(self) -> List[Dict]:
+        return [{"company": "Acme", "community": "Elevon", "plan_name": "Inline"}]
+
+
+def worker_pids(results) -> set:
+    return {record.design_number for _, records in results for record in records or []}
+
+
+def test_pool_lives_for_one_run():
+    results = pipeline.run_scrapers([PageScraper("Aspen", "Birch"), InlineScraper()], workers=1)
+    assert [[r.plan_name for r in records] for _, records in results] == [["Aspen", "Birch"], ["Inline"]]
+    assert str(os.getpid()) not in worker_pids(results)
+    assert not multiprocessing.active_children()
+
+
+def test_pool_capped_at_staged_scrapers(monkeypatch):
+    sizes = []
+
+    def pool(max_workers, **kwargs):
+        sizes.append(max_workers)
+        return ProcessPoolExecutor(max_workers=max_workers, **kwargs)
+
+    monkeypatch.setattr(pipeline, "ProcessPoolExecutor", pool)
+    results = pipeline.run_scrapers([PageScraper("Aspen"), InlineScraper(), PageScraper("Birch")], workers=8)
+    assert sizes == [2]
+    assert [[r.plan_name for r in records] for _, records in results] == [["Aspen"], ["Inline"], ["Birch"]]
+    pipeline.run_scrapers([InlineScraper()], workers=8)
+    assert sizes == [2]
+
+
+def test_inline_parsing_without_workers():
+    results = pipeline.run_scrapers([PageScraper("Aspen")], workers=0)
+    assert worker_pids(results) == {str(os.getpid())}
+
+
+def test_dead_worker_fails_its_scraper():
+    results = pipeline.run_scrapers([CrashingScraper("Aspen"), InlineScraper()], workers=1)
+    assert results[0][1] is None
+    assert [r.plan_name for r in results[1][1]] == ["Inline"]
+    assert not multiprocessing.active_children()
+    results = pipeline.run_scrapers([PageScraper("Birch")], workers=1)
+    assert [r.plan_name for r in results[0][1]] == ["Birch"]
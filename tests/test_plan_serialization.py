@@ -0,0 +1,94 @@
+"""
+plans_json must produce the same bytes as the ORM path it replaced: Plan
+entities turned into PlanWithChangeFlag models and dumped by Pydantic.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from pydantic import TypeAdapter
+from sqlalchemy import insert, select, text
+
+from app.api.plans import listed_plans, plans_json
+from app.db.models import Plan, PriceHistory
+from app.models.plan import PlanWithChangeFlag
+
+COMMUNITY = "Serialization Test"
+
+PLAN_LIST = TypeAdapter(list[PlanWithChangeFlag])
+
+NOW = datetime(2026, 10, 19, 2, 47, 41, 123456)
+
+PLANS = [
+    dict(plan_name="Aspen", price=400000, sqft=2000, stories="2", price_per_sqft=200.0, last_updated=NOW,
+         company="Acme", type="plan", beds=4, baths=2.5),
+    # Whole-second timestamp, missing optionals, fractional price
+    dict(plan_name="Birch", price=389990.5, sqft=None, stories=None, price_per_sqft=None,
+         last_updated=NOW.replace(microsecond=0), company="Acme", type="plan", beds=None, baths=None),
+    dict(plan_name="Cedar", price=415000.0, sqft=2150, stories="1.5", price_per_sqft=193.02, last_updated=NOW,
+         company="Acme", type="now", address="1 Elm St", beds=3.0, baths=2),
+]
+
+
+@pytest.fixture
+def db(community_db):
+    session = community_db(COMMUNITY)
+    session.execute(insert(Plan), [{**plan, "community": COMMUNITY} for plan in PLANS])
+    cedar = session.execute(select(Plan.id).where(Plan.community == COMMUNITY, Plan.plan_name == "Cedar")).scalar()
+    session.execute(insert(PriceHistory), [
+        {"plan_id": cedar, "old_price": 420000, "new_price": 415000, "changed_at": datetime.utcnow() - timedelta(hours=1)},
+    ])
+    session.commit()
+    return session
+
+
+def orm_json(db, recent_hours: float = 24) -> bytes:
+    """The serialization plans_json replaced: ORM entities -> PlanWithChangeFlag -> Pydantic JSON."""
+    since = datetime.utcnow() - timedelta(hours=recent_hours)
+    changed = {ph.plan_id for ph in db.query(PriceHistory).filter(PriceHistory.changed_at >= since)}
+    plans = db.query(Plan).filter(Plan.community == COMMUNITY, Plan.removed_at.is_(None)).order_by(Plan.id)
+    return PLAN_LIST.dump_json([
+        PlanWithChangeFlag(
+            plan_name=plan.plan_name,
+            price=plan.price,
+            sqft=plan.sqft,
+            stories=plan.stories,
+            price_per_sqft=plan.price_per_sqft,
+            last_updated=plan.last_updated,
+            company=plan.company,
+            community=plan.community,
+            type=plan.type,
+            address=plan.address,
+            beds=plan.beds,
+            baths=plan.baths,
+            price_changed_recently=plan.id in changed,
+        )
+        for plan in plans
+    ])
+
+
+def tuple_json(db, recent_hours: float = 24) -> bytes:
+    return plans_json(db.execute(listed_plans(recent_hours).where(Plan.community == COMMUNITY).order_by(Plan.id)))
+
+
+def test_plans_json_matches_orm_output(db):
+    assert tuple_json(db) == orm_json(db)
+
+
+def test_plans_json_matches_orm_output_after_mistyped_writes(db):
+    # Integers written to the float columns and whole floats written to sqft come
+    # back in the column's type (SQLite column affinity), so the bytes still match
+    db.execute(text(
+        "UPDATE plans SET price = 400000, beds = 4, price_per_sqft = 200, sqft = 2000.0 "
+        "WHERE community = :community AND plan_name = 'Aspen'"
+    ), {"community": COMMUNITY})
+    db.commit()
+    body = tuple_json(db)
+    assert b'"price":400000.0,"sqft":2000,' in body
+    assert body == orm_json(db)
+
+
+def test_change_flag_window(db):
+    assert b'"price_changed_recently":true' in tuple_json(db)
+    assert b'"price_changed_recently":true' not in tuple_json(db, recent_hours=0.5)
+    assert tuple_json(db, recent_hours=0.5) == orm_json(db, recent_hours=0.5)
@@ -0,0 +1,93 @@
+"""
+EXPLAIN QUERY PLAN regression checks: every hot API/ingest query must be
+served by its index, never by a full table scan.
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import select, text
+
+from app.api.plans import listed_plans
+from app.db.models import Plan, PlanStats, PriceHistory, PriceSnapshot
+from app.db.session import engine, init_db
+
+pytestmark = pytest.mark.skipif(engine.dialect.name != "sqlite", reason="EXPLAIN QUERY PLAN is SQLite syntax")
+
+
+@pytest.fixture(scope="module", autouse=True)
+def schema():
+    init_db()
+
+
+def query_plan(statement) -> str:
+    sql = str(statement.compile(engine, compile_kwargs={"literal_binds": True}))
+    with engine.connect() as conn:
+        return "\n".join(row[-1] for row in conn.execute(text("EXPLAIN QUERY PLAN " + sql)))
+
+
+def plans_page(*criteria, order=Plan.id):
+    return listed_plans().where(*criteria).order_by(order).limit(50)
+
+
+HOT_QUERIES = {
+    "get_plans by community": (
+        plans_page(Plan.community == "Elevon"),
+        ("ix_plans_community_id", "ix_plans_community_type_company"),
+    ),
+    "get_plans by several communities": (
+        plans_page(Plan.community.in_(["Elevon", "Maddox"])),
+        ("ix_plans_community_id", "ix_plans_community_type_company"),
+    ),
+    "get_plans by company": (
+        plans_page(Plan.company == "HighlandHomes"),
+        ("ix_plans_company_id", "ix_plans_company_type"),
+    ),
+    "get_plans by community, type and company": (
+        plans_page(Plan.community == "Elevon", Plan.type == "now", Plan.company == "HighlandHomes"),
+        ("ix_plans_community_type_company",),
+    ),
+    "get_plans sorted by price": (
+        plans_page(Plan.price.is_not(None), order=Plan.price.desc()),
+        ("ix_plans_price",),
+    ),
+    "get_plans price range": (
+        plans_page(Plan.price >= 300000, Plan.price <= 310000, order=Plan.price),
+        ("ix_plans_price",),
+    ),
+    "price_changed_recently probe": (
+        listed_plans(24).limit(50),
+        ("ix_price_history_plan_id_changed_at",),
+    ),
+    "recent price changes": (
+        select(PriceHistory.plan_id).where(PriceHistory.changed_at >= datetime(2024, 1, 1)),
+        ("ix_price_history_changed_at_plan_id",),
+    ),
+    "ingest scope read": (
+        select(Plan.id, Plan.listing_key).where(Plan.community.in_(["Elevon", "Maddox"])),
+        ("ix_plans_community_id", "ix_plans_community_type_company"),
+    ),
+    "listing history": (
+        select(PriceSnapshot).where(PriceSnapshot.listing_key == "k").order_by(PriceSnapshot.captured_at),
+        ("ix_price_snapshots_listing_key_captured_at",),
+    ),
+    "snapshots between": (
+        select(PriceSnapshot).where(PriceSnapshot.captured_at >= datetime(2024, 1, 1)),
+        ("ix_price_snapshots_captured_at",),
+    ),
+    "stats lookup": (
+        select(PlanStats).where(PlanStats.scope == "community", PlanStats.community == "Elevon"),
+        ("ix_plan_stats_group",),
+    ),
+    "days on market": (
+        select(Plan.id).where(Plan.type == "now", Plan.removed_at.is_(None), Plan.first_seen_at.is_not(None)),
+        ("ix_plans_type_removed_at_first_seen_at",),
+    ),
+}
+
+
+@pytest.mark.parametrize("name", HOT_QUERIES)
+def test_hot_query_uses_index(name):
+    statement, indexes = HOT_QUERIES[name]
+    plan = query_plan(statement)
+    assert any(f"INDEX {index}" in plan for index in indexes), f"{name} does not use {indexes}:\n{plan}"
@@ -0,0 +1,80 @@
+"""
+SQLite pragma profiles: a fresh connection from the app's engines (sync and
+async) runs in WAL mode with a busy timeout under the "performance" profile.
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.core import config
+from app.db.session import (
+    SQLALCHEMY_DATABASE_URL, SQLITE_PROFILES, apply_sqlite_profile, async_url, engine, engine_options,
+)
+
+pytestmark = pytest.mark.skipif(engine.dialect.name != "sqlite", reason="SQLite pragma profiles")
+
+PRAGMAS = ("journal_mode", "busy_timeout", "synchronous")
+
+# PRAGMA synchronous reports a number
+SYNCHRONOUS = {"OFF": 0, "NORMAL": 1, "FULL": 2, "EXTRA": 3}
+
+
+def read_pragmas(conn) -> dict:
+    return {name: conn.execute(text(f"PRAGMA {name}")).scalar() for name in PRAGMAS}
+
+
+def sqlite_url(tmp_path) -> str:
+    return "sqlite:///" + str(tmp_path / "profile.db")
+
+
+def test_app_engine_uses_configured_profile():
+    if config.SQLITE_PROFILE != "performance":
+        pytest.skip(f"SQLITE_PROFILE={config.SQLITE_PROFILE}")
+    # A new engine, so the connection is fresh rather than one the pool kept
+    fresh = create_engine(SQLALCHEMY_DATABASE_URL, **engine_options(SQLALCHEMY_DATABASE_URL))
+    apply_sqlite_profile(fresh)
+    try:
+        with fresh.connect() as conn:
+            assert read_pragmas(conn) == {"journal_mode": "wal", "busy_timeout": 5000, "synchronous": 1}
+    finally:
+        fresh.dispose()
+
+
+def test_async_engine_uses_profile(tmp_path):
+    url = sqlite_url(tmp_path)
+
+    async def pragmas():
+        async_engine = create_async_engine(async_url(url), **engine_options(url, asyncio=True))
+        apply_sqlite_profile(async_engine.sync_engine, "performance")
+        try:
+            async with async_engine.connect() as conn:
+                return await conn.run_sync(read_pragmas)
+        finally:
+            await async_engine.dispose()
+
+    assert asyncio.run(pragmas()) == {"journal_mode": "wal", "busy_timeout": 5000, "synchronous": 1}
+
+
+@pytest.mark.parametrize("profile", list(SQLITE_PROFILES))
+def test_profile_pragmas(tmp_path, profile):
+    expected = SQLITE_PROFILES[profile]
+    fresh = create_engine(sqlite_url(tmp_path), **engine_options(sqlite_url(tmp_path)))
+    apply_sqlite_profile(fresh, profile)
+    try:
+        with fresh.connect() as conn:
+            pragmas = read_pragmas(conn)
+    finally:
+        fresh.dispose()
+    assert pragmas["journal_mode"] == expected.get("journal_mode", "delete").lower()
+    if "busy_timeout" in expected:  # otherwise the driver's default (sqlite3 timeout=5.0)
+        assert pragmas["busy_timeout"] == expected["busy_timeout"]
+    assert pragmas["synchronous"] == SYNCHRONOUS[expected.get("synchronous", "FULL")]
+
+
+def test_unknown_profile_is_rejected(tmp_path):
+    fresh = create_engine(sqlite_url(tmp_path))
+    with pytest.raises(ValueError, match="SQLITE_PROFILE"):
+        apply_sqlite_profile(fresh, "fastest")